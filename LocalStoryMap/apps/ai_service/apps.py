@@ -5,3 +5,6 @@ class AiServiceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.ai_service"
     verbose_name = "AI Service"
+
+    def ready(self):
+        from . import checks  # noqa: F401
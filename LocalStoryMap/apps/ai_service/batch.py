@@ -0,0 +1,214 @@
+# apps/ai_service/batch.py
+import logging
+import threading
+import time
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.marker.cache import MarkerDetailCache
+from apps.marker.models import Marker
+
+from .cache import SummaryCache
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    스레드 간 공유하는 토큰 버킷 (초당 rate 개 충전, 최대 capacity 개까지 몰아서 사용)
+    Clova 호출 전에 acquire() 로 토큰을 받아 분당 호출 한도를 넘지 않도록 합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SummaryBatchCheckpoint:
+    """
+    summarize_markers 재시작 지점 (캐시에 저장)
+
+    동시에 처리하므로 완료 순서가 pk 순서와 다릅니다. 그래서 "이 pk 이하는 모두 끝남" 이라고 말할 수 있는
+    가장 큰 pk(low-watermark)만 저장하고, 재시작하면 그 다음 pk 부터 다시 훑습니다.
+    """
+
+    KEY = "ai:summarize_markers:checkpoint"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: list = []  # 제출 순서(= pk 오름차순)대로의 pk
+        self._finished: set = set()
+        self.watermark = 0
+
+    @classmethod
+    def load(cls) -> int:
+        return cache.get(cls.KEY) or 0
+
+    @classmethod
+    def clear(cls) -> None:
+        cache.delete(cls.KEY)
+
+    def submitted(self, pk: int) -> None:
+        with self._lock:
+            self._pending.append(pk)
+
+    def finished(self, pk: int) -> None:
+        with self._lock:
+            self._finished.add(pk)
+            advanced = False
+            while self._pending and self._pending[0] in self._finished:
+                self.watermark = self._pending.pop(0)
+                self._finished.discard(self.watermark)
+                advanced = True
+        if advanced:
+            cache.set(self.KEY, self.watermark, timeout=None)
+
+
+class MarkerSummaryBatch:
+    """
+    요약이 없거나, 요약을 만든 뒤 설명이 바뀐 마커를 찾아 요약합니다.
+    요약 캐시(SummaryCache)를 거치므로 같은 설명은 한 번만 Clova 를 호출합니다.
+    """
+
+    SCAN_CHUNK_SIZE = 500
+
+    def __init__(self, client, bucket: Optional[TokenBucket] = None):
+        self.client = client
+        self.bucket = bucket
+        self._lock = threading.Lock()
+        self.stats = {
+            "done": 0,
+            "failed": 0,
+            "cache_hits": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+
+    @staticmethod
+    def _scan(queryset, fields: tuple, after_pk: int = 0) -> Iterator[list]:
+        # 처리하는 동안 커서를 열어두지 않도록 pk 기준으로 끊어서 읽음
+        while True:
+            rows: list[dict] = list(
+                queryset.filter(pk__gt=after_pk)
+                .exclude(description__isnull=True)
+                .exclude(description="")
+                .order_by("pk")
+                .values("pk", "description", *fields)[
+                    : MarkerSummaryBatch.SCAN_CHUNK_SIZE
+                ]
+            )
+            if not rows:
+                return
+            yield rows
+            after_pk = rows[-1]["pk"]
+
+    @staticmethod
+    def iter_stale(after_pk: int = 0) -> Iterator[dict]:
+        # pk 오름차순으로 요약이 필요한 마커를 돌려줌 (해시는 파이썬에서 계산)
+        # 해시가 비어 있는 기존 요약은 어떤 설명으로 만들었는지 모를 뿐 낡았다고 볼 수 없으므로 대상에서 제외
+        # (backfill_source_hashes 로 현재 설명의 해시를 채운 뒤부터 설명 변경을 감지)
+        fields = ("summary_text", "summary_source_hash")
+        for rows in MarkerSummaryBatch._scan(Marker.objects.all(), fields, after_pk):
+            for row in rows:
+                key = SummaryCache.make_key(row["description"])
+                if not row["summary_text"] or row["summary_source_hash"] not in (
+                    "",
+                    key,
+                ):
+                    row["key"] = key
+                    yield row
+
+    @staticmethod
+    def legacy_summaries():
+        # 요약은 있지만 요약을 만든 설명의 해시가 없는 마커 (해시 컬럼 추가 전에 만든 요약)
+        return (
+            Marker.objects.filter(summary_source_hash="")
+            .exclude(summary_text__isnull=True)
+            .exclude(summary_text="")
+        )
+
+    @staticmethod
+    def backfill_source_hashes() -> int:
+        """
+        기존 요약의 summary_source_hash 를 현재 설명 기준으로 채웁니다. (Clova 를 호출하지 않음)
+        이후 설명이 바뀐 마커만 다시 요약 대상이 됩니다. 반환: 채운 마커 수
+        """
+        filled = 0
+        for rows in MarkerSummaryBatch._scan(MarkerSummaryBatch.legacy_summaries(), ()):
+            markers = [
+                Marker(
+                    pk=row["pk"],
+                    summary_source_hash=SummaryCache.make_key(row["description"]),
+                )
+                for row in rows
+            ]
+            Marker.objects.bulk_update(markers, ["summary_source_hash"])
+            filled += len(markers)
+        return filled
+
+    def _record(self, **counts) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                self.stats[name] += value
+
+    def _summarize(self, text: str) -> str:
+        # 캐시 미스일 때만 호출됨 → 토큰 버킷으로 호출 속도 제한 후 사용량 집계
+        if self.bucket is not None:
+            self.bucket.acquire()
+        summary, usage = self.client.summarize_text_with_usage(text)
+        self._record(
+            input_tokens=usage["input_tokens"], output_tokens=usage["output_tokens"]
+        )
+        return summary
+
+    def process(self, row: dict) -> bool:
+        called = []
+
+        def summarize(text):
+            called.append(True)
+            return self._summarize(text)
+
+        try:
+            summary = SummaryCache.get_or_summarize(row["description"], summarize)
+        except Exception:
+            # 실패한 마커는 다음 전체 실행에서 다시 대상이 됨
+            logger.exception("마커 요약 실패: marker=%s", row["pk"])
+            self._record(failed=1)
+            return False
+
+        # 처리 중에 설명이 바뀌었으면 덮어쓰지 않음 (다음 실행에서 다시 대상이 됨)
+        updated = Marker.objects.filter(
+            pk=row["pk"], description=row["description"]
+        ).update(summary_text=summary, summary_source_hash=row["key"])
+        if updated:
+            # update() 는 post_save 를 보내지 않으므로 상세 캐시를 직접 무효화
+            MarkerDetailCache.invalidate(row["pk"])
+        self._record(done=1, cache_hits=0 if called else 1)
+        return True
+
+    def estimated_cost(self) -> float:
+        # 1,000 토큰당 단가(원) 기준 추정 비용
+        price = settings.CLOVA_PRICE_PER_1K_TOKENS
+        return (
+            self.stats["input_tokens"] * price["input"]
+            + self.stats["output_tokens"] * price["output"]
+        ) / 1000
@@ -0,0 +1,215 @@
+# apps/ai_service/cache.py
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import CachedSummary
+from .utils.clova_client import ClovaClient
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """
+    Clova 요약 결과 캐시 (내용 주소 방식)
+
+    · 키: SHA-256(프롬프트 버전 + 시스템 프롬프트 + 입력 텍스트) → 같은 텍스트면 마커/원문 구분 없이 재사용,
+      설명이 바뀌거나 프롬프트가 바뀌면 자연스럽게 다른 키가 됨
+    · Redis(기본 캐시)에서 먼저 찾고, 없으면 DB(CachedSummary)에서 찾아 Redis 를 다시 채움
+    · 같은 키의 동시 요청은 락을 잡은 요청 하나만 Clova 를 호출하고 나머지는 결과를 기다림
+    · 캐시(Redis) 장애 시에는 DB 만 사용하고 병합 없이 바로 호출
+    """
+
+    KEY_PREFIX = "ai:summary"
+    WAIT_INTERVAL = 0.1  # 다른 요청의 Clova 호출을 기다리며 결과를 확인하는 간격(초)
+
+    @staticmethod
+    def prompt_version() -> str:
+        return ClovaClient.SUMMARIZE_PROMPT_VERSION
+
+    @classmethod
+    def make_key(cls, text: str) -> str:
+        material = "\n".join(
+            [cls.prompt_version(), ClovaClient.SYSTEM_PROMPT_SUMMARIZE, text]
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _cache_key(cls, key: str) -> str:
+        return f"{cls.KEY_PREFIX}:{key}"
+
+    @staticmethod
+    def _cache_call(func: Callable, *args, **kwargs):
+        # Redis 장애가 요약 기능 전체 장애로 번지지 않도록 캐시 오류는 로그만 남김
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.warning("요약 캐시 접근 실패: %s", e)
+            return None
+
+    @staticmethod
+    async def _acache_call(func: Callable, *args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            logger.warning("요약 캐시 접근 실패: %s", e)
+            return None
+
+    @classmethod
+    def get(cls, key: str) -> Optional[str]:
+        summary = cls._cache_call(cache.get, cls._cache_key(key))
+        if summary is not None:
+            return summary
+
+        summary = (
+            CachedSummary.objects.filter(key=key)
+            .values_list("summary", flat=True)
+            .first()
+        )
+        if summary is not None:
+            cls._cache_call(
+                cache.set,
+                cls._cache_key(key),
+                summary,
+                timeout=settings.AI_SUMMARY_CACHE_TTL,
+            )
+        return summary
+
+    @classmethod
+    def set(cls, key: str, summary: str) -> None:
+        CachedSummary.objects.update_or_create(
+            key=key,
+            defaults={"summary": summary, "prompt_version": cls.prompt_version()},
+        )
+        cls._cache_call(
+            cache.set,
+            cls._cache_key(key),
+            summary,
+            timeout=settings.AI_SUMMARY_CACHE_TTL,
+        )
+
+    @classmethod
+    def get_or_summarize(cls, text: str, summarize: Callable[[str], str]) -> str:
+        """
+        캐시된 요약을 반환하고, 없으면 summarize(text) 로 만들어 저장합니다.
+        같은 텍스트를 동시에 요청하면 한 요청만 summarize 를 호출합니다.
+        """
+        key = cls.make_key(text)
+        summary = cls.get(key)
+        if summary is not None:
+            return summary
+
+        lock_key = f"{cls._cache_key(key)}:lock"
+        lock_timeout = settings.AI_SUMMARY_LOCK_TIMEOUT
+        deadline = time.monotonic() + lock_timeout
+        while True:
+            acquired = cls._cache_call(cache.add, lock_key, 1, timeout=lock_timeout)
+            if acquired or acquired is None:
+                # 락을 잡았거나(None: 캐시 장애) 직접 호출
+                try:
+                    # 락을 잡기 직전에 다른 요청이 저장했을 수 있음
+                    summary = cls.get(key)
+                    if summary is None:
+                        summary = summarize(text)
+                        cls.set(key, summary)
+                    return summary
+                finally:
+                    if acquired:
+                        cls._cache_call(cache.delete, lock_key)
+
+            # 다른 요청이 같은 텍스트를 요약 중: 결과가 저장될 때까지 대기
+            while time.monotonic() < deadline:
+                time.sleep(cls.WAIT_INTERVAL)
+                summary = cls._cache_call(cache.get, cls._cache_key(key))
+                if summary is not None:
+                    return summary
+                if not cls._cache_call(cache.get, lock_key):
+                    # 먼저 호출한 요청이 실패하고 락을 풀었으면 다시 락을 잡아 직접 호출
+                    break
+            else:
+                # 기다리는 시간이 락 유지 시간을 넘으면 병합 없이 직접 호출
+                summary = summarize(text)
+                cls.set(key, summary)
+                return summary
+
+    # ─── 비동기 버전 (async 뷰에서 사용, 동작은 위와 같음) ───
+
+    @classmethod
+    async def aget(cls, key: str) -> Optional[str]:
+        summary = await cls._acache_call(cache.aget, cls._cache_key(key))
+        if summary is not None:
+            return summary
+
+        summary = (
+            await CachedSummary.objects.filter(key=key)
+            .values_list("summary", flat=True)
+            .afirst()
+        )
+        if summary is not None:
+            await cls._acache_call(
+                cache.aset,
+                cls._cache_key(key),
+                summary,
+                timeout=settings.AI_SUMMARY_CACHE_TTL,
+            )
+        return summary
+
+    @classmethod
+    async def aset(cls, key: str, summary: str) -> None:
+        await CachedSummary.objects.aupdate_or_create(
+            key=key,
+            defaults={"summary": summary, "prompt_version": cls.prompt_version()},
+        )
+        await cls._acache_call(
+            cache.aset,
+            cls._cache_key(key),
+            summary,
+            timeout=settings.AI_SUMMARY_CACHE_TTL,
+        )
+
+    @classmethod
+    async def aget_or_summarize(
+        cls, text: str, summarize: Callable[[str], Awaitable[str]]
+    ) -> str:
+        """
+        get_or_summarize 의 비동기 버전. summarize 는 코루틴 함수(예: ClovaClient.asummarize_text)
+        """
+        key = cls.make_key(text)
+        summary = await cls.aget(key)
+        if summary is not None:
+            return summary
+
+        lock_key = f"{cls._cache_key(key)}:lock"
+        lock_timeout = settings.AI_SUMMARY_LOCK_TIMEOUT
+        deadline = time.monotonic() + lock_timeout
+        while True:
+            acquired = await cls._acache_call(
+                cache.aadd, lock_key, 1, timeout=lock_timeout
+            )
+            if acquired or acquired is None:
+                try:
+                    summary = await cls.aget(key)
+                    if summary is None:
+                        summary = await summarize(text)
+                        await cls.aset(key, summary)
+                    return summary
+                finally:
+                    if acquired:
+                        await cls._acache_call(cache.adelete, lock_key)
+
+            while time.monotonic() < deadline:
+                await asyncio.sleep(cls.WAIT_INTERVAL)
+                summary = await cls._acache_call(cache.aget, cls._cache_key(key))
+                if summary is not None:
+                    return summary
+                if not await cls._acache_call(cache.aget, lock_key):
+                    break
+            else:
+                summary = await summarize(text)
+                await cls.aset(key, summary)
+                return summary
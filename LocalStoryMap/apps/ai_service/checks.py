@@ -0,0 +1,12 @@
+from django.core import checks
+
+from .utils.clova_client import ClovaClient
+
+
+@checks.register(checks.Tags.compatibility, deploy=True)
+def check_clova_config(app_configs, **kwargs):
+    # 클라이언트는 첫 사용 시 만들어지므로, 배포 전(check --deploy)에 설정 누락을 미리 알림
+    error = ClovaClient.config_error()
+    if error:
+        return [checks.Warning(error, id="ai_service.W001")]
+    return []
@@ -0,0 +1,160 @@
+import threading
+import time
+import uuid
+from collections import defaultdict
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+from config.http import HttpClient, metrics
+from config.stub_server import JsonStubHandler, run_stub_server, unused_port
+
+
+class _FlakyHandler(JsonStubHandler):
+    """
+    경로별로 정해진 횟수만큼 실패한 뒤 성공하는 가짜 외부 API
+      /flaky/<key>?fail=N    처음 N 번은 503, 그 뒤 200
+      /limited/<key>?fail=N  처음 N 번은 429 + Retry-After: 1, 그 뒤 200
+      /slow?delay=S          S 초 뒤 200
+      /ok                    바로 200
+    """
+
+    hits: dict = defaultdict(int)
+    lock = threading.Lock()
+
+    def _handle(self):
+        self.read_json()
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        with self.lock:
+            self.hits[url.path] += 1
+            hit = self.hits[url.path]
+
+        if url.path.startswith("/flaky/") and hit <= int(query.get("fail", 0)):
+            return self.send_json(503, {"error": "unavailable", "hit": hit})
+        if url.path.startswith("/limited/") and hit <= int(query.get("fail", 0)):
+            return self.send_json(
+                429, {"error": "rate limited", "hit": hit}, {"Retry-After": "1"}
+            )
+        if url.path == "/slow":
+            time.sleep(float(query.get("delay", 1)))
+        self.send_json(200, {"ok": True, "hit": hit})
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 스텁 서버로 공용 HTTP 클라이언트(config.http)의 재시도/타임아웃/keep-alive/지표 기록을 확인합니다. "
+        "외부 API 를 호출하지 않으며, 기대와 다르면 실패 코드로 끝납니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--read-timeout", type=float, default=0.5, help="타임아웃 시나리오의 읽기 타임아웃(초)"
+        )
+
+    def handle(self, *args, **options):
+        read_timeout = options["read_timeout"]
+        # 서킷 브레이커/지표가 실제 연동과 섞이지 않도록 실행마다 새 연동 이름 사용
+        integration = f"stub-{uuid.uuid4().hex[:8]}"
+        client = HttpClient(integration)
+        retries = client.retries
+        failures = []
+
+        def check(name: str, ok: bool, detail: str) -> None:
+            self.stdout.write(f"{'OK  ' if ok else 'FAIL'} {name}: {detail}")
+            if not ok:
+                failures.append(name)
+
+        with run_stub_server(_FlakyHandler) as server:
+            base = server.url
+
+            # 멱등 호출(GET)은 5xx 를 재시도해서 성공
+            resp = client.get(f"{base}/flaky/get?fail={retries}")
+            check(
+                "GET 5xx 재시도",
+                resp.status_code == 200 and resp.json()["hit"] == retries + 1,
+                f"status={resp.status_code}, 서버 수신 {resp.json()['hit']}회",
+            )
+
+            # POST 는 재시도하지 않고 첫 응답을 그대로 돌려줌
+            resp = client.post(f"{base}/flaky/post?fail=1", json={})
+            check(
+                "POST 재시도 안 함",
+                resp.status_code == 503 and _FlakyHandler.hits["/flaky/post"] == 1,
+                f"status={resp.status_code}, 서버 수신 {_FlakyHandler.hits['/flaky/post']}회",
+            )
+
+            # idempotent=True 로 명시한 POST 는 재시도
+            resp = client.post(
+                f"{base}/flaky/post-idem?fail=1", json={}, idempotent=True
+            )
+            check(
+                "POST idempotent=True 재시도",
+                resp.status_code == 200,
+                f"status={resp.status_code}, 서버 수신 {resp.json()['hit']}회",
+            )
+
+            # 429 는 Retry-After 만큼(최대 backoff_max) 기다렸다가 재시도
+            started = time.monotonic()
+            resp = client.get(f"{base}/limited/get?fail=1")
+            waited = time.monotonic() - started
+            check(
+                "429 Retry-After 준수",
+                resp.status_code == 200 and waited >= min(1.0, client.backoff_max),
+                f"status={resp.status_code}, {waited:.2f}s 대기",
+            )
+
+            # 읽기 타임아웃은 재시도 후 requests.Timeout 으로 실패
+            started = time.monotonic()
+            try:
+                client.get(
+                    f"{base}/slow?delay={read_timeout * 4}", timeout=(1, read_timeout)
+                )
+            except requests.Timeout:
+                elapsed = time.monotonic() - started
+                check(
+                    "읽기 타임아웃",
+                    elapsed < (read_timeout + client.backoff_max) * (retries + 1),
+                    f"{retries + 1}회 시도 후 Timeout, {elapsed:.2f}s",
+                )
+            else:
+                check("읽기 타임아웃", False, "Timeout 이 발생하지 않음")
+
+            # 세션을 공유하므로 연속 호출은 연결 하나를 재사용
+            connections = server.connections
+            for _ in range(20):
+                client.get(f"{base}/ok")
+            reused = server.connections - connections
+            check("keep-alive 재사용", reused <= 1, f"호출 20회, 새 연결 {reused}개")
+
+        # 아무도 듣지 않는 포트로의 연결 오류도 재시도한 뒤 실패
+        try:
+            client.get(f"http://127.0.0.1:{unused_port()}/", timeout=(0.5, 0.5))
+        except requests.ConnectionError:
+            check("연결 오류", True, "ConnectionError")
+        else:
+            check("연결 오류", False, "ConnectionError 가 발생하지 않음")
+
+        stats = metrics.snapshot()[integration]
+        self.stdout.write(
+            f"지표 ({integration}): 호출 {stats['calls']} / 오류 {stats['errors']} / "
+            f"재시도 {stats['retries']} / 평균 {stats['avg_ms']:.0f}ms / "
+            f"최대 {stats['max_ms']:.0f}ms / 서킷 {stats['breaker']}"
+        )
+        # 시나리오 6개 + keep-alive 20회, 오류는 POST 503/타임아웃/연결 오류
+        # 재시도는 GET 5xx(retries) + idempotent POST 1 + 429 1 + 타임아웃/연결 오류(각 retries)
+        check(
+            "지표 기록",
+            stats["calls"] == 26
+            and stats["errors"] == 3
+            and stats["retries"] == retries * 3 + 2,
+            f"호출 {stats['calls']} / 오류 {stats['errors']} / 재시도 {stats['retries']}",
+        )
+
+        if failures:
+            raise CommandError(f"확인 실패: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("공용 HTTP 클라이언트 확인 완료"))
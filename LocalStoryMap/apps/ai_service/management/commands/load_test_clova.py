@@ -0,0 +1,100 @@
+import asyncio
+import copy
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient, override_settings
+
+from apps.ai_service.utils.clova_client import get_clova_client
+from apps.ai_service.utils.fake_clova import fake_clova_handler
+from config.stub_server import run_stub_server
+
+
+class Command(BaseCommand):
+    help = (
+        "응답이 느린 가짜 Clova 를 상대로 워커 하나의 동시 처리량을 비교합니다. "
+        "sync: 요청마다 워커 스레드를 잡는 동기 호출 (이전 ChatAPIView), "
+        "async: 이벤트 루프 하나에서 처리하는 비동기 ChatAPIView (POST /api/ai/chat/)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="모드별 동시 요청 수")
+        parser.add_argument(
+            "--delay", type=float, default=1.0, help="가짜 Clova 응답 지연(초)"
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=min(32, (os.cpu_count() or 1) + 4),
+            help="sync 모드 워커 스레드 수 (기본: ASGI 가 동기 뷰에 쓰는 기본 스레드 풀 크기)",
+        )
+
+    def handle(self, *args, **options):
+        total, threads = options["requests"], options["threads"]
+        # 동시 호출 상한(벌크헤드)이 비교를 가리지 않도록 두 모드 모두 요청 수만큼 허용
+        outbound = copy.deepcopy(settings.OUTBOUND_HTTP)
+        outbound["clova"].update(
+            max_concurrent=total, async_max_connections=total, pool_size=total
+        )
+        messages = [{"role": "user", "content": "부산 1박 2일 코스 추천해줘"}]
+        # 개발 설정(DEBUG)에서만 붙는 debug toolbar 는 요청을 직렬화하므로 운영과 같은 미들웨어로 측정
+        middleware = [
+            m for m in settings.MIDDLEWARE if not m.startswith("debug_toolbar")
+        ]
+
+        self.stdout.write(
+            f"{'mode':>6} {'ok':>5} {'failed':>6} {'elapsed_s':>10} {'req/s':>8} {'peak':>6}"
+        )
+        for mode in ("sync", "async"):
+            handler = fake_clova_handler(delay=options["delay"])
+            with run_stub_server(handler) as server, override_settings(
+                OUTBOUND_HTTP=outbound,
+                MIDDLEWARE=middleware,
+                CLOVA_CHAT_COMPLETIONS_URL=f"{server.url}/testapp/v1/chat-completions/load",
+            ):
+                started = time.monotonic()
+                if mode == "sync":
+                    ok = self._run_sync(total, threads, messages)
+                else:
+                    ok = asyncio.run(self._run_async(total, messages))
+                elapsed = time.monotonic() - started
+            self.stdout.write(
+                f"{mode:>6} {ok:>5} {total - ok:>6} {elapsed:>10.2f} "
+                f"{ok / elapsed:>8.1f} {handler.stats.peak_in_flight:>6}"
+            )
+        self.stdout.write(
+            "peak: 가짜 Clova 가 동시에 처리한 최대 요청 수 "
+            f"(sync 는 워커 스레드 {threads}개로 제한, async 는 요청 수까지)"
+        )
+
+    @staticmethod
+    def _run_sync(total: int, threads: int, messages: list) -> int:
+        client = get_clova_client()
+
+        def call(_):
+            try:
+                client.chat(messages)
+                return True
+            except Exception:
+                return False
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return sum(executor.map(call, range(total)))
+
+    @staticmethod
+    async def _run_async(total: int, messages: list) -> int:
+        client = AsyncClient()
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    "/api/ai/chat/",
+                    {"messages": messages},
+                    content_type="application/json",
+                )
+                for _ in range(total)
+            )
+        )
+        return sum(response.status_code == 200 for response in responses)
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.ai_service.utils.fake_clova import fake_clova_handler
+from config.stub_server import run_stub_server
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 테스트용 가짜 Clova Studio API 를 띄웁니다. 다른 터미널에서 "
+        "CLOVA_STUDIO_BASE_URL=http://127.0.0.1:<포트>/testapp/v1 로 summarize_markers 나 서버를 실행하면 "
+        "실제 Clova 비용 없이 동시 호출 수/분당 호출 한도/체크포인트 재개를 확인할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--port", type=int, default=8089)
+        parser.add_argument("--delay", type=float, default=0.5, help="응답 지연(초)")
+        parser.add_argument(
+            "--fail-every", type=int, default=0, help="N 번째 요청마다 500 응답 (0 이면 실패 없음)"
+        )
+        parser.add_argument(
+            "--duration", type=int, default=0, help="이 시간(초) 뒤 종료 (0 이면 Ctrl+C 까지)"
+        )
+        parser.add_argument(
+            "--report-interval", type=int, default=10, help="집계 출력 간격(초)"
+        )
+
+    def handle(self, *args, **options):
+        handler = fake_clova_handler(options["delay"], options["fail_every"])
+        with run_stub_server(handler, options["port"]) as server:
+            self.stdout.write(
+                f"가짜 Clova API: CLOVA_STUDIO_BASE_URL={server.url}/testapp/v1"
+            )
+            started = time.monotonic()
+            try:
+                while (
+                    not options["duration"]
+                    or time.monotonic() - started < options["duration"]
+                ):
+                    time.sleep(options["report_interval"])
+                    self.stdout.write(handler.stats.summary())
+            except KeyboardInterrupt:
+                pass
+        self.stdout.write(self.style.SUCCESS(f"종료: {handler.stats.summary()}"))
@@ -0,0 +1,110 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.ai_service.batch import (
+    MarkerSummaryBatch,
+    SummaryBatchCheckpoint,
+    TokenBucket,
+)
+from apps.ai_service.utils.clova_client import get_clova_client
+
+
+class Command(BaseCommand):
+    help = "요약문이 없거나 설명이 바뀐 마커를 Clova 로 일괄 요약합니다. (중단 지점부터 재개)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.CLOVA_BATCH_CONCURRENCY,
+            help="동시 Clova 호출 수",
+        )
+        parser.add_argument(
+            "--rate-per-minute",
+            type=float,
+            default=settings.CLOVA_BATCH_RATE_PER_MINUTE,
+            help="분당 최대 Clova 호출 수 (토큰 버킷)",
+        )
+        parser.add_argument(
+            "--burst",
+            type=int,
+            default=None,
+            help="한 번에 몰아서 호출할 수 있는 최대 수 (기본: 동시 호출 수)",
+        )
+        parser.add_argument("--limit", type=int, default=None, help="최대 처리 마커 수")
+        parser.add_argument(
+            "--restart", action="store_true", help="체크포인트를 무시하고 처음부터 훑기"
+        )
+        parser.add_argument("--dry-run", action="store_true", help="대상 수만 집계")
+
+    def handle(self, *args, **options):
+        if options["restart"]:
+            SummaryBatchCheckpoint.clear()
+        start_after = SummaryBatchCheckpoint.load()
+        if start_after:
+            self.stdout.write(f"체크포인트에서 재개: pk > {start_after}")
+
+        rows = MarkerSummaryBatch.iter_stale(after_pk=start_after)
+        if options["limit"]:
+            rows = islice(rows, options["limit"])
+
+        if options["dry_run"]:
+            legacy = MarkerSummaryBatch.legacy_summaries().count()
+            total = sum(1 for _ in rows)
+            self.stdout.write(
+                self.style.WARNING(
+                    f"[dry-run] 요약 대상 마커: {total}개 / 해시를 채울 기존 요약: {legacy}개"
+                )
+            )
+            return
+
+        # 해시 없는 기존 요약은 다시 요약하지 않고 현재 설명의 해시만 채움 (첫 실행에서 한 번만 해당)
+        if filled := MarkerSummaryBatch.backfill_source_hashes():
+            self.stdout.write(f"기존 요약 해시 채움: {filled}개")
+
+        concurrency = options["concurrency"]
+        bucket = TokenBucket(
+            rate=options["rate_per_minute"] / 60,
+            capacity=options["burst"] or concurrency,
+        )
+        batch = MarkerSummaryBatch(get_clova_client(), bucket)
+        checkpoint = SummaryBatchCheckpoint()
+        started = time.monotonic()
+
+        def process(row):
+            try:
+                return batch.process(row)
+            finally:
+                checkpoint.finished(row["pk"])
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # 대기 중인 작업 수를 제한하려고 동시 호출 수의 몇 배씩만 제출
+            while chunk := list(islice(rows, concurrency * 4)):
+                for row in chunk:
+                    checkpoint.submitted(row["pk"])
+                list(executor.map(process, chunk))
+                self._report(batch, started, checkpoint.watermark)
+
+        # 끝까지 처리했으면 다음 실행은 처음부터 (요약이 필요한 마커만 다시 골라냄)
+        if not options["limit"]:
+            SummaryBatchCheckpoint.clear()
+        self.stdout.write(self.style.SUCCESS("완료: " + self._summary(batch, started)))
+
+    def _summary(self, batch, started) -> str:
+        stats = batch.stats
+        elapsed = time.monotonic() - started
+        rate = stats["done"] / elapsed * 60 if elapsed else 0
+        return (
+            f"요약 {stats['done']}개 (캐시 재사용 {stats['cache_hits']}) / 실패 {stats['failed']}개 / "
+            f"{rate:.1f}개/분 / 토큰 입력 {stats['input_tokens']} 출력 {stats['output_tokens']} / "
+            f"추정 비용 {batch.estimated_cost():,.1f}원"
+        )
+
+    def _report(self, batch, started, watermark) -> None:
+        self.stdout.write(f"진행: {self._summary(batch, started)} / 체크포인트 pk {watermark}")
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-19 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai_service", "0002_delete_location"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CachedSummary",
+            fields=[
+                (
+                    "key",
+                    models.CharField(
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="캐시 키(SHA-256)",
+                    ),
+                ),
+                (
+                    "prompt_version",
+                    models.CharField(max_length=50, verbose_name="프롬프트 버전"),
+                ),
+                ("summary", models.TextField(verbose_name="요약문")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+            ],
+            options={
+                "db_table": "ai_cached_summaries",
+            },
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 5.2.1 on 2026-10-19 15:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai_service", "0003_cachedsummary"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChatSession",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "summary",
+                    models.TextField(blank=True, default="", verbose_name="이전 대화 요약"),
+                ),
+                (
+                    "summary_until_turn_id",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="요약에 포함된 마지막 턴 ID"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chat_sessions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "ai_chat_sessions",
+                "ordering": ["-updated_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ChatTurn",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[("user", "사용자"), ("assistant", "챗봇")], max_length=10
+                    ),
+                ),
+                ("content", models.TextField()),
+                (
+                    "token_count",
+                    models.PositiveIntegerField(default=0, verbose_name="토큰 수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="turns",
+                        to="ai_service.chatsession",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "ai_chat_turns",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["session", "id"], name="ai_chat_turns_session_idx"
+                    )
+                ],
+            },
+        ),
+    ]
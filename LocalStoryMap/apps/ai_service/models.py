@@ -1,14 +1,86 @@
-# from django.db import models
-#
-#
-# class Location(models.Model):
-#     name = models.CharField(max_length=200)
-#     # 여행지 상세 설명 원문. 이미 백엔드 팀원이 채워서 DB에 저장되어 있음.
-#     detail_text = models.TextField()
-#     # (선택) 요약문을 캐싱하려면 아래 필드를 추가할 수 있음
-#     summary_text = models.TextField(blank=True, null=True)
-#     created_at = models.DateTimeField(auto_now_add=True)
-#     updated_at = models.DateTimeField(auto_now=True)
-#
-#     def __str__(self):
-#         return self.name
+from django.conf import settings
+from django.db import models
+
+
+class CachedSummary(models.Model):
+    """
+    Clova 요약 결과 영구 캐시 (Redis 캐시가 비었을 때의 fallback)
+    key 는 프롬프트 버전 + 입력 텍스트의 SHA-256 (apps.ai_service.cache.SummaryCache 참고)
+    """
+
+    key = models.CharField(
+        max_length=64,
+        primary_key=True,
+        verbose_name="캐시 키(SHA-256)",
+    )
+    prompt_version = models.CharField(
+        max_length=50,
+        verbose_name="프롬프트 버전",
+    )
+    summary = models.TextField(verbose_name="요약문")
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성일시",
+    )
+
+    class Meta:
+        db_table = "ai_cached_summaries"
+
+    def __str__(self):
+        return f"{self.prompt_version}:{self.key[:12]}"
+
+
+class ChatSession(models.Model):
+    """
+    챗봇 대화 세션 (대화 내용은 서버에 저장하고 클라이언트는 새 메시지만 전송)
+
+    summary 는 summary_until_turn_id 이하 턴들을 Clova 로 요약한 누적 요약문이며,
+    Clova 에는 요약문 + 토큰 예산 안의 최근 턴만 보냅니다 (apps.ai_service.services.ChatSessionService).
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="chat_sessions",
+    )
+    summary = models.TextField(blank=True, default="", verbose_name="이전 대화 요약")
+    summary_until_turn_id = models.PositiveBigIntegerField(
+        default=0, verbose_name="요약에 포함된 마지막 턴 ID"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
+
+    class Meta:
+        db_table = "ai_chat_sessions"
+        ordering = ["-updated_at"]
+
+    def __str__(self):
+        return f"ChatSession({self.pk}) by {self.user_id}"
+
+
+class ChatTurn(models.Model):
+    ROLE_CHOICES = [
+        ("user", "사용자"),
+        ("assistant", "챗봇"),
+    ]
+
+    session = models.ForeignKey(
+        ChatSession,
+        on_delete=models.CASCADE,
+        related_name="turns",
+    )
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    content = models.TextField()
+    token_count = models.PositiveIntegerField(default=0, verbose_name="토큰 수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+
+    class Meta:
+        db_table = "ai_chat_turns"
+        ordering = ["id"]
+        indexes = [
+            # 세션별 최근 턴 조회 (session_id = ? AND id > ? ORDER BY id DESC)
+            models.Index(fields=["session", "id"], name="ai_chat_turns_session_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.role}: {self.content[:20]}"
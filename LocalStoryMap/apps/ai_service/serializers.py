@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from .models import ChatSession, ChatTurn
+
 
 class SummarizeRequestSerializer(serializers.Serializer):
     """
@@ -29,3 +31,25 @@ class ChatRequestSerializer(serializers.Serializer):
         child=serializers.DictField(child=serializers.CharField()),
         help_text="Clova Chat API 형식에 맞춰진 메시지 리스트",
     )
+
+
+class ChatTurnSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ChatTurn
+        fields = ["id", "role", "content", "created_at"]
+
+
+class ChatSessionSerializer(serializers.ModelSerializer):
+    turns = ChatTurnSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = ChatSession
+        fields = ["id", "created_at", "updated_at", "turns"]
+
+
+class ChatSessionMessageSerializer(serializers.Serializer):
+    """
+    챗봇 세션 대화 요청 시: 새 메시지 하나만 전달 (이전 대화는 서버에 저장된 세션에서 구성)
+    """
+
+    message = serializers.CharField(max_length=2000, help_text="사용자가 보낸 새 메시지")
@@ -0,0 +1,164 @@
+import logging
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum
+
+from config import background
+
+from .models import ChatSession, ChatTurn
+from .utils.clova_client import get_clova_client
+
+logger = logging.getLogger(__name__)
+
+
+class ChatSessionService:
+    """
+    챗봇 세션 대화 관리
+
+    · Clova 에는 [시스템 룰 + 이전 대화 요약] + 토큰 예산(AI_CHAT_CONTEXT_TOKENS) 안의 최근 턴 + 새 메시지만 전송
+      → 대화가 길어져도 요청 크기/지연 시간이 일정 수준 이상 늘지 않음
+    · 요약되지 않은 턴이 예산을 넘으면 백그라운드에서 오래된 턴을 누적 요약(summary)으로 접고,
+      최근 턴은 예산의 절반만 남김 (매 턴마다 요약 호출이 일어나지 않도록)
+    """
+
+    # 토큰 수 추정: Clova(HCX) 토크나이저 기준 한국어는 대략 1~2 글자당 1토큰 → 넉넉하게 1.5 글자로 계산
+    CHARS_PER_TOKEN = 1.5
+    # 요약 전에 예산 계산을 위해 한 번에 읽는 최근 턴 수 상한
+    MAX_CONTEXT_TURNS = 50
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return max(1, math.ceil(len(text) / ChatSessionService.CHARS_PER_TOKEN))
+
+    @staticmethod
+    def _fold_lock_key(session_id: int) -> str:
+        return f"ai:chat_session:fold:{session_id}"
+
+    @staticmethod
+    def _unsummarized(session: ChatSession):
+        return ChatTurn.objects.filter(
+            session_id=session.pk, pk__gt=session.summary_until_turn_id
+        )
+
+    @staticmethod
+    def build_context(session: ChatSession) -> tuple[str, list[dict]]:
+        """
+        (시스템 룰에 덧붙일 요약문, 예산 안의 최근 턴 메시지 목록) 을 반환합니다.
+        요약으로 아직 접히지 않았지만 예산을 넘는 오래된 턴은 이번 요청에서 제외됩니다.
+        """
+        context = ""
+        budget = settings.AI_CHAT_CONTEXT_TOKENS
+        if session.summary:
+            context = f"[이전 대화 요약]\n{session.summary}"
+            budget -= ChatSessionService.estimate_tokens(context)
+
+        recent = []
+        turns = (
+            ChatSessionService._unsummarized(session)
+            .order_by("-pk")
+            .values("role", "content", "token_count")[
+                : ChatSessionService.MAX_CONTEXT_TURNS
+            ]
+        )
+        for turn in turns:
+            budget -= turn["token_count"]
+            if budget < 0:
+                break
+            recent.append({"role": turn["role"], "content": turn["content"]})
+        recent.reverse()
+        # 예산 때문에 assistant 턴부터 시작하면 어색하므로 user 턴부터 시작
+        while recent and recent[0]["role"] != "user":
+            recent.pop(0)
+        return context, recent
+
+    @staticmethod
+    def record_exchange(
+        session: ChatSession, message: str, reply: str, usage: dict
+    ) -> None:
+        ChatTurn.objects.bulk_create(
+            [
+                ChatTurn(
+                    session=session,
+                    role="user",
+                    content=message,
+                    token_count=ChatSessionService.estimate_tokens(message),
+                ),
+                ChatTurn(
+                    session=session,
+                    role="assistant",
+                    content=reply,
+                    token_count=usage.get("output_tokens")
+                    or ChatSessionService.estimate_tokens(reply),
+                ),
+            ]
+        )
+        session.save(update_fields=["updated_at"])
+
+        pending = ChatSessionService._unsummarized(session).aggregate(
+            total=Sum("token_count")
+        )["total"]
+        if (pending or 0) > settings.AI_CHAT_CONTEXT_TOKENS:
+            ChatSessionService.schedule_fold(session.pk)
+
+    @staticmethod
+    def schedule_fold(session_id: int) -> None:
+        # 같은 세션의 요약 작업은 하나만 (Clova 호출이 끝날 때까지 잠금)
+        if cache.add(
+            ChatSessionService._fold_lock_key(session_id),
+            1,
+            timeout=settings.AI_SUMMARY_LOCK_TIMEOUT,
+        ):
+            background.submit_on_commit(ChatSessionService.fold_older_turns, session_id)
+
+    @staticmethod
+    def fold_older_turns(session_id: int) -> bool:
+        """
+        최근 턴을 예산의 절반만 남기고, 그보다 오래된 턴을 기존 요약과 합쳐 다시 요약합니다. (백그라운드 실행)
+        """
+        try:
+            session = ChatSession.objects.filter(pk=session_id).first()
+            if session is None:
+                return False
+
+            turns = list(
+                ChatSessionService._unsummarized(session)
+                .order_by("pk")
+                .values("pk", "role", "content", "token_count")
+            )
+            keep_budget = settings.AI_CHAT_CONTEXT_TOKENS // 2
+            split = len(turns)
+            while split > 0 and turns[split - 1]["token_count"] <= keep_budget:
+                keep_budget -= turns[split - 1]["token_count"]
+                split -= 1
+            # 남기는 최근 턴이 user 턴부터 시작하도록 경계를 맞춤
+            while split < len(turns) and turns[split]["role"] != "user":
+                split += 1
+            older = turns[:split]
+            if not older:
+                return False
+
+            lines = [f"[이전 요약]\n{session.summary}"] if session.summary else []
+            lines.append("[새 대화]")
+            lines += [
+                f"{'사용자' if t['role'] == 'user' else '챗봇'}: {t['content']}"
+                for t in older
+            ]
+            summary = get_clova_client().summarize_conversation(
+                "\n".join(lines), max_tokens=settings.AI_CHAT_SUMMARY_MAX_TOKENS
+            )
+
+            # 그 사이 다른 작업이 요약을 갱신했으면 덮어쓰지 않음
+            return bool(
+                ChatSession.objects.filter(
+                    pk=session_id,
+                    summary_until_turn_id=session.summary_until_turn_id,
+                ).update(summary=summary, summary_until_turn_id=older[-1]["pk"])
+            )
+        except Exception as e:
+            # 요약에 실패해도 대화는 계속됨 (다음 턴에서 다시 시도)
+            logger.warning("챗봇 세션 요약 실패: session=%s (%s)", session_id, e)
+            return False
+        finally:
+            cache.delete(ChatSessionService._fold_lock_key(session_id))
@@ -1,3 +1,138 @@
-from django.test import TestCase
+import io
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+from apps.marker.models import Marker
+from config.stub_server import run_stub_server
+
+from .batch import SummaryBatchCheckpoint
+from .cache import SummaryCache
+from .utils.clova_client import ClovaClient
+from .utils.fake_clova import fake_clova_handler
+
+
+class SummaryBatchCheckpointTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_watermark_waits_for_earlier_rows(self):
+        checkpoint = SummaryBatchCheckpoint()
+        for pk in (3, 5, 8):
+            checkpoint.submitted(pk)
+
+        # 뒤쪽 pk 가 먼저 끝나도 앞쪽이 끝날 때까지 체크포인트는 그대로
+        checkpoint.finished(5)
+        self.assertEqual(checkpoint.watermark, 0)
+        self.assertEqual(SummaryBatchCheckpoint.load(), 0)
+
+        checkpoint.finished(3)
+        self.assertEqual(checkpoint.watermark, 5)
+        self.assertEqual(SummaryBatchCheckpoint.load(), 5)
+
+        checkpoint.finished(8)
+        self.assertEqual(SummaryBatchCheckpoint.load(), 8)
+
+
+class SummarizeMarkersCommandTests(TransactionTestCase):
+    """
+    가짜 Clova 서버를 띄우고 summarize_markers 를 실행해서 확인합니다.
+    (작업 스레드에서 DB 를 쓰므로 TransactionTestCase)
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.handler = fake_clova_handler()
+        server = self.enterContext(run_stub_server(self.handler))
+        self.enterContext(
+            override_settings(
+                CLOVA_API_KEY="test",
+                CLOVA_CHAT_COMPLETIONS_URL=f"{server.url}/testapp/v1/chat-completions/test",
+            )
+        )
+
+    @staticmethod
+    def _marker(description: str, **fields) -> Marker:
+        return Marker.objects.create(
+            marker_name="마커",
+            latitude="37.5",
+            longitude="127.0",
+            description=description,
+            **fields,
+        )
+
+    def _run(self, *args) -> str:
+        out = io.StringIO()
+        call_command(
+            "summarize_markers",
+            "--concurrency=1",
+            "--rate-per-minute=6000",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_same_description_calls_clova_once(self):
+        markers = [self._marker("같은 설명"), self._marker("같은 설명"), self._marker("다른 설명")]
+
+        output = self._run()
+
+        self.assertEqual(self.handler.stats.requests, 2)
+        self.assertIn("요약 3개 (캐시 재사용 1)", output)
+        for marker in markers:
+            marker.refresh_from_db()
+            self.assertTrue(marker.summary_text.startswith("[fake clova]"))
+            self.assertEqual(
+                marker.summary_source_hash, SummaryCache.make_key(marker.description)
+            )
+        # 끝까지 처리했으면 체크포인트를 지움
+        self.assertEqual(SummaryBatchCheckpoint.load(), 0)
+
+    def test_limit_leaves_checkpoint_and_next_run_resumes(self):
+        first, second, third = (self._marker(f"설명 {i}") for i in range(3))
+
+        self._run("--limit=2")
+        self.assertEqual(SummaryBatchCheckpoint.load(), second.pk)
+        self.assertEqual(self.handler.stats.requests, 2)
+
+        # 체크포인트 앞쪽 마커의 설명이 바뀌어도 재개한 실행에서는 건너뜀
+        Marker.objects.filter(pk=first.pk).update(description="바뀐 설명 0")
+        output = self._run()
+        self.assertIn(f"체크포인트에서 재개: pk > {second.pk}", output)
+        self.assertEqual(self.handler.stats.requests, 3)
+        third.refresh_from_db()
+        self.assertTrue(third.summary_text)
+        self.assertEqual(SummaryBatchCheckpoint.load(), 0)
+
+        # 체크포인트가 지워졌으므로 다음 실행은 처음부터 훑어서 바뀐 마커를 다시 요약
+        self._run()
+        self.assertEqual(self.handler.stats.requests, 4)
+        first.refresh_from_db()
+        self.assertEqual(first.summary_source_hash, SummaryCache.make_key("바뀐 설명 0"))
+
+    def test_description_changed_while_summarizing_is_not_overwritten(self):
+        marker = self._marker("원래 설명")
+        summarize = ClovaClient.summarize_text_with_usage
+
+        def edit_then_summarize(client, text, *args, **kwargs):
+            # Clova 응답을 기다리는 사이에 사용자가 설명을 고친 상황
+            Marker.objects.filter(pk=marker.pk).update(description="고친 설명")
+            return summarize(client, text, *args, **kwargs)
+
+        with mock.patch.object(
+            ClovaClient, "summarize_text_with_usage", edit_then_summarize
+        ):
+            self._run()
+
+        marker.refresh_from_db()
+        self.assertIsNone(marker.summary_text)
+        self.assertEqual(marker.summary_source_hash, "")
+        # 원래 설명의 요약은 캐시에 남고, 고친 설명은 다음 실행에서 요약됨
+        self.assertIsNotNone(SummaryCache.get(SummaryCache.make_key("원래 설명")))
+
+        self._run()
+        marker.refresh_from_db()
+        self.assertEqual(marker.summary_source_hash, SummaryCache.make_key("고친 설명"))
+        self.assertEqual(self.handler.stats.requests, 2)
@@ -1,8 +1,31 @@
 from django.urls import path
 
-from .views import ChatAPIView, SummarizeAPIView
+from .views import (
+    ChatAPIView,
+    ChatSessionCreateAPIView,
+    ChatSessionDetailAPIView,
+    ChatSessionMessageAPIView,
+    ChatStreamAPIView,
+    SummarizeAPIView,
+)
 
 urlpatterns = [
     path("summarize/", SummarizeAPIView.as_view(), name="api-summarize"),
     path("chat/", ChatAPIView.as_view(), name="api-chat"),
+    path("chat/stream/", ChatStreamAPIView.as_view(), name="api-chat-stream"),
+    path(
+        "chat/sessions/",
+        ChatSessionCreateAPIView.as_view(),
+        name="api-chat-session-create",
+    ),
+    path(
+        "chat/sessions/<int:session_id>/",
+        ChatSessionDetailAPIView.as_view(),
+        name="api-chat-session-detail",
+    ),
+    path(
+        "chat/sessions/<int:session_id>/messages/",
+        ChatSessionMessageAPIView.as_view(),
+        name="api-chat-session-message",
+    ),
 ]
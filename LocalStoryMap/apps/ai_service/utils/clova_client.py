@@ -1,8 +1,16 @@
+import json
 import os
+import socket
+import threading
 import uuid
+from typing import Iterator
 
 import requests
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from config.http import get_async_client, get_client
 
 
 class ClovaClient:
@@ -17,12 +25,24 @@ class ClovaClient:
             settings.CLOVA_CHAT_COMPLETIONS_URL
         )  # 형식: https://.../chat-completions/{SKILL_ID}
 
-        if (
-            not self.api_key
-            or "testapp" not in self.base_url
-            and "service" not in self.base_url
-        ):
-            raise RuntimeError("Clova Studio API Key 또는 Base URL 설정을 확인하세요.")
+        error = self.config_error()
+        if error:
+            raise RuntimeError(error)
+
+    @staticmethod
+    def config_error() -> str | None:
+        """
+        Clova 설정(API Key, Base URL)이 잘못됐으면 오류 메시지, 정상이면 None
+        (클라이언트 생성, 시스템 체크, 헬스체크에서 공통 사용)
+        """
+        api_key = getattr(settings, "CLOVA_API_KEY", None)
+        base_url = getattr(settings, "CLOVA_CHAT_COMPLETIONS_URL", "") or ""
+        if not api_key or "testapp" not in base_url and "service" not in base_url:
+            return "Clova Studio API Key 또는 Base URL 설정을 확인하세요."
+        return None
+
+    # 요약 모델/프롬프트/파라미터를 바꾸면 올려서 기존 요약 캐시를 무효화 (apps.ai_service.cache)
+    SUMMARIZE_PROMPT_VERSION = "v1"
 
     # 클로바 ai 요약 기능 시스템 룰 설정
     SYSTEM_PROMPT_SUMMARIZE = (
@@ -37,6 +57,13 @@ class ClovaClient:
         "항상 공손한 어투를 유지해라."
     )
 
+    # 챗봇 세션의 오래된 대화를 누적 요약할 때 쓰는 시스템 룰 (apps.ai_service.services.ChatSessionService)
+    SYSTEM_PROMPT_CONVERSATION_SUMMARY = (
+        "너는 여행 도우미 봇과 사용자의 대화를 요약하는 봇이다."
+        "이전 요약과 새 대화를 합쳐 하나의 요약으로 다시 써라."
+        "사용자의 여행지, 일정, 선호, 이미 답한 내용처럼 이후 대화에 필요한 정보만 남기고 짧게 써라."
+    )
+
     def _default_headers(self):
         """
         공통 헤더 생성
@@ -57,7 +84,50 @@ class ClovaClient:
         주어진 긴 텍스트(text)를 간결하게 요약해서 반환.
         Clova Chat-completions API를 '요약 봇' 역할로 호출.
         """
-        payload = {
+        summary, _usage = self.summarize_text_with_usage(
+            text, max_tokens=max_tokens, temperature=temperature
+        )
+        return summary
+
+    def summarize_text_with_usage(
+        self, text: str, max_tokens: int = 512, temperature: float = 0.5
+    ) -> tuple[str, dict]:
+        """
+        summarize_text 와 같고, 비용 집계용 토큰 사용량을 함께 반환.
+        usage: {"input_tokens": int, "output_tokens": int}
+        """
+        response = get_client("clova").post(
+            self.base_url,
+            headers=self._default_headers(),
+            json=self._summarize_payload(text, max_tokens, temperature),
+        )
+        response.raise_for_status()
+        return self._parse_summary(response.json())
+
+    async def asummarize_text(
+        self, text: str, max_tokens: int = 512, temperature: float = 0.5
+    ) -> str:
+        # summarize_text 의 비동기 버전 (ASGI 이벤트 루프에서 스레드를 잡지 않음)
+        summary, _usage = await self.asummarize_text_with_usage(
+            text, max_tokens=max_tokens, temperature=temperature
+        )
+        return summary
+
+    async def asummarize_text_with_usage(
+        self, text: str, max_tokens: int = 512, temperature: float = 0.5
+    ) -> tuple[str, dict]:
+        response = await get_async_client("clova").post(
+            self.base_url,
+            headers=self._default_headers(),
+            json=self._summarize_payload(text, max_tokens, temperature),
+        )
+        response.raise_for_status()
+        return self._parse_summary(response.json())
+
+    def _summarize_payload(
+        self, text: str, max_tokens: int, temperature: float
+    ) -> dict:
+        return {
             "model": "HCX-003",
             "messages": [
                 {"role": "system", "content": self.SYSTEM_PROMPT_SUMMARIZE},
@@ -67,15 +137,8 @@ class ClovaClient:
             "temperature": temperature,
         }
 
-        response = requests.post(
-            url=self.base_url,
-            headers=self._default_headers(),
-            json=payload,
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
-
+    @staticmethod
+    def _parse_summary(data: dict) -> tuple[str, dict]:
         # Clova API가 정상 응답(20000 OK)을 주었는지 확인
         status_code = data.get("status", {}).get("code")
         if status_code != "20000":
@@ -89,31 +152,107 @@ class ClovaClient:
         except (KeyError, TypeError):
             raise ValueError("Clova 요약 API 응답 구조가 예상과 다릅니다: {}".format(data))
 
+        return summary, ClovaClient._parse_usage(data)
+
+    @staticmethod
+    def _parse_usage(data: dict) -> dict:
+        return {
+            "input_tokens": data["result"].get("inputLength") or 0,
+            "output_tokens": data["result"].get("outputLength") or 0,
+        }
+
+    def summarize_conversation(self, transcript: str, max_tokens: int = 300) -> str:
+        """
+        챗봇 대화(이전 요약 + 새 대화 내용)를 하나의 누적 요약으로 압축해서 반환.
+        """
+        response = get_client("clova").post(
+            self.base_url,
+            headers=self._default_headers(),
+            json={
+                "model": "HCX-003",
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": self.SYSTEM_PROMPT_CONVERSATION_SUMMARY,
+                    },
+                    {"role": "user", "content": transcript},
+                ],
+                "maxTokens": max_tokens,
+                "temperature": 0.3,
+            },
+        )
+        response.raise_for_status()
+        summary, _usage = self._parse_summary(response.json())
         return summary
 
-    def chat(
+    def _chat_payload(
         self,
         messages: list[dict[str, str]],
-        max_tokens: int = 512,
-        temperature: float = 0.8,
-    ) -> str:
-        payload = {
+        max_tokens: int,
+        temperature: float,
+        context: str = "",
+    ) -> dict:
+        # context: 시스템 룰 뒤에 덧붙일 내용 (예: 챗봇 세션의 이전 대화 요약)
+        system_prompt = self.SYSTEM_PROMPT_CHAT
+        if context:
+            system_prompt = f"{system_prompt}\n\n{context}"
+        return {
             "model": "HCX-003",
-            "messages": [{"role": "system", "content": self.SYSTEM_PROMPT_CHAT}]
-            + messages,
+            "messages": [{"role": "system", "content": system_prompt}] + messages,
             "maxTokens": max_tokens,
             "temperature": temperature,
         }
 
-        resp = requests.post(
-            url=self.base_url,
+    def chat(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int = 512,
+        temperature: float = 0.8,
+    ) -> str:
+        payload = self._chat_payload(messages, max_tokens, temperature)
+
+        resp = get_client("clova").post(
+            self.base_url,
             headers=self._default_headers(),
             json=payload,
-            timeout=30,
+        )
+        resp.raise_for_status()
+        return self._parse_chat(resp.json())
+
+    async def achat(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int = 512,
+        temperature: float = 0.8,
+    ) -> str:
+        # chat 의 비동기 버전 (ASGI 이벤트 루프에서 스레드를 잡지 않음)
+        reply, _usage = await self.achat_with_usage(
+            messages, max_tokens=max_tokens, temperature=temperature
+        )
+        return reply
+
+    async def achat_with_usage(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int = 512,
+        temperature: float = 0.8,
+        context: str = "",
+    ) -> tuple[str, dict]:
+        """
+        achat 과 같고, 토큰 사용량을 함께 반환.
+        usage: {"input_tokens": int, "output_tokens": int}
+        """
+        resp = await get_async_client("clova").post(
+            self.base_url,
+            headers=self._default_headers(),
+            json=self._chat_payload(messages, max_tokens, temperature, context),
         )
         resp.raise_for_status()
         data = resp.json()
+        return self._parse_chat(data), self._parse_usage(data)
 
+    @staticmethod
+    def _parse_chat(data: dict) -> str:
         if data.get("status", {}).get("code") != "20000":
             raise ValueError(f"Clova API 호출 실패: {data}")
 
@@ -121,3 +260,125 @@ class ClovaClient:
             return data["result"]["message"]["content"]
         except (KeyError, TypeError):
             raise ValueError(f"응답 형식이 예상과 다릅니다: {data}")
+
+    def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int = 512,
+        temperature: float = 0.8,
+    ) -> "ClovaChatStream":
+        """
+        chat 의 스트리밍 버전. Clova 에 스트리밍 모드(text/event-stream)로 요청하고
+        응답 헤더까지만 받은 뒤 반환합니다. 토큰은 반환된 객체를 순회하면서 받습니다.
+        """
+        payload = self._chat_payload(messages, max_tokens, temperature)
+        headers = self._default_headers()
+        headers["Accept"] = "text/event-stream"
+
+        resp = get_client("clova").post(
+            self.base_url, headers=headers, json=payload, stream=True
+        )
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError:
+            resp.close()
+            raise
+        return ClovaChatStream(resp)
+
+
+# ─── 프로세스 공용 클라이언트 ───
+# 모듈 import 시점에 만들면 Clova 설정이 없을 때 URLconf 로딩(모든 관리 명령/테스트)이 실패하므로 첫 사용 시 생성
+_client: ClovaClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_clova_client() -> ClovaClient:
+    """
+    프로세스 공용 ClovaClient 를 반환합니다. 처음 호출할 때 만들며, 설정이 잘못됐으면 RuntimeError.
+    (실패한 경우 저장하지 않으므로 설정을 고친 뒤 다음 호출에서 다시 생성)
+    """
+    global _client
+    client = _client
+    if client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ClovaClient()
+            client = _client
+    return client
+
+
+def set_clova_client(client) -> None:
+    """
+    공용 클라이언트를 교체합니다. 테스트에서 스텁을 넣을 때 사용하고, None 이면 다음 사용 때 다시 생성합니다.
+    """
+    global _client
+    with _client_lock:
+        _client = client
+
+
+@receiver(setting_changed)
+def _reset_clova_client(setting, **kwargs):
+    # override_settings 로 Clova 설정을 바꾸면 새 설정으로 다시 만들도록 초기화
+    if setting.startswith("CLOVA_"):
+        set_clova_client(None)
+
+
+class ClovaChatStream:
+    """
+    Clova 스트리밍 응답(SSE)을 토큰 단위로 돌려주는 이터레이터
+
+    · event: token  → data.message.content (새로 생성된 토큰)
+    · event: result → 생성 완료
+    · event: error  → ValueError
+    cancel() 은 다른 스레드에서 호출해도 되며, 소켓을 바로 끊어 Clova 쪽 생성도 중단시킵니다.
+    """
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+        self.cancelled = False
+
+    def _events(self) -> Iterator[tuple[str, str]]:
+        event = "message"
+        data: list[str] = []
+        for line in self.response.iter_lines(decode_unicode=True):
+            if self.cancelled:
+                return
+            if not line:
+                if data:
+                    yield event, "\n".join(data)
+                event, data = "message", []
+            elif line.startswith("event:"):
+                event = line[len("event:") :].strip()
+            elif line.startswith("data:"):
+                data.append(line[len("data:") :].strip())
+
+    def __iter__(self) -> Iterator[str]:
+        self.response.encoding = "utf-8"
+        try:
+            for event, data in self._events():
+                if event == "token":
+                    content = json.loads(data).get("message", {}).get("content")
+                    if content:
+                        yield content
+                elif event == "result":
+                    return
+                elif event == "error":
+                    raise ValueError(f"Clova API 호출 실패: {data}")
+        except (requests.RequestException, OSError):
+            # cancel() 로 소켓을 끊은 경우는 정상 종료
+            if not self.cancelled:
+                raise
+        finally:
+            self.response.close()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        # 읽기 중인 스레드가 바로 깨어나도록 close() 전에 소켓을 shutdown
+        connection = getattr(self.response.raw, "connection", None)
+        sock = getattr(connection, "sock", None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.response.close()
@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import deque
+
+from config.stub_server import JsonStubHandler
+
+
+class FakeClovaStats:
+    # 가짜 Clova 가 받은 요청 집계 (동시 처리 수, 분당 요청 수)
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peak_per_minute = 0
+        self._recent: deque = deque()
+
+    def started(self) -> int:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            now = time.monotonic()
+            self._recent.append(now)
+            while self._recent[0] <= now - 60:
+                self._recent.popleft()
+            self.peak_per_minute = max(self.peak_per_minute, len(self._recent))
+            return self.requests
+
+    def finished(self, failed: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.failures += int(failed)
+
+    def summary(self) -> str:
+        return (
+            f"요청 {self.requests}건 (실패 응답 {self.failures}) / "
+            f"최대 동시 처리 {self.peak_in_flight} / 최대 분당 요청 {self.peak_per_minute}"
+        )
+
+
+def fake_clova_handler(delay: float = 0.0, fail_every: int = 0):
+    """
+    Clova Studio chat-completions 를 흉내 내는 가짜 API 핸들러 (요약/챗봇 모두 같은 엔드포인트)
+
+    delay 초 뒤 받은 마지막 메시지를 줄인 응답과 토큰 사용량(inputLength/outputLength)을 돌려주고,
+    fail_every 가 있으면 그 번째 요청마다 500 으로 실패합니다. 집계는 Handler.stats 로 확인합니다.
+    """
+
+    class Handler(JsonStubHandler):
+        stats = FakeClovaStats()
+
+        def do_POST(self):
+            payload = self.read_json()
+            if "/chat-completions" not in self.path:
+                return self.send_json(404, {"status": {"code": "40400"}})
+
+            number = self.stats.started()
+            failed = bool(fail_every) and number % fail_every == 0
+            try:
+                if delay:
+                    time.sleep(delay)
+                if failed:
+                    return self.send_json(
+                        500, {"status": {"code": "50000", "message": "fake failure"}}
+                    )
+                messages = payload.get("messages") or [{}]
+                prompt = messages[-1].get("content", "")
+                content = f"[fake clova] {prompt[:60]}"
+                self.send_json(
+                    200,
+                    {
+                        "status": {"code": "20000", "message": "OK"},
+                        "result": {
+                            "message": {"role": "assistant", "content": content},
+                            "inputLength": sum(
+                                len(m.get("content", "")) for m in messages
+                            ),
+                            "outputLength": len(content),
+                        },
+                    },
+                )
+            finally:
+                self.stats.finished(failed)
+
+    return Handler
@@ -1,19 +1,37 @@
-from django.shortcuts import get_object_or_404
+import asyncio
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.marker.models import Marker
+from config.async_views import AsyncAPIView
+from config.resilience import DependencyUnavailable
+from config.streaming import iterate_in_thread
 
-from .serializers import ChatRequestSerializer, SummarizeRequestSerializer
-from .utils.clova_client import ClovaClient
+from .cache import SummaryCache
+from .models import ChatSession
+from .serializers import (
+    ChatRequestSerializer,
+    ChatSessionMessageSerializer,
+    ChatSessionSerializer,
+    SummarizeRequestSerializer,
+)
+from .services import ChatSessionService
+from .utils.clova_client import get_clova_client
 
-clova = ClovaClient()
+logger = logging.getLogger(__name__)
 
 
-class SummarizeAPIView(APIView):
+class SummarizeAPIView(AsyncAPIView):
     """
     POST /api/ai/summarize/
     {
@@ -39,7 +57,7 @@ class SummarizeAPIView(APIView):
             )
         },
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = SummarizeRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -48,14 +66,25 @@ class SummarizeAPIView(APIView):
 
         # 1) location_id가 있으면 DB에서 원문 조회
         if marker_id:
-            marker_obj = get_object_or_404(Marker, pk=marker_id)
+            marker_obj = await aget_object_or_404(Marker, pk=marker_id)
             text_to_summarize = marker_obj.description or raw_text
         else:
             text_to_summarize = raw_text
 
-        # 2) Clova에 요약 요청
+        # 2) 요약 캐시 조회 → 없으면 Clova에 요약 요청 (같은 텍스트의 동시 요청은 한 번만 호출)
         try:
-            summary = clova.summarize_text(text=text_to_summarize)
+            summary = await SummaryCache.aget_or_summarize(
+                text_to_summarize,
+                lambda text: get_clova_client().asummarize_text(text=text),
+            )
+        except DependencyUnavailable:
+            # Clova 장애(서킷 열림) 중에는 이전에 저장된 마커 요약문으로 대신 응답 (설명이 바뀌었을 수 있음)
+            if marker_id and marker_obj.summary_text:
+                return Response(
+                    {"summary": marker_obj.summary_text, "stale": True},
+                    status=status.HTTP_200_OK,
+                )
+            raise
         except Exception as e:
             # Clova 호출 에러 처리
             return Response(
@@ -63,17 +92,18 @@ class SummarizeAPIView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        # 3) (선택) DB 캐시에 저장하려면 여기에 로직 추가
-        if marker_id:
-            # 예: 처음 요약인 경우 저장
-            if not marker_obj.summary_text:
-                marker_obj.summary_text = summary
-                marker_obj.save(update_fields=["summary_text"])
+        # 3) 마커 요약문 갱신 (설명이 수정되어 요약이 달라진 경우 포함)
+        if marker_id and marker_obj.summary_text != summary:
+            marker_obj.summary_text = summary
+            marker_obj.summary_source_hash = SummaryCache.make_key(text_to_summarize)
+            await marker_obj.asave(
+                update_fields=["summary_text", "summary_source_hash"]
+            )
 
         return Response({"summary": summary}, status=status.HTTP_200_OK)
 
 
-class ChatAPIView(APIView):
+class ChatAPIView(AsyncAPIView):
     """
     .POST /api/ai/chat/
     {
@@ -98,18 +128,197 @@ class ChatAPIView(APIView):
             )
         },
     )
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = ChatRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         messages = serializer.validated_data["messages"]
 
         try:
-            reply = clova.chat(messages=messages)
+            reply = await get_clova_client().achat(messages=messages)
+        except DependencyUnavailable:
+            # 서킷 열림/동시 호출 상한: 503 + Retry-After (config.exception_handler)
+            raise
+        except Exception as e:
+            return Response(
+                {"error": f"Clova Chat API 호출 실패: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response({"reply": reply}, status=status.HTTP_200_OK)
+
+
+class ChatSessionCreateAPIView(APIView):
+    """
+    POST /api/ai/chat/sessions/ : 새 챗봇 세션 생성
+    이후 /api/ai/chat/sessions/{session_id}/messages/ 에 새 메시지만 보내면 이전 대화는 서버가 이어 붙임
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["AI 기능"],
+        operation_summary="챗봇 세션 생성",
+        responses={201: ChatSessionSerializer},
+    )
+    def post(self, request, *args, **kwargs):
+        session = ChatSession.objects.create(user=request.user)
+        return Response(
+            ChatSessionSerializer(session).data, status=status.HTTP_201_CREATED
+        )
+
+
+class ChatSessionDetailAPIView(APIView):
+    """
+    GET    /api/ai/chat/sessions/{session_id}/ : 세션 대화 기록 조회
+    DELETE /api/ai/chat/sessions/{session_id}/ : 세션 삭제
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["AI 기능"],
+        operation_summary="챗봇 세션 대화 기록 조회",
+        responses={200: ChatSessionSerializer},
+    )
+    def get(self, request, session_id, *args, **kwargs):
+        session = get_object_or_404(
+            ChatSession.objects.prefetch_related("turns"),
+            pk=session_id,
+            user=request.user,
+        )
+        return Response(ChatSessionSerializer(session).data)
+
+    @swagger_auto_schema(tags=["AI 기능"], operation_summary="챗봇 세션 삭제")
+    def delete(self, request, session_id, *args, **kwargs):
+        session = get_object_or_404(ChatSession, pk=session_id, user=request.user)
+        session.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ChatSessionMessageAPIView(AsyncAPIView):
+    """
+    POST /api/ai/chat/sessions/{session_id}/messages/
+    {
+        "message": "부산 1박 2일 코스 추천해줘"
+    }
+    -->
+    {
+        "reply": "봇이 응답한 내용"
+    }
+    Clova 에는 이전 대화 요약 + 토큰 예산 안의 최근 대화 + 새 메시지만 전송 (ChatSessionService)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["AI 기능"],
+        operation_summary="챗봇 세션 대화",
+        request_body=ChatSessionMessageSerializer,
+        responses={200: openapi.Response(description="응답 성공")},
+    )
+    async def post(self, request, session_id, *args, **kwargs):
+        serializer = ChatSessionMessageSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        message = serializer.validated_data["message"]
+
+        session = await aget_object_or_404(
+            ChatSession, pk=session_id, user=request.user
+        )
+        context, history = await sync_to_async(ChatSessionService.build_context)(
+            session
+        )
+
+        try:
+            reply, usage = await get_clova_client().achat_with_usage(
+                messages=history + [{"role": "user", "content": message}],
+                context=context,
+            )
+        except DependencyUnavailable:
+            raise
         except Exception as e:
             return Response(
                 {"error": f"Clova Chat API 호출 실패: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+        logger.info(
+            "챗봇 세션 %s: 최근 턴 %s개 전송, 입력 토큰 %s",
+            session.pk,
+            len(history),
+            usage["input_tokens"],
+        )
 
+        await sync_to_async(ChatSessionService.record_exchange)(
+            session, message, reply, usage
+        )
         return Response({"reply": reply}, status=status.HTTP_200_OK)
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _relay_chat_stream(stream):
+    # Clova 토큰을 받는 대로 SSE 로 전달 (클라이언트가 끊으면 ASGI 핸들러가 이 제너레이터를 취소함)
+    reply = []
+    try:
+        async for token in iterate_in_thread(stream, thread_sensitive=False):
+            reply.append(token)
+            yield _sse("token", {"content": token})
+        yield _sse("done", {"reply": "".join(reply)})
+    except asyncio.CancelledError:
+        logger.info("챗봇 스트리밍 중 클라이언트 연결 종료 → Clova 요청 취소")
+        raise
+    except Exception as e:
+        yield _sse("error", {"error": f"Clova Chat API 호출 실패: {str(e)}"})
+    finally:
+        stream.cancel()
+
+
+class ChatStreamAPIView(APIView):
+    """
+    .POST /api/ai/chat/stream/
+    요청 본문은 /api/ai/chat/ 과 같고, 응답은 text/event-stream 으로 토큰이 생성되는 대로 전달
+    -->
+    event: token
+    data: {"content": "봇이"}
+
+    event: token
+    data: {"content": " 응답한"}
+
+    event: done
+    data: {"reply": "봇이 응답한 내용"}
+
+    (중간에 실패하면 event: error / data: {"error": "..."})
+    """
+
+    @swagger_auto_schema(
+        tags=["AI 기능"],
+        operation_summary="사용자 챗봇 기능 (SSE 스트리밍)",
+        request_body=ChatRequestSerializer,
+        responses={200: openapi.Response(description="text/event-stream 응답")},
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = ChatRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        messages = serializer.validated_data["messages"]
+
+        # 첫 응답(헤더)을 받기 전의 오류는 일반 JSON 오류로 반환
+        try:
+            stream = get_clova_client().chat_stream(messages=messages)
+        except DependencyUnavailable:
+            raise
+        except Exception as e:
+            return Response(
+                {"error": f"Clova Chat API 호출 실패: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        response = StreamingHttpResponse(
+            _relay_chat_stream(stream), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        # nginx 프록시 버퍼링을 끄지 않으면 토큰이 모였다가 한꺼번에 전달됨
+        response["X-Accel-Buffering"] = "no"
+        return response
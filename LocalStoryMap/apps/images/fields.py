@@ -0,0 +1,91 @@
+from django.db.models import signals
+from django.db.models.fields.files import ImageField, ImageFieldFile
+
+# post_init 시점의 파일 경로를 알 수 없는 경우(only()/defer() 로 지연 로딩)
+_UNKNOWN = object()
+
+
+class ContentAddressedImageFieldFile(ImageFieldFile):
+    def save(self, name, content, save=True):
+        # 업로드 파일명 대신 내용 해시로 만든 키에 저장 (같은 내용이면 업로드 생략)
+        from .services import ImageBlobService
+
+        self.name = ImageBlobService.store(
+            self.storage, name, content, max_length=self.field.max_length
+        )
+        setattr(self.instance, self.field.attname, self.name)
+        self._committed = True
+
+        if save:
+            self.instance.save()
+
+    save.alters_data = True  # type: ignore[attr-defined]
+
+
+class ContentAddressedImageField(ImageField):
+    """
+    내용 해시 기반으로 중복 제거해서 저장하는 ImageField
+
+    · 저장 경로는 upload_to 대신 ImageBlobService.blob_name() 규칙(해시 기반 키)을 따릅니다.
+    · 행이 저장/삭제될 때 ImageBlob.ref_count 를 같은 트랜잭션 안에서 증감합니다.
+      (QuerySet.update() 처럼 시그널을 우회한 변경은 gc_image_blobs --recount 로 보정)
+    """
+
+    attr_class = ContentAddressedImageFieldFile
+
+    @property
+    def _initial_key(self):
+        return f"_{self.attname}_blob_initial"
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+        if cls._meta.abstract:
+            return
+        signals.post_init.connect(self._remember_initial, sender=cls)
+        signals.pre_save.connect(self._load_unknown_initial, sender=cls)
+        signals.post_save.connect(self._update_refs_on_save, sender=cls)
+        signals.post_delete.connect(self._update_refs_on_delete, sender=cls)
+
+    def _current_name(self, instance):
+        value = getattr(instance, self.attname)
+        return getattr(value, "name", value) or None
+
+    def _remember_initial(self, instance, **kwargs):
+        if self.attname not in instance.__dict__:
+            instance.__dict__[self._initial_key] = _UNKNOWN
+            return
+        value = instance.__dict__[self.attname]
+        instance.__dict__[self._initial_key] = getattr(value, "name", value) or None
+
+    def _load_unknown_initial(self, sender, instance, raw=False, **kwargs):
+        # 지연 로딩된 경우에만 저장 전에 DB 의 기존 경로를 한 번 조회
+        if raw or instance.__dict__.get(self._initial_key) is not _UNKNOWN:
+            return
+        initial = None
+        if not instance._state.adding:
+            initial = (
+                sender._base_manager.filter(pk=instance.pk)
+                .values_list(self.attname, flat=True)
+                .first()
+            )
+        instance.__dict__[self._initial_key] = initial or None
+
+    def _update_refs_on_save(
+        self, sender, instance, created, raw=False, update_fields=None, **kwargs
+    ):
+        from .services import ImageBlobService
+
+        if raw or (update_fields is not None and self.name not in update_fields):
+            return
+        previous = None if created else instance.__dict__.get(self._initial_key)
+        current = self._current_name(instance)
+        if previous is _UNKNOWN:
+            previous = None
+        if previous != current:
+            ImageBlobService.update_refs(acquire=current, release=previous)
+        instance.__dict__[self._initial_key] = current
+
+    def _update_refs_on_delete(self, sender, instance, **kwargs):
+        from .services import ImageBlobService
+
+        ImageBlobService.update_refs(release=self._current_name(instance))
@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.images.models import ImageBlob
+from apps.images.services import ImageBlobService
+
+
+class Command(BaseCommand):
+    help = "참조가 없는 이미지 blob(내용 해시 기반 저장 객체)을 배치 단위로 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="한 번에 처리할 blob 수"
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=settings.IMAGE_BLOB_GC_GRACE_HOURS,
+            help="참조가 사라진 뒤 삭제하기까지 기다리는 시간",
+        )
+        parser.add_argument(
+            "--recount",
+            action="store_true",
+            help="삭제 전에 전체 blob 의 ref_count 를 실제 참조 수로 보정",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 수만 출력")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if options["recount"]:
+            fixed = 0
+            for batch in self._batches(ImageBlob.objects.all(), batch_size):
+                fixed += ImageBlobService.recount(batch)
+            self.stdout.write(f"ref_count 보정: {fixed}건")
+
+        cutoff = timezone.now() - timedelta(hours=options["grace_hours"])
+        candidates = ImageBlob.objects.filter(ref_count=0, updated_at__lt=cutoff)
+
+        if options["dry_run"]:
+            total = candidates.count()
+            self.stdout.write(self.style.WARNING(f"[dry-run] 삭제 대상 blob: {total}개"))
+            return
+
+        deleted = 0
+        for batch in self._batches(candidates, batch_size):
+            deleted += ImageBlobService.delete_unreferenced(
+                [blob.pk for blob in batch], cutoff
+            )
+            self.stdout.write(f"진행: 삭제 {deleted}개")
+
+        self.stdout.write(self.style.SUCCESS(f"완료: blob {deleted}개 삭제"))
+
+    @staticmethod
+    def _batches(queryset, batch_size):
+        # pk 기준 키셋 페이지네이션 (삭제 중에도 OFFSET 이 밀리지 않음)
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk).order_by("pk")[:batch_size])
+            if not batch:
+                return
+            last_pk = batch[-1].pk
+            yield batch
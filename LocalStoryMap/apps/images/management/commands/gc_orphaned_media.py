@@ -0,0 +1,85 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.images.services import OrphanedMediaService
+from apps.images.storage import delete_objects, iter_object_pages
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "어떤 행도 참조하지 않는 미디어 파일(마커/스토리/프로필/변형 이미지)을 페이지 단위로 찾아 일괄 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prefix",
+            action="append",
+            help="대상 경로 prefix (예: story_images/, 생략 시 모든 FileField 경로)",
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=settings.MEDIA_GC_GRACE_HOURS,
+            help="이 시간 안에 올라온 객체는 건너뜀",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+        parser.add_argument(
+            "--verbose-orphans", action="store_true", help="고아 객체 경로를 모두 출력"
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["grace_hours"])
+        dry_run = options["dry_run"]
+        started = time.monotonic()
+        totals = {"scanned": 0, "orphans": 0, "bytes": 0, "deleted": 0}
+
+        for storage, prefix in OrphanedMediaService.targets():
+            # --prefix 는 대상 경로 하위만 허용 (예: story_images/2025/)
+            scan_prefixes = (
+                [p for p in options["prefix"] if p.startswith(prefix)]
+                if options["prefix"]
+                else [prefix]
+            )
+            for scan_prefix in scan_prefixes:
+                self._collect(storage, scan_prefix, cutoff, dry_run, totals, options)
+
+        elapsed = time.monotonic() - started
+        summary = (
+            f"스캔 {totals['scanned']}개 / 고아 {totals['orphans']}개 "
+            f"({totals['bytes'] / 1024 / 1024:.1f}MB) / 삭제 {totals['deleted']}개 / "
+            f"{elapsed:.1f}초"
+        )
+        logger.info("gc_orphaned_media%s: %s", " (dry-run)" if dry_run else "", summary)
+        if dry_run:
+            self.stdout.write(self.style.WARNING(f"[dry-run] {summary}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"완료: {summary}"))
+
+    def _collect(self, storage, prefix, cutoff, dry_run, totals, options):
+        started = time.monotonic()
+        scanned = 0
+        for page in iter_object_pages(storage, prefix):
+            orphans = OrphanedMediaService.find_orphans(page, cutoff)
+            names = [name for name, _size in orphans]
+            if names and not dry_run:
+                delete_objects(storage, names)
+                totals["deleted"] += len(names)
+
+            scanned += len(page)
+            totals["scanned"] += len(page)
+            totals["orphans"] += len(orphans)
+            totals["bytes"] += sum(size for _name, size in orphans)
+            if options["verbose_orphans"]:
+                for name in names:
+                    self.stdout.write(f"  {name}")
+
+            rate = scanned / max(time.monotonic() - started, 1e-6)
+            self.stdout.write(
+                f"[{prefix}] 스캔 {scanned}개 ({rate:.0f}개/초) / "
+                f"누적 고아 {totals['orphans']}개 / 삭제 {totals['deleted']}개"
+            )
@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.images.services import ImageVariantService
+from apps.marker.cache import MarkerDetailCache
+
+BATCH_SIZE = 200
+
+# 백필 대상: (모델 라벨, 이미지 필드명)
+TARGETS = {
+    "marker": ("marker.Marker", "image"),
+    "storyimage": ("storyimage.StoryImage", "image_file"),
+}
+
+
+class Command(BaseCommand):
+    help = "기존 이미지의 썸네일/카드/원본 변형 이미지를 병렬로 생성합니다. (백필용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=list(TARGETS.keys()),
+            action="append",
+            help="대상 모델 (생략 시 전체)",
+        )
+        parser.add_argument("--workers", type=int, default=8, help="동시 처리 스레드 수")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="이미 변형이 있어도 다시 기록 (스토리지에 없는 변형 파일만 새로 만듦)",
+        )
+
+    def handle(self, *args, **options):
+        targets = options["model"] or list(TARGETS.keys())
+
+        def process(model_label, image_field, pk):
+            try:
+                return ImageVariantService.generate(model_label, pk, image_field)
+            finally:
+                close_old_connections()
+
+        for target in targets:
+            model_label, image_field = TARGETS[target]
+            model = apps.get_model(model_label)
+            queryset = model.objects.exclude(**{image_field: ""}).exclude(
+                **{f"{image_field}__isnull": True}
+            )
+            if options["force"]:
+                # source 를 비우면 needs_variants 가 True 가 되어 다시 생성됨
+                queryset.update(image_variants={})
+                # update() 는 post_save 를 보내지 않으므로 마커 상세 캐시를 직접 무효화
+                if model_label == "marker.Marker":
+                    for pk in queryset.values_list("pk", flat=True).iterator(
+                        chunk_size=BATCH_SIZE
+                    ):
+                        MarkerDetailCache.invalidate(pk)
+
+            pks = (
+                queryset.order_by("pk")
+                .values_list("pk", flat=True)
+                .iterator(chunk_size=BATCH_SIZE)
+            )
+            done = skipped = 0
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                # 배치 단위로 넘겨서 대기 중인 작업 수(메모리)를 제한
+                while batch := list(islice(pks, BATCH_SIZE)):
+                    results = executor.map(
+                        lambda pk: process(model_label, image_field, pk), batch
+                    )
+                    for created in results:
+                        if created:
+                            done += 1
+                        else:
+                            skipped += 1
+                    self.stdout.write(f"[{target}] 진행: 생성 {done} / 건너뜀 {skipped}")
+
+            self.stdout.write(
+                self.style.SUCCESS(f"[{target}] 완료: 생성 {done} / 건너뜀 {skipped}")
+            )
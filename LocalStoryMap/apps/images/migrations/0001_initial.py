@@ -0,0 +1,64 @@
+# Generated by Django 5.2.1 on 2026-10-19 14:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ImageBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sha256",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="SHA-256 해시"
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="스토리지 키"
+                    ),
+                ),
+                (
+                    "size",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="파일 크기(byte)"
+                    ),
+                ),
+                (
+                    "ref_count",
+                    models.PositiveIntegerField(default=0, verbose_name="참조 수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+            ],
+            options={
+                "db_table": "image_blobs",
+                "indexes": [
+                    models.Index(
+                        fields=["ref_count", "updated_at"], name="image_blobs_gc_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+from django.db import models
+
+
+class ImageBlob(models.Model):
+    """
+    내용(SHA-256) 기준으로 한 번만 저장되는 이미지 원본 객체
+
+    같은 바이트의 이미지는 같은 키(name) 하나를 공유하고, ref_count 로 참조 중인 행 수를 셉니다.
+    ref_count 가 0 이 된 뒤 유예 시간이 지나면 gc_image_blobs 명령이 스토리지에서 삭제합니다.
+    """
+
+    sha256 = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name="SHA-256 해시",
+    )
+    name = models.CharField(
+        max_length=255,
+        unique=True,
+        verbose_name="스토리지 키",
+    )
+    size = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name="파일 크기(byte)",
+    )
+    ref_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="참조 수",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성일시",
+    )
+    # 마지막으로 재사용/참조 해제된 시각 (GC 유예 시간 기준)
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정일시",
+    )
+
+    class Meta:
+        db_table = "image_blobs"
+        indexes = [
+            models.Index(
+                fields=["ref_count", "updated_at"],
+                name="image_blobs_gc_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} (refs={self.ref_count})"
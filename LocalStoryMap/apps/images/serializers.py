@@ -0,0 +1,45 @@
+from rest_framework import serializers
+
+from .services import ImageVariantService
+
+
+class ImageVariantSerializerMixin(serializers.Serializer):
+    """
+    이미지 변형 URL 필드를 추가하는 믹스인
+
+    · display_image: 엔드포인트에 맞는 크기의 변형 URL (context["image_variant"], 기본값은 default_image_variant)
+    · image_variants: 전체 변형 URL
+    하위 시리얼라이저에서 image_field_name 을 모델의 이미지 필드명으로 지정합니다.
+    """
+
+    image_field_name = "image"
+    variants_field_name = "image_variants"
+    default_image_variant = "full"
+
+    display_image = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
+
+    def _absolute(self, url):
+        request = self.context.get("request")
+        if url and request is not None and url.startswith("/"):
+            return request.build_absolute_uri(url)
+        return url
+
+    def get_display_image(self, obj):
+        size_name = self.context.get("image_variant", self.default_image_variant)
+        url = ImageVariantService.variant_url(
+            getattr(obj, self.image_field_name),
+            getattr(obj, self.variants_field_name),
+            size_name,
+        )
+        return self._absolute(url)
+
+    def get_image_variants(self, obj):
+        urls = ImageVariantService.variant_urls(
+            getattr(obj, self.image_field_name),
+            getattr(obj, self.variants_field_name),
+        )
+        return {
+            size_name: {fmt: self._absolute(url) for fmt, url in formats.items()}
+            for size_name, formats in urls.items()
+        }
@@ -0,0 +1,476 @@
+# apps/images/services.py
+import hashlib
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile, File
+from django.db import transaction
+from django.db.models import Count, F, FileField, Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from config import background
+
+from .models import ImageBlob
+from .storage import copy_object, delete_objects, unique_storages
+
+logger = logging.getLogger(__name__)
+
+# Pillow 저장 포맷명과 확장자
+FORMAT_EXTENSIONS = {"webp": "WEBP", "jpeg": "JPEG"}
+
+
+class ImageVariantService:
+    """
+    업로드된 원본 이미지로 크기별(thumb/card/full) WebP·JPEG 변형 이미지를 만들어
+    원본과 같은 스토리지에 저장하고, 경로를 모델의 JSONField 에 기록합니다.
+
+    variants 구조:
+        {
+            "source": "markers/abc.jpg",          # 변형을 만든 원본 경로
+            "thumb": {"webp": "...", "jpeg": "..."},
+            "card": {...},
+            "full": {...},
+        }
+    """
+
+    @staticmethod
+    def needs_variants(field_file, variants: Optional[dict]) -> bool:
+        # 원본이 있고, 현재 원본으로 만든 변형이 아직 없으면 True
+        if not field_file:
+            return False
+        return (variants or {}).get("source") != field_file.name
+
+    @staticmethod
+    def _variant_name(source_name: str, size_name: str, fmt: str) -> str:
+        # markers/abc.jpg → markers/variants/abc_thumb.webp
+        directory, filename = os.path.split(source_name)
+        stem = os.path.splitext(filename)[0]
+        return os.path.join(directory, "variants", f"{stem}_{size_name}.{fmt}")
+
+    @staticmethod
+    def is_variant_name(name: str) -> bool:
+        return os.path.basename(os.path.dirname(name)) == "variants"
+
+    @staticmethod
+    def source_prefix(variant_name: str) -> Optional[str]:
+        # markers/variants/abc_thumb.webp → "markers/abc." (원본 확장자는 알 수 없으므로 prefix 로 비교)
+        variants_dir, filename = os.path.split(variant_name)
+        stem = os.path.splitext(filename)[0]
+        if "_" not in stem:
+            return None
+        source_stem = stem.rsplit("_", 1)[0]
+        return f"{os.path.join(os.path.dirname(variants_dir), source_stem)}."
+
+    @staticmethod
+    def build_variants(field_file) -> dict:
+        storage = field_file.storage
+        sizes = settings.IMAGE_VARIANT_SIZES
+        formats = settings.IMAGE_VARIANT_FORMATS
+
+        with storage.open(field_file.name, "rb") as f:
+            image: Image.Image = Image.open(f)
+            # JPEG 는 필요한 최대 크기 근처로만 디코딩해서 대용량 원본의 처리 비용을 줄임
+            largest = max(sizes.values())
+            image.draft("RGB", (largest, largest))
+            image = ImageOps.exif_transpose(image).convert("RGB")
+
+        variants: dict = {"source": field_file.name}
+        for size_name, max_edge in sizes.items():
+            resized = image.copy()
+            resized.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+            variants[size_name] = {}
+            for fmt in formats:
+                name = ImageVariantService._variant_name(
+                    field_file.name, size_name, fmt
+                )
+                # 원본 키가 내용 해시라 같은 원본을 쓰는 행끼리 변형 키도 공유함
+                # → 이미 있으면 그대로 쓰고, 지우거나 덮어쓰지 않음 (동시에 읽는 쪽이 깨지지 않도록)
+                if storage.exists(name):
+                    variants[size_name][fmt] = name
+                    continue
+                buffer = io.BytesIO()
+                resized.save(
+                    buffer,
+                    FORMAT_EXTENSIONS[fmt],
+                    quality=settings.IMAGE_VARIANT_QUALITY,
+                    optimize=True,
+                )
+                variants[size_name][fmt] = storage.save(
+                    name, ContentFile(buffer.getvalue())
+                )
+        return variants
+
+    @staticmethod
+    def generate(
+        model_label: str, pk, image_field: str, variants_field: str = "image_variants"
+    ) -> bool:
+        # 백그라운드 워커/백필 명령에서 호출. 변형을 만들었으면 True
+        model = apps.get_model(model_label)
+        instance = model.objects.filter(pk=pk).first()
+        if instance is None:
+            return False
+
+        field_file = getattr(instance, image_field)
+        if not ImageVariantService.needs_variants(
+            field_file, getattr(instance, variants_field)
+        ):
+            return False
+
+        # 같은 원본(내용 해시 기반 키)을 공유하는 다른 행에 이미 만든 변형이 있으면 재사용
+        variants = (
+            model.objects.filter(**{f"{variants_field}__source": field_file.name})
+            .values_list(variants_field, flat=True)
+            .first()
+        )
+        try:
+            variants = variants or ImageVariantService.build_variants(field_file)
+        except Exception:
+            logger.exception("이미지 변형 생성 실패: %s pk=%s", model_label, pk)
+            return False
+
+        # 처리 중에 원본이 바뀌었으면 저장하지 않음 (새 원본에 대한 작업이 따로 예약되어 있음)
+        if (
+            not model.objects.filter(pk=pk)
+            .filter(**{image_field: field_file.name})
+            .exists()
+        ):
+            return False
+
+        setattr(instance, variants_field, variants)
+        # save() 로 저장해서 post_save 시그널(마커 상세 캐시 무효화 등)이 동작하도록 함
+        instance.save(update_fields=[variants_field])
+        return True
+
+    @staticmethod
+    def schedule(
+        instance, image_field: str, variants_field: str = "image_variants"
+    ) -> None:
+        # post_save 에서 호출: 변형이 필요하면 커밋 후 백그라운드 워커 풀에 예약
+        if not ImageVariantService.needs_variants(
+            getattr(instance, image_field), getattr(instance, variants_field)
+        ):
+            return
+        background.submit_on_commit(
+            ImageVariantService.generate,
+            instance._meta.label,
+            instance.pk,
+            image_field,
+            variants_field,
+        )
+
+    @staticmethod
+    def variant_url(
+        field_file, variants: Optional[dict], size_name: str, fmt: Optional[str] = None
+    ) -> Optional[str]:
+        # 원하는 크기의 변형 URL, 아직 생성 전이면 원본 URL
+        if not field_file:
+            return None
+        fmt = fmt or settings.IMAGE_VARIANT_FORMATS[0]
+        variants = variants or {}
+        if variants.get("source") == field_file.name:
+            name = variants.get(size_name, {}).get(fmt)
+            if name:
+                return field_file.storage.url(name)
+        return field_file.url
+
+    @staticmethod
+    def variant_urls(field_file, variants: Optional[dict]) -> dict:
+        # {"thumb": {"webp": url, "jpeg": url}, ...} (생성 전이면 빈 dict)
+        variants = variants or {}
+        if not field_file or variants.get("source") != field_file.name:
+            return {}
+        storage = field_file.storage
+        return {
+            size_name: {fmt: storage.url(name) for fmt, name in formats.items()}
+            for size_name, formats in variants.items()
+            if size_name != "source"
+        }
+
+
+class ImageBlobService:
+    """
+    내용 해시 기반 이미지 저장소 (ContentAddressedImageField 가 사용)
+
+    · 업로드 내용을 청크 단위로 읽으며 SHA-256 을 계산하고 blobs/ab/<해시>.<확장자> 키에 저장
+    · 같은 해시의 ImageBlob 이 이미 있으면 업로드하지 않고 기존 키를 돌려줌
+    · 참조 수(ref_count)가 0 이고 유예 시간이 지난 blob 은 gc_image_blobs 로 일괄 삭제
+    """
+
+    @staticmethod
+    def digest(content) -> tuple[str, int]:
+        # 파일 전체를 메모리에 올리지 않고 청크 단위로 해시 계산
+        if not hasattr(content, "chunks"):
+            content = File(content)
+        hasher = hashlib.sha256()
+        size = 0
+        content.seek(0)
+        for chunk in content.chunks():
+            hasher.update(chunk)
+            size += len(chunk)
+        content.seek(0)
+        return hasher.hexdigest(), size
+
+    @staticmethod
+    def blob_name(sha256: str, filename: str) -> str:
+        # 해시 앞 2글자로 디렉터리를 나눠 한 prefix 에 객체가 몰리지 않도록 함
+        extension = os.path.splitext(filename or "")[1].lower()[:10]
+        return f"{settings.IMAGE_BLOB_PREFIX}/{sha256[:2]}/{sha256}{extension}"
+
+    @staticmethod
+    def _upload(storage, name: str, content, max_length=None) -> str:
+        # 키를 그대로 유지해야 하므로, 덮어쓰기를 하지 않는 스토리지(로컬)는 남은 파일을 먼저 지움
+        if not getattr(storage, "file_overwrite", False) and storage.exists(name):
+            storage.delete(name)
+        return storage.save(name, content, max_length=max_length)
+
+    @staticmethod
+    def store(storage, filename: str, content, max_length=None) -> str:
+        """
+        content 를 해시 기반 키로 저장하고 키를 반환합니다.
+
+        blob 행을 select_for_update 로 잠근 상태에서 재사용/업로드하므로,
+        같은 blob 을 지우려는 GC 와 동시에 실행되어도 지워진 키를 돌려주지 않습니다.
+        """
+        if not hasattr(content, "chunks"):
+            content = File(content, filename)
+        sha256, size = ImageBlobService.digest(content)
+
+        with transaction.atomic():
+            blob, created = ImageBlob.objects.select_for_update().get_or_create(
+                sha256=sha256,
+                defaults={
+                    "name": ImageBlobService.blob_name(sha256, filename),
+                    "size": size,
+                },
+            )
+            if not created:
+                # 재사용 시각 갱신 → 참조가 붙기 전에 GC 유예 시간이 끝나지 않도록 함
+                blob.save(update_fields=["updated_at"])
+
+            if created or not storage.exists(blob.name):
+                saved = ImageBlobService._upload(
+                    storage, blob.name, content, max_length
+                )
+                if saved != blob.name:
+                    raise RuntimeError(f"blob 키가 변경되어 저장되었습니다: {saved}")
+            else:
+                logger.debug("중복 이미지 업로드 생략: %s", blob.name)
+        return blob.name
+
+    @staticmethod
+    def ingest(storage, name: str) -> str:
+        """
+        스토리지에 이미 올라와 있는 객체(직접 업로드)를 해시 기반 키로 옮기고 키를 반환합니다.
+
+        객체를 청크 단위로 한 번 읽어 해시를 계산한 뒤 store() 와 같이 blob 행을 잠근 상태에서
+        같은 해시의 blob 을 재사용하거나 blob 키로 복사(S3 는 서버 측 복사)하고, 원래 객체는 지웁니다.
+        """
+        with storage.open(name, "rb") as f:
+            sha256, size = ImageBlobService.digest(f)
+
+        with transaction.atomic():
+            blob, created = ImageBlob.objects.select_for_update().get_or_create(
+                sha256=sha256,
+                defaults={
+                    "name": ImageBlobService.blob_name(sha256, name),
+                    "size": size,
+                },
+            )
+            if not created:
+                blob.save(update_fields=["updated_at"])
+            if created or not storage.exists(blob.name):
+                copy_object(storage, name, blob.name)
+            else:
+                logger.debug("중복 이미지 업로드 생략: %s", blob.name)
+        storage.delete(name)
+        return blob.name
+
+    @staticmethod
+    def update_refs(acquire: Optional[str] = None, release: Optional[str] = None):
+        # 해시 기반 키가 아닌 기존 경로는 ImageBlob 행이 없으므로 UPDATE 0건으로 끝남
+        if acquire:
+            ImageBlob.objects.filter(name=acquire).update(ref_count=F("ref_count") + 1)
+        if release:
+            ImageBlob.objects.filter(name=release, ref_count__gt=0).update(
+                ref_count=F("ref_count") - 1, updated_at=timezone.now()
+            )
+
+    @staticmethod
+    def reference_fields() -> list:
+        # ContentAddressedImageField 를 쓰는 모든 (모델, 필드) 목록
+        from .fields import ContentAddressedImageField
+
+        return [
+            (model, field)
+            for model in apps.get_models()
+            for field in model._meta.fields
+            if isinstance(field, ContentAddressedImageField)
+        ]
+
+    @staticmethod
+    def count_references(names: Iterable[str]) -> dict:
+        # {키: 실제 참조 중인 행 수} (참조가 없는 키는 빠짐)
+        names = list(names)
+        counts: dict = {}
+        for model, field in ImageBlobService.reference_fields():
+            rows = (
+                model._base_manager.filter(**{f"{field.attname}__in": names})
+                .values_list(field.attname)
+                .annotate(total=Count("pk"))
+                .order_by()
+            )
+            for name, total in rows:
+                counts[name] = counts.get(name, 0) + total
+        return counts
+
+    @staticmethod
+    def recount(blobs: list) -> int:
+        # 시그널을 거치지 않은 변경으로 틀어진 ref_count 를 실제 참조 수로 보정, 보정한 행 수 반환
+        counts = ImageBlobService.count_references(blob.name for blob in blobs)
+        changed = []
+        for blob in blobs:
+            actual = counts.get(blob.name, 0)
+            if blob.ref_count != actual:
+                blob.ref_count = actual
+                blob.updated_at = timezone.now()
+                changed.append(blob)
+        ImageBlob.objects.bulk_update(changed, ["ref_count", "updated_at"])
+        return len(changed)
+
+    @staticmethod
+    def _object_names(blob_name: str) -> list:
+        # blob 원본 + 원본 기준으로 만든 변형 이미지 키
+        names = [blob_name]
+        for size_name in settings.IMAGE_VARIANT_SIZES:
+            for fmt in settings.IMAGE_VARIANT_FORMATS:
+                names.append(
+                    ImageVariantService._variant_name(blob_name, size_name, fmt)
+                )
+        return names
+
+    @staticmethod
+    def delete_unreferenced(pks: list, cutoff: datetime) -> int:
+        """
+        pks 중 참조가 없고 cutoff 이전에 마지막으로 사용된 blob 을 스토리지와 DB 에서 삭제하고
+        삭제한 blob 수를 반환합니다.
+
+        업로드 중인 store() 가 잠근 행은 skip_locked 로 건너뛰고,
+        ref_count 가 틀어져 실제로는 참조 중인 blob 은 삭제하지 않습니다.
+        """
+        with transaction.atomic():
+            blobs = list(
+                ImageBlob.objects.select_for_update(skip_locked=True).filter(
+                    pk__in=pks, ref_count=0, updated_at__lt=cutoff
+                )
+            )
+            referenced = ImageBlobService.count_references(b.name for b in blobs)
+            blobs = [blob for blob in blobs if blob.name not in referenced]
+            if not blobs:
+                return 0
+
+            names = [
+                name
+                for blob in blobs
+                for name in ImageBlobService._object_names(blob.name)
+            ]
+            fields = [field for _model, field in ImageBlobService.reference_fields()]
+            for storage in unique_storages(fields):
+                delete_objects(storage, names)
+            ImageBlob.objects.filter(pk__in=[blob.pk for blob in blobs]).delete()
+        return len(blobs)
+
+
+class OrphanedMediaService:
+    """
+    어떤 행도 참조하지 않는 미디어 파일(고아 객체)을 찾는 서비스 (gc_orphaned_media 명령이 사용)
+
+    · 대상: 모든 FileField 의 upload_to 최상위 경로 (markers/, story_images/, profile_images/ ...)
+      해시 기반 blob 경로(IMAGE_BLOB_PREFIX)는 참조 수로 관리하므로 gc_image_blobs 가 담당
+    · 스토리지 키를 페이지(최대 1000개) 단위로 받아 그 페이지의 키만 DB 와 대조하므로
+      전체 키/경로 목록을 메모리에 올리지 않음
+    · 변형 이미지(.../variants/...)는 같은 이름의 원본이 참조 중이면 유지
+    · 참조 여부는 행이 실제로 있는지로만 판단 (_base_manager, 소프트 삭제된 행 포함)
+      소프트 삭제된 스토리도 복구되면 이미지가 그대로 보여야 하므로, 해시 기반 blob 과 같이
+      행이 실제로 삭제된 뒤에만 정리됨
+    """
+
+    @staticmethod
+    def file_fields() -> list:
+        return [
+            (model, field)
+            for model in apps.get_models()
+            for field in model._meta.fields
+            if isinstance(field, FileField)
+        ]
+
+    @staticmethod
+    def targets() -> list:
+        # [(스토리지, prefix)] (같은 스토리지/prefix 는 한 번만)
+        targets: dict = {}
+        for _model, field in OrphanedMediaService.file_fields():
+            upload_to = field.upload_to if isinstance(field.upload_to, str) else ""
+            top = upload_to.strip("/").split("/")[0]
+            if not top or top == settings.IMAGE_BLOB_PREFIX:
+                continue
+            storage = field.storage
+            key = (
+                type(storage),
+                getattr(storage, "bucket_name", None),
+                getattr(storage, "location", None),
+                top,
+            )
+            targets.setdefault(key, (storage, f"{top}/"))
+        return list(targets.values())
+
+    @staticmethod
+    def referenced(names: list) -> set:
+        # names 중 DB 에서 참조 중인 경로 집합
+        originals = [n for n in names if not ImageVariantService.is_variant_name(n)]
+        variant_prefixes = {
+            name: ImageVariantService.source_prefix(name)
+            for name in names
+            if ImageVariantService.is_variant_name(name)
+        }
+        prefixes = sorted({p for p in variant_prefixes.values() if p})
+
+        referenced: set = set()
+        live_prefixes: set = set()
+        for model, field in OrphanedMediaService.file_fields():
+            manager = model._base_manager
+            if originals:
+                referenced.update(
+                    manager.filter(**{f"{field.attname}__in": originals}).values_list(
+                        field.attname, flat=True
+                    )
+                )
+            for start in range(0, len(prefixes), 100):
+                condition = Q()
+                for prefix in prefixes[start : start + 100]:
+                    condition |= Q(**{f"{field.attname}__startswith": prefix})
+                for name in manager.filter(condition).values_list(
+                    field.attname, flat=True
+                ):
+                    live_prefixes.add(f"{os.path.splitext(name)[0]}.")
+
+        referenced.update(
+            name for name, prefix in variant_prefixes.items() if prefix in live_prefixes
+        )
+        return referenced
+
+    @staticmethod
+    def find_orphans(objects: list, cutoff: datetime) -> list:
+        """
+        iter_object_pages 한 페이지 중 고아 객체 [(name, size), ...] 를 반환합니다.
+        cutoff 이후에 올라온 객체는 아직 행이 저장되지 않았을 수 있으므로(업로드 직후, 직접 업로드 확인 전) 제외합니다.
+        """
+        candidates = [
+            (name, size) for name, size, modified in objects if modified < cutoff
+        ]
+        referenced = OrphanedMediaService.referenced([name for name, _ in candidates])
+        return [(name, size) for name, size in candidates if name not in referenced]
@@ -0,0 +1,110 @@
+import os
+from datetime import datetime, timezone
+from typing import Iterator
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+
+# S3 ListObjectsV2 / DeleteObjects 한 번에 처리할 수 있는 최대 키 수
+S3_PAGE_SIZE = 1000
+
+
+def select_s3_storage():
+    # 운영은 항상 S3(NCP Object Storage), 테스트 설정에서만 MEDIA_USE_LOCAL_STORAGE=True 로 로컬 파일시스템 대체
+    # 모델 필드에 storage=select_s3_storage 로 넘기면 마이그레이션에는 함수 경로만 기록되어 설정과 무관하게 유지됨
+    # (S3Boto3Storage 는 생성 시 접속하지 않고, 첫 파일 접근 때 boto3 연결을 만듦)
+    if getattr(settings, "MEDIA_USE_LOCAL_STORAGE", False):
+        return FileSystemStorage()
+    return S3Boto3Storage()
+
+
+def unique_storages(fields) -> list:
+    # 필드들이 쓰는 스토리지 (같은 종류/버킷/경로는 한 번만)
+    storages: dict = {}
+    for field in fields:
+        storage = field.storage
+        key = (
+            type(storage),
+            getattr(storage, "bucket_name", None),
+            getattr(storage, "location", None),
+        )
+        storages.setdefault(key, storage)
+    return list(storages.values())
+
+
+def delete_objects(storage, names: list) -> None:
+    # S3 는 DeleteObjects 로 최대 1000개씩 한 번에 삭제, 그 외 스토리지는 하나씩 삭제
+    if isinstance(storage, S3Boto3Storage):
+        for start in range(0, len(names), S3_PAGE_SIZE):
+            keys = [
+                {"Key": storage._normalize_name(clean_name(name))}
+                for name in names[start : start + S3_PAGE_SIZE]
+            ]
+            storage.bucket.delete_objects(Delete={"Objects": keys, "Quiet": True})
+        return
+    for name in names:
+        storage.delete(name)
+
+
+def copy_object(storage, source: str, target: str) -> None:
+    # S3 는 서버 측 복사(CopyObject)로 앱 서버를 거치지 않고 복사, 그 외 스토리지는 읽어서 다시 저장
+    if isinstance(storage, S3Boto3Storage):
+        extra = {"ACL": storage.default_acl} if storage.default_acl else {}
+        storage.bucket.meta.client.copy_object(
+            Bucket=storage.bucket_name,
+            Key=storage._normalize_name(clean_name(target)),
+            CopySource={
+                "Bucket": storage.bucket_name,
+                "Key": storage._normalize_name(clean_name(source)),
+            },
+            **extra,
+        )
+        return
+    if storage.exists(target):
+        storage.delete(target)
+    with storage.open(source, "rb") as f:
+        storage.save(target, f)
+
+
+def iter_object_pages(storage, prefix: str) -> Iterator[list]:
+    """
+    prefix 아래 객체를 페이지 단위로 돌려줍니다. [(name, size, last_modified), ...]
+
+    S3 는 ListObjectsV2 페이지(최대 1000개)를 그대로, 로컬 스토리지는 디렉터리 단위로 나눠 반환하므로
+    전체 키 목록을 메모리에 올리지 않습니다. name 은 스토리지 location 을 뺀 FileField 값 기준 경로입니다.
+    """
+    if isinstance(storage, S3Boto3Storage):
+        location = f"{storage.location.strip('/')}/" if storage.location else ""
+        paginator = storage.bucket.meta.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=storage.bucket_name,
+            Prefix=storage._normalize_name(clean_name(prefix)),
+            PaginationConfig={"PageSize": S3_PAGE_SIZE},
+        )
+        for page in pages:
+            objects = [
+                (obj["Key"][len(location) :], obj["Size"], obj["LastModified"])
+                for obj in page.get("Contents", [])
+            ]
+            if objects:
+                yield objects
+        return
+
+    root = storage.path("")
+    base = storage.path(prefix)
+    for directory, _dirs, files in os.walk(base):
+        objects = []
+        for filename in files:
+            path = os.path.join(directory, filename)
+            stat = os.stat(path)
+            objects.append(
+                (
+                    os.path.relpath(path, root).replace(os.sep, "/"),
+                    stat.st_size,
+                    datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                )
+            )
+        for start in range(0, len(objects), S3_PAGE_SIZE):
+            yield objects[start : start + S3_PAGE_SIZE]
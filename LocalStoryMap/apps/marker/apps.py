@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MarkerConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.marker"
+
+    def ready(self):
+        # 마커 상세 캐시 무효화 시그널 등록
+        from . import signals  # noqa: F401
@@ -0,0 +1,113 @@
+# apps/marker/cache.py
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.shortcuts import get_object_or_404
+
+from .models import Marker
+from .serializers import MarkerSerializer
+
+
+class MarkerDetailCache:
+    """
+    마커 상세 조회용 read-through 캐시
+
+    · 캐시에는 사용자와 무관한 필드만 저장하고, is_liked 같은 사용자별 필드는 조회 후 덧씌웁니다.
+    · 키에 버전을 포함합니다. 저장/삭제/좋아요 수 변경 시 버전만 올리면 이전 항목은 TTL 로 자연 소멸하고,
+      무효화 직전에 시작된 재생성이 오래된 값을 새 키에 덮어쓰는 경쟁 상태도 생기지 않습니다.
+    · soft TTL 이 지나면 락을 잡은 워커 하나만 재생성하고, 나머지는 기존 값을 그대로 반환합니다(스탬피드 방지).
+    """
+
+    KEY_PREFIX = "marker:detail"
+    LOCK_TIMEOUT = 10  # 재생성 락 유지 시간(초)
+    WAIT_INTERVAL = 0.05  # 캐시가 완전히 비어 있을 때 다른 워커의 재생성을 기다리는 간격(초)
+    WAIT_ATTEMPTS = 10
+
+    @classmethod
+    def _version_key(cls, marker_id) -> str:
+        return f"{cls.KEY_PREFIX}:{marker_id}:version"
+
+    @classmethod
+    def _entry_key(cls, marker_id, version) -> str:
+        return f"{cls.KEY_PREFIX}:{marker_id}:v{version}"
+
+    @classmethod
+    def invalidate(cls, marker_id) -> None:
+        # 단조 증가하는 값이면 되므로 나노초 타임스탬프를 버전으로 사용 (버전 키가 축출되어도 충돌 없음)
+        cache.set(cls._version_key(marker_id), time.time_ns(), timeout=None)
+
+    @classmethod
+    def _build(cls, marker_id) -> dict:
+        marker = get_object_or_404(Marker, pk=marker_id)
+        # request 없이 직렬화 → is_liked 는 False, 이미지 URL 은 스토리지 URL 그대로
+        return dict(MarkerSerializer(marker).data)
+
+    @classmethod
+    def get(cls, marker_id) -> dict:
+        # 사용자와 무관한 마커 상세 데이터 (없으면 Http404)
+        ttl = settings.MARKER_DETAIL_CACHE_TTL
+        version = cache.get(cls._version_key(marker_id)) or 0
+        key = cls._entry_key(marker_id, version)
+
+        entry = cache.get(key)
+        if entry and entry["expires_at"] > time.time():
+            return entry["data"]
+
+        lock_key = f"{key}:lock"
+        if cache.add(lock_key, 1, timeout=cls.LOCK_TIMEOUT):
+            try:
+                data = cls._build(marker_id)
+                # soft TTL 이후에도 재생성 중 반환할 수 있도록 실제 만료는 여유를 둠
+                cache.set(
+                    key,
+                    {"data": data, "expires_at": time.time() + ttl},
+                    timeout=ttl * 2,
+                )
+                return data
+            finally:
+                cache.delete(lock_key)
+
+        # 다른 워커가 재생성 중: 오래된 값이 있으면 그대로 반환
+        if entry:
+            return entry["data"]
+
+        # 캐시가 완전히 비어 있으면 잠시 기다렸다가 다시 확인
+        for _ in range(cls.WAIT_ATTEMPTS):
+            time.sleep(cls.WAIT_INTERVAL)
+            entry = cache.get(key)
+            if entry:
+                return entry["data"]
+
+        # 재생성이 늦어지면 캐시에 쓰지 않고 직접 조회
+        return cls._build(marker_id)
+
+    @staticmethod
+    def personalize(data: dict, request) -> dict:
+        # 캐시된 공통 데이터 위에 사용자별 필드를 덧씌움
+        data = dict(data)
+
+        def absolute(url):
+            if url and url.startswith("/"):
+                return request.build_absolute_uri(url)
+            return url
+
+        for field in ("image", "display_image"):
+            data[field] = absolute(data.get(field))
+        # {크기: {포맷: URL}} 도 시리얼라이저(ImageVariantSerializerMixin)와 같이 절대 URL 로
+        data["image_variants"] = {
+            size_name: {fmt: absolute(url) for fmt, url in formats.items()}
+            for size_name, formats in (data.get("image_variants") or {}).items()
+        }
+
+        user = request.user
+        if user.is_authenticated:
+            # 지연 import: marker_like 앱이 marker 모델을 참조하므로 순환 참조 방지
+            from apps.marker_like.models import MarkerLike
+
+            data["is_liked"] = MarkerLike.objects.filter(
+                user=user, marker_id=data["id"], is_liked=True
+            ).exists()
+        else:
+            data["is_liked"] = False
+        return data
@@ -0,0 +1,51 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.marker.serializers import MarkerExportFilterSerializer
+from apps.marker.services import MarkerExportService
+
+
+class Command(BaseCommand):
+    help = "마커 전체를 GeoJSON 또는 CSV 로 스트리밍 내보내기 합니다. (메모리 사용량 일정)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            dest="output",
+            choices=["geojson", "csv"],
+            default="geojson",
+            help="출력 형식 (기본값: geojson)",
+        )
+        parser.add_argument("--layer", help="레이어 필터 (tour, food, infra)")
+        parser.add_argument("--region", help="주소 앞부분 일치 필터 (예: 부산광역시)")
+        parser.add_argument("--bbox", help="영역 필터 'min_lng,min_lat,max_lng,max_lat'")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--output", dest="path", help="저장할 파일 경로 (생략 시 stdout)")
+
+    def handle(self, *args, **options):
+        params = {
+            key: options[key]
+            for key in ("output", "layer", "region", "bbox", "chunk_size")
+            if options[key] is not None
+        }
+        serializer = MarkerExportFilterSerializer(data=params)
+        if not serializer.is_valid():
+            raise CommandError(serializer.errors)
+        filters = serializer.validated_data
+
+        chunks = MarkerExportService.iter_export(
+            filters["output"], filters, chunk_size=filters["chunk_size"]
+        )
+
+        path = options["path"]
+        out = open(path, "w", encoding="utf-8", newline="") if path else sys.stdout
+        try:
+            for chunk in chunks:
+                out.write(chunk)
+        finally:
+            if path:
+                out.close()
+
+        if path:
+            self.stderr.write(self.style.SUCCESS(f"내보내기 완료: {path}"))
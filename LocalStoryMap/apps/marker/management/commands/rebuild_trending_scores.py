@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.marker.models import Marker
+from apps.marker.services import MarkerTrendingService
+from apps.marker_like.models import MarkerLike
+from apps.story.models import StoryLike
+
+
+class Command(BaseCommand):
+    help = "기존 좋아요 이력으로 마커 트렌딩 점수를 처음부터 다시 계산합니다. (최초 도입/가중치 변경 시 1회용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        weights = settings.TRENDING_EVENT_WEIGHTS
+        scores: dict[int, float] = {}
+
+        def add(marker_id, weight, occurred_at):
+            value = MarkerTrendingService.event_value(weight, occurred_at)
+            if marker_id in scores:
+                value = MarkerTrendingService.combine(scores[marker_id], value)
+            scores[marker_id] = value
+
+        # 스토리 조회수는 시각 정보가 없으므로 백필 대상에서 제외 (이후 조회부터 증분 반영)
+        marker_likes = MarkerLike.objects.filter(is_liked=True).values_list(
+            "marker_id", "created_at"
+        )
+        for marker_id, created_at in marker_likes.iterator(chunk_size=batch_size):
+            add(marker_id, weights["marker_like"], created_at)
+
+        story_likes = StoryLike.objects.filter(story__is_deleted=False).values_list(
+            "story__marker_id", "created_at"
+        )
+        for marker_id, created_at in story_likes.iterator(chunk_size=batch_size):
+            add(marker_id, weights["story_like"], created_at)
+
+        # 이벤트가 없는 마커는 기본값으로 초기화
+        Marker.objects.exclude(pk__in=scores.keys()).update(trending_score=0.0)
+
+        pending = []
+        for marker_id, score in scores.items():
+            pending.append(Marker(pk=marker_id, trending_score=score))
+            if len(pending) >= batch_size:
+                Marker.objects.bulk_update(pending, ["trending_score"])
+                pending = []
+        if pending:
+            Marker.objects.bulk_update(pending, ["trending_score"])
+
+        self.stdout.write(self.style.SUCCESS(f"트렌딩 점수 재계산 완료: {len(scores)}개 마커"))
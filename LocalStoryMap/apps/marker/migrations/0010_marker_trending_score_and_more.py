@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-19 14:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marker", "0009_alter_marker_image"),
+        ("story", "0004_commentlike_like_count_storylike_like_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="marker",
+            name="trending_score",
+            field=models.FloatField(default=0.0, verbose_name="트렌딩 점수(로그 스케일)"),
+        ),
+        migrations.AddIndex(
+            model_name="marker",
+            index=models.Index(
+                fields=["layer", "-trending_score"], name="markers_layer_trending_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="marker",
+            index=models.Index(fields=["-trending_score"], name="markers_trending_idx"),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-19 14:47
+
+from django.db import migrations, models
+
+import apps.images.fields
+import apps.marker.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marker", "0010_marker_trending_score_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="marker",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, verbose_name="마커 이미지 변형"),
+        ),
+        migrations.AlterField(
+            model_name="marker",
+            name="image",
+            field=apps.images.fields.ContentAddressedImageField(
+                blank=True,
+                null=True,
+                storage=apps.marker.models.select_marker_storage,
+                upload_to="markers/",
+                verbose_name="마커 이미지",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-19 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("marker", "0011_marker_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="marker",
+            name="summary_source_hash",
+            field=models.CharField(
+                blank=True, default="", max_length=64, verbose_name="요약 원문 해시"
+            ),
+        ),
+    ]
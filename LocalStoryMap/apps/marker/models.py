@@ -4,6 +4,8 @@ from django.db import models
 from django.db.models import F
 from storages.backends.s3boto3 import S3Boto3Storage
 
+from apps.images.fields import ContentAddressedImageField
+
 
 def select_marker_storage():
     if getattr(settings, "USE_S3_STORAGE", False):
@@ -25,6 +27,13 @@ class Marker(models.Model):
         verbose_name="마커명",
     )
     summary_text = models.TextField(blank=True, null=True, verbose_name="요약문")
+    # summary_text 를 만든 입력(설명)의 요약 캐시 키 — 설명이 바뀌면 달라짐 (summarize_markers 참고)
+    summary_source_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        verbose_name="요약 원문 해시",
+    )
     adress = models.TextField(
         blank=True,
         null=True,
@@ -35,13 +44,20 @@ class Marker(models.Model):
         null=True,
         verbose_name="마커 설명",
     )
-    image = models.ImageField(
-        upload_to="markers/",  # 업로드될 경로 S3 추후 적용
+    # 내용 해시 기반 키로 저장 (같은 이미지는 한 번만 업로드, apps.images.fields 참고)
+    image = ContentAddressedImageField(
+        upload_to="markers/",
         storage=select_marker_storage,
         blank=True,
         null=True,
         verbose_name="마커 이미지",
     )
+    # 썸네일/카드/원본 크기 변형 이미지 경로 (apps.images.services.ImageVariantService 참고)
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="마커 이미지 변형",
+    )
     latitude = models.DecimalField(
         max_digits=10,
         decimal_places=7,
@@ -72,12 +88,25 @@ class Marker(models.Model):
         default=0,
         verbose_name="마커 좋아요 수",
     )
+    # ln(Σ 가중치 × 2^((이벤트시각 - 기준시각) / 반감기)) 값
+    # 모든 마커가 같은 비율로 감쇠하므로 이 값의 순서 = 현재 시점의 감쇠 점수 순서
+    trending_score = models.FloatField(
+        default=0.0,
+        verbose_name="트렌딩 점수(로그 스케일)",
+    )
 
     class Meta:
         db_table = "markers"
         verbose_name = "마커"
         verbose_name_plural = "마커들"
         ordering = ["-created_at"]
+        indexes = [
+            # 레이어별 트렌딩 상위 N개 조회용
+            models.Index(
+                fields=["layer", "-trending_score"], name="markers_layer_trending_idx"
+            ),
+            models.Index(fields=["-trending_score"], name="markers_trending_idx"),
+        ]
 
     def __str__(self):
         return self.marker_name
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from apps.images.serializers import ImageVariantSerializerMixin
+
 from .models import Marker
 
 
-class MarkerSerializer(serializers.ModelSerializer):
+class MarkerSerializer(ImageVariantSerializerMixin, serializers.ModelSerializer):
     is_liked = serializers.SerializerMethodField()
 
     class Meta:
@@ -14,6 +16,8 @@ class MarkerSerializer(serializers.ModelSerializer):
             "adress",
             "description",
             "image",
+            "display_image",  # 엔드포인트에 맞는 크기의 변형 이미지
+            "image_variants",
             "latitude",
             "longitude",
             "created_at",
@@ -30,6 +34,8 @@ class MarkerSerializer(serializers.ModelSerializer):
             "coordinate",
             "like_count",
             "is_liked",
+            "display_image",
+            "image_variants",
         ]
 
     def validate_latitude(self, value):
@@ -43,7 +49,11 @@ class MarkerSerializer(serializers.ModelSerializer):
         return value
 
     def get_is_liked(self, obj):
-        user = self.context["request"].user
+        request = self.context.get("request")
+        # request 없이 직렬화하는 경우(상세 캐시 생성)에는 사용자별 값을 계산하지 않음
+        if request is None:
+            return False
+        user = request.user
         if user.is_authenticated:
             return obj.likes.filter(user=user, is_liked=True).exists()
         return False
@@ -62,7 +72,7 @@ class MarkerListFilterSerializer(serializers.Serializer):
     )
 
     def validate_sort(self, value):
-        valid_sorts = ["latest", "popular", "distance"]
+        valid_sorts = ["latest", "popular", "distance", "trending"]
         if value not in valid_sorts:
             raise serializers.ValidationError(f"유효하지 않은 정렬 옵션입니다. 가능한 값: {valid_sorts}")
         return value
@@ -91,3 +101,35 @@ class MarkerListFilterSerializer(serializers.Serializer):
         if value and value not in valid_layers:
             raise serializers.ValidationError(f"유효하지 않은 layer 값입니다. ({valid_layers})")
         return value
+
+
+class MarkerExportFilterSerializer(serializers.Serializer):
+    # 마커 전체 내보내기(export)의 쿼리 파라미터 유효성 검사를 위한 시리얼라이저.
+    # DRF 가 format 파라미터를 렌더러 선택에 사용하므로 출력 형식은 output 으로 받는다.
+    output = serializers.ChoiceField(
+        choices=["geojson", "csv"], required=False, default="geojson"
+    )
+    layer = serializers.CharField(required=False, max_length=20)
+    region = serializers.CharField(required=False, max_length=100)
+    bbox = serializers.CharField(required=False)
+    chunk_size = serializers.IntegerField(
+        required=False, default=2000, min_value=100, max_value=10000
+    )
+
+    def validate_layer(self, value):
+        valid_layers = ["tour", "food", "infra"]
+        if value and value not in valid_layers:
+            raise serializers.ValidationError(f"유효하지 않은 layer 값입니다. ({valid_layers})")
+        return value
+
+    def validate_bbox(self, value):
+        # "min_lng,min_lat,max_lng,max_lat" 형식
+        try:
+            min_lng, min_lat, max_lng, max_lat = (float(v) for v in value.split(","))
+        except ValueError:
+            raise serializers.ValidationError(
+                "bbox는 'min_lng,min_lat,max_lng,max_lat' 형식이어야 합니다."
+            )
+        if min_lng > max_lng or min_lat > max_lat:
+            raise serializers.ValidationError("bbox의 최소값이 최대값보다 클 수 없습니다.")
+        return (min_lng, min_lat, max_lng, max_lat)
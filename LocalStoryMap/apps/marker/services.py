@@ -1,12 +1,21 @@
 # apps/marker/services.py
+import csv
+import json
 import math
-from typing import Any, cast
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import Any, Iterator, Optional, Union, cast
 
+from django.conf import settings
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import F, Q, QuerySet, Value
+from django.db.models.functions import Abs, Exp, Greatest, Ln
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from haversine import Unit, haversine
 
+from config.streaming import EchoBuffer
+
 from .models import Marker
 from .serializers import MarkerSerializer
 
@@ -40,10 +49,16 @@ class MarkerService:
         if story_id := filters.get("story_id"):
             queryset = queryset.filter(story_id=story_id)
 
+        # 페이지네이션 대상: 파이썬에서 거르거나 정렬한 리스트, 또는 쿼리셋 그대로
+        target_list: Union[list[Marker], QuerySet[Marker]]
+
         # 정렬 옵션 처리
         sort_option = filters.get("sort", "latest")
         if sort_option == "popular":
             queryset = queryset.order_by("-like_count", "-id")
+        elif sort_option == "trending":
+            # (layer, -trending_score) 인덱스를 타는 정렬
+            queryset = queryset.order_by("-trending_score", "-id")
         elif sort_option == "latest":
             queryset = queryset.order_by("-id")
         elif sort_option == "distance":
@@ -97,13 +112,13 @@ class MarkerService:
             target_list = final_markers
         else:
             # 위치 필터가 없으면 전체 쿼리셋을 대상으로 함
-            target_list = list(queryset)
+            target_list = queryset
 
-        # 페이지네이션
+        # 페이지네이션 (쿼리셋은 LIMIT/OFFSET 으로 필요한 페이지만 조회)
         if sort_option == "distance":
             paginator = Paginator(target_list, limit)
         else:
-            paginator = Paginator(list(queryset), limit)
+            paginator = Paginator(queryset, limit)
         page_obj = paginator.get_page(page)
 
         return {
@@ -136,3 +151,144 @@ class MarkerService:
     def delete_marker(marker: Marker) -> None:
         # 마커 삭제
         marker.delete()
+
+
+class MarkerTrendingService:
+    # 시간 감쇠 트렌딩 점수를 이벤트가 들어올 때마다 증분 갱신
+    # 점수는 로그 스케일로 저장: ln(Σ w × 2^((t - EPOCH) / 반감기))
+    # → 새 이벤트는 logaddexp 로 더하기만 하면 되고, 재계산이나 주기적 감쇠 배치가 필요 없음
+    EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+    @staticmethod
+    def event_value(weight: float, occurred_at: Optional[datetime] = None) -> float:
+        # 이벤트 하나의 로그 스케일 기여값
+        occurred_at = occurred_at or timezone.now()
+        half_life_seconds = settings.TRENDING_HALF_LIFE_HOURS * 3600
+        elapsed = (occurred_at - MarkerTrendingService.EPOCH).total_seconds()
+        return math.log(weight) + elapsed / half_life_seconds * math.log(2)
+
+    @staticmethod
+    def combine(current: float, value: float) -> float:
+        # 파이썬 쪽 logaddexp (백필 명령에서 사용)
+        high, low = max(current, value), min(current, value)
+        return high + math.log1p(math.exp(low - high))
+
+    @staticmethod
+    def record_event(
+        marker_id: Optional[int], event: str, occurred_at: Optional[datetime] = None
+    ) -> None:
+        # event: settings.TRENDING_EVENT_WEIGHTS 의 키 (marker_like, story_like, story_view)
+        weight = settings.TRENDING_EVENT_WEIGHTS.get(event)
+        if not weight or marker_id is None:
+            return
+
+        value = Value(MarkerTrendingService.event_value(weight, occurred_at))
+        current = F("trending_score")
+        # logaddexp(a, b) = max(a, b) + ln(1 + e^-|a - b|) 를 단일 UPDATE 로 원자적으로 누적
+        Marker.objects.filter(pk=marker_id).update(
+            trending_score=Greatest(current, value)
+            + Ln(Value(1.0) + Exp(Abs(current - value) * Value(-1.0)))
+        )
+
+    @staticmethod
+    def top_trending(layer: Optional[str] = None, limit: int = 20):
+        # 레이어별 트렌딩 상위 N개 (인덱스 범위 스캔)
+        queryset = Marker.objects.all()
+        if layer:
+            queryset = queryset.filter(layer=layer)
+        return queryset.order_by("-trending_score", "-id")[:limit]
+
+
+class MarkerExportService:
+    # 파트너 제공용 전체 마커 내보내기 (GeoJSON / CSV 스트리밍)
+    EXPORT_FIELDS = [
+        "id",
+        "marker_name",
+        "adress",
+        "description",
+        "summary_text",
+        "layer",
+        "like_count",
+        "latitude",
+        "longitude",
+        "image",
+        "created_at",
+        "updated_at",
+    ]
+    DEFAULT_CHUNK_SIZE = 2000
+
+    @staticmethod
+    def get_export_queryset(filters: dict):
+        # 모델 인스턴스를 만들지 않도록 values()로 필요한 컬럼만 조회, PK 순으로 고정 정렬
+        queryset = Marker.objects.order_by("id")
+
+        if layer := filters.get("layer"):
+            queryset = queryset.filter(layer=layer)
+
+        # 지역 필터: 주소 앞부분 일치 (예: "부산광역시", "부산광역시 해운대구")
+        if region := filters.get("region"):
+            queryset = queryset.filter(adress__startswith=region)
+
+        # 영역 필터: (min_lng, min_lat, max_lng, max_lat)
+        if bbox := filters.get("bbox"):
+            min_lng, min_lat, max_lng, max_lat = bbox
+            queryset = queryset.filter(
+                latitude__range=(min_lat, max_lat),
+                longitude__range=(min_lng, max_lng),
+            )
+
+        return queryset.values(*MarkerExportService.EXPORT_FIELDS)
+
+    @staticmethod
+    def _iter_rows(filters: dict, chunk_size: int) -> Iterator[dict]:
+        # iterator(chunk_size)는 PostgreSQL에서 서버사이드 커서를 사용하므로 테이블 크기와 무관하게 메모리 일정
+        storage = Marker._meta.get_field("image").storage
+        rows = MarkerExportService.get_export_queryset(filters).iterator(
+            chunk_size=chunk_size
+        )
+        for row in rows:
+            row["image"] = storage.url(row["image"]) if row["image"] else None
+            row["latitude"] = float(row["latitude"])
+            row["longitude"] = float(row["longitude"])
+            row["created_at"] = row["created_at"].isoformat()
+            row["updated_at"] = row["updated_at"].isoformat()
+            yield row
+
+    @staticmethod
+    def iter_geojson(
+        filters: dict, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[str]:
+        # FeatureCollection 을 Feature 단위로 조금씩 인코딩해서 흘려보냄
+        yield '{"type": "FeatureCollection", "features": ['
+        separator = ""
+        for row in MarkerExportService._iter_rows(filters, chunk_size):
+            longitude = row.pop("longitude")
+            latitude = row.pop("latitude")
+            feature = {
+                "type": "Feature",
+                "id": row["id"],
+                # GeoJSON 좌표 순서는 [경도, 위도]
+                "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+                "properties": row,
+            }
+            yield separator + json.dumps(feature, ensure_ascii=False)
+            separator = ","
+        yield "]}"
+
+    @staticmethod
+    def iter_csv(filters: dict, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        writer = csv.DictWriter(
+            EchoBuffer(), fieldnames=MarkerExportService.EXPORT_FIELDS
+        )
+        # 엑셀에서 한글이 깨지지 않도록 BOM 을 먼저 씀
+        yield "\ufeff" + writer.writeheader()
+        for row in MarkerExportService._iter_rows(filters, chunk_size):
+            yield writer.writerow(row)
+
+    @staticmethod
+    def iter_export(
+        export_format: str, filters: dict, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[str]:
+        if export_format == "csv":
+            return MarkerExportService.iter_csv(filters, chunk_size)
+        return MarkerExportService.iter_geojson(filters, chunk_size)
@@ -0,0 +1,24 @@
+# apps/marker/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.images.services import ImageVariantService
+
+from .cache import MarkerDetailCache
+from .models import Marker
+
+
+@receiver(post_save, sender=Marker)
+@receiver(post_delete, sender=Marker)
+def invalidate_marker_detail_cache(sender, instance, **kwargs):
+    # 저장/삭제/좋아요 수 변경(increment_like_count 의 save) 시 상세 캐시 무효화
+    # 커밋 이후에 버전을 올려야 다른 워커가 커밋 전 데이터로 캐시를 다시 채우지 않음
+    marker_id = instance.pk
+    transaction.on_commit(lambda: MarkerDetailCache.invalidate(marker_id))
+
+
+@receiver(post_save, sender=Marker)
+def schedule_marker_image_variants(sender, instance, **kwargs):
+    # 업로드/CSV 임포트로 이미지가 바뀌면 썸네일 등 변형 이미지를 백그라운드에서 생성
+    ImageVariantService.schedule(instance, "image")
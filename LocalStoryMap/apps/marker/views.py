@@ -1,11 +1,20 @@
 # apps/marker/views.py
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 
+from config.streaming import iterate_in_thread
+
+from .cache import MarkerDetailCache
 from .models import Marker
-from .serializers import MarkerListFilterSerializer, MarkerSerializer
-from .services import MarkerService
+from .serializers import (
+    MarkerExportFilterSerializer,
+    MarkerListFilterSerializer,
+    MarkerSerializer,
+)
+from .services import MarkerExportService, MarkerService
 
 
 class MarkerViewSet(viewsets.ViewSet):
@@ -27,7 +36,9 @@ class MarkerViewSet(viewsets.ViewSet):
         )
 
         serialized_data = MarkerSerializer(
-            result["markers"], many=True, context={"request": request}
+            result["markers"],
+            many=True,
+            context={"request": request, "image_variant": "thumb"},  # 목록은 썸네일
         ).data
 
         return Response(
@@ -48,10 +59,9 @@ class MarkerViewSet(viewsets.ViewSet):
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
     def retrieve(self, request, pk=None):
-        # GET /markers/{marker_id}: 특정 마커 조회
-        marker = MarkerService.get_marker(marker_id=pk)
-        serializer = MarkerSerializer(marker, context={"request": request})
-        return Response(serializer.data)
+        # GET /markers/{marker_id}: 특정 마커 조회 (공통 데이터는 캐시, is_liked 는 요청마다 계산)
+        data = MarkerDetailCache.get(marker_id=pk)
+        return Response(MarkerDetailCache.personalize(data, request))
 
     def update(self, request, pk=None):
         # PUT /markers/{marker_id}: 특정 마커 수정
@@ -70,3 +80,33 @@ class MarkerViewSet(viewsets.ViewSet):
         marker = MarkerService.get_marker(marker_id=pk)
         MarkerService.delete_marker(marker=marker)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        permission_classes=[IsAdminUser],
+    )
+    def export(self, request):
+        # GET /markers/export?output=geojson|csv: 전체 마커 스트리밍 내보내기 (파트너 제공용)
+        # 전체 테이블을 내려주므로 관리자만 호출 가능 (파트너에게는 export_markers 커맨드 결과를 전달)
+        filter_serializer = MarkerExportFilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+        filters = filter_serializer.validated_data
+        export_format = filters["output"]
+
+        chunks = MarkerExportService.iter_export(
+            export_format, filters, chunk_size=filters["chunk_size"]
+        )
+        if export_format == "csv":
+            content_type = "text/csv; charset=utf-8"
+            filename = "markers.csv"
+        else:
+            content_type = "application/geo+json; charset=utf-8"
+            filename = "markers.geojson"
+
+        response = StreamingHttpResponse(
+            iterate_in_thread(chunks), content_type=content_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
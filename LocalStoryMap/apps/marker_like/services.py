@@ -3,6 +3,7 @@ from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from apps.marker.models import Marker
+from apps.marker.services import MarkerTrendingService
 
 from .models import MarkerLike
 
@@ -34,6 +35,8 @@ class MarkerLikeService:
         if created:
             # 새로 좋아요 생성
             marker.increment_like_count()
+            # 트렌딩 점수는 최초 좋아요만 반영 (토글 반복으로 점수를 부풀리지 못하도록)
+            MarkerTrendingService.record_event(marker.id, "marker_like")
             action = "added"
         else:
             # 기존 좋아요 토글
@@ -2,6 +2,7 @@ import logging
 from typing import Any, cast
 
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import permissions, status
@@ -11,9 +12,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.users.models import User
+from config.streaming import iterate_in_thread
 
 from .models import PaymentHistory
-from .serializers import PaymentHistorySerializer
+from .serializers import PaymentHistoryExportFilterSerializer, PaymentHistorySerializer
+from .services import PaymentHistoryExportService
 
 logger = logging.getLogger(__name__)
 
@@ -163,3 +166,41 @@ class PaymentHistoryDetailAPIView(RetrieveAPIView, DestroyAPIView):
                 {"error": "결제 이력을 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+
+
+class PaymentHistoryExportAPIView(APIView):
+    """정산용 결제 이력 CSV 내보내기 (관리자 전용)"""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_summary="결제 이력 CSV 내보내기 (관리자)",
+        operation_description=(
+            "기간(결제 이력 생성일 기준) 안의 전체 사용자 결제 이력을 CSV 로 스트리밍합니다. "
+            "행 수와 관계없이 서버 메모리 사용량이 일정합니다."
+        ),
+        query_serializer=PaymentHistoryExportFilterSerializer,
+        responses={
+            200: openapi.Response(description="CSV 파일 (text/csv)"),
+            400: "잘못된 쿼리 파라미터",
+            403: "관리자가 아님",
+        },
+        tags=["결제 이력"],
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        """결제 이력 CSV 스트리밍"""
+        filter_serializer = PaymentHistoryExportFilterSerializer(
+            data=request.query_params
+        )
+        filter_serializer.is_valid(raise_exception=True)
+        filters = filter_serializer.validated_data
+
+        chunks = PaymentHistoryExportService.iter_csv(
+            filters, chunk_size=filters["chunk_size"]
+        )
+        response = StreamingHttpResponse(
+            iterate_in_thread(chunks), content_type="text/csv; charset=utf-8"
+        )
+        filename = f"payment_histories_{filters['since']}_{filters['until']}.csv"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
@@ -0,0 +1,56 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.paymenthistory.serializers import PaymentHistoryExportFilterSerializer
+from apps.paymenthistory.services import PaymentHistoryExportService
+
+
+class Command(BaseCommand):
+    help = "정산용으로 기간 안의 전체 결제 이력을 CSV 로 스트리밍 내보내기 합니다. (메모리 사용량 일정)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", required=True, help="시작일 YYYY-MM-DD")
+        parser.add_argument("--until", help="종료일 YYYY-MM-DD, 당일 포함 (기본값: 오늘)")
+        parser.add_argument("--status", help="결제 상태 필터 (paid, cancelled, failed)")
+        parser.add_argument(
+            "--exclude-deleted",
+            dest="include_deleted",
+            action="store_false",
+            help="소프트 삭제된 결제 이력 제외 (기본값: 포함)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--output", dest="path", help="저장할 파일 경로 (생략 시 stdout)")
+
+    def handle(self, *args, **options):
+        params = {
+            key: options[key]
+            for key in ("since", "until", "status", "include_deleted", "chunk_size")
+            if options[key] is not None
+        }
+        serializer = PaymentHistoryExportFilterSerializer(data=params)
+        if not serializer.is_valid():
+            raise CommandError(serializer.errors)
+        filters = serializer.validated_data
+
+        chunks = PaymentHistoryExportService.iter_csv(
+            filters, chunk_size=filters["chunk_size"]
+        )
+
+        path = options["path"]
+        out = open(path, "w", encoding="utf-8", newline="") if path else sys.stdout
+        rows = -1  # 헤더 제외
+        try:
+            for chunk in chunks:
+                out.write(chunk)
+                rows += 1
+        finally:
+            if path:
+                out.close()
+
+        if path:
+            self.stderr.write(
+                self.style.SUCCESS(
+                    f"내보내기 완료: {path} ({filters['since']} ~ {filters['until']}, {rows}건)"
+                )
+            )
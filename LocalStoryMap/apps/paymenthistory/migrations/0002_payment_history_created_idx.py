@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 15:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("paymenthistory", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="paymenthistory",
+            index=models.Index(
+                fields=["created_at"], name="payment_history_created_idx"
+            ),
+        ),
+    ]
@@ -55,6 +55,10 @@ class PaymentHistory(models.Model):
         ordering = ["-created_at"]
         verbose_name = "결제 이력"
         verbose_name_plural = "결제 이력 목록"
+        indexes = [
+            # 정산 내보내기/결제 대조가 기간(created_at) 범위로 읽음
+            models.Index(fields=["created_at"], name="payment_history_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user.email} - {self.imp_uid} ({self.amount}원)"
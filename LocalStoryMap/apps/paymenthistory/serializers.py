@@ -1,6 +1,7 @@
+from django.utils import timezone
 from rest_framework import serializers
 
-from .models import PaymentHistory
+from .models import PaymentHistory, PaymentStatus
 
 
 class PaymentHistorySerializer(serializers.ModelSerializer):
@@ -44,3 +45,25 @@ class PaymentHistorySerializer(serializers.ModelSerializer):
             "updated_at",
             "is_delete",
         ]
+
+
+class PaymentHistoryExportFilterSerializer(serializers.Serializer):
+    """정산용 결제 이력 내보내기(export) 쿼리 파라미터 유효성 검사"""
+
+    since = serializers.DateField(help_text="시작일 (YYYY-MM-DD)")
+    until = serializers.DateField(
+        required=False, help_text="종료일 (YYYY-MM-DD, 당일 포함, 기본값: 오늘)"
+    )
+    status = serializers.ChoiceField(
+        choices=[status.value for status in PaymentStatus], required=False
+    )
+    include_deleted = serializers.BooleanField(required=False, default=True)
+    chunk_size = serializers.IntegerField(
+        required=False, default=2000, min_value=100, max_value=10000
+    )
+
+    def validate(self, attrs):
+        attrs.setdefault("until", timezone.localdate())
+        if attrs["until"] < attrs["since"]:
+            raise serializers.ValidationError("until 은 since 이후여야 합니다.")
+        return attrs
@@ -1,12 +1,22 @@
 from django.urls import path
 
-from .apis import PaymentHistoryDetailAPIView, PaymentHistoryListAPIView
+from .apis import (
+    PaymentHistoryDetailAPIView,
+    PaymentHistoryExportAPIView,
+    PaymentHistoryListAPIView,
+)
 
 app_name = "paymenthistory"
 
 urlpatterns = [
     # 결제 이력 목록 조회
     path("", PaymentHistoryListAPIView.as_view(), name="payment_history_list"),
+    # 정산용 전체 결제 이력 CSV 내보내기 (관리자 전용)
+    path(
+        "export/",
+        PaymentHistoryExportAPIView.as_view(),
+        name="payment-history-export",
+    ),
     # 결제 이력 상세 조회 및 삭제
     path(
         "<int:payment_id>/",
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class RouteConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.route"
+
+    def ready(self):
+        # 경로 형상 재계산 시그널 등록
+        from . import signals  # noqa: F401
@@ -0,0 +1,92 @@
+# apps/route/geometry.py
+# 경로 형상 계산 (DB 와 무관한 순수 함수)
+import math
+from typing import Iterable, List, Optional, Tuple
+
+from haversine import Unit, haversine
+
+Point = Tuple[float, float]  # (위도, 경도)
+
+# Google encoded polyline 정밀도 (소수점 5자리, 약 1m)
+POLYLINE_PRECISION = 5
+
+
+def leg_distances(points: List[Point], start: Optional[Point] = None) -> List[float]:
+    # 연속한 두 지점 사이 거리(m, 소수점 1자리). start 가 있으면 start → points[0] 구간부터 계산
+    if start is not None:
+        points = [start, *points]
+    return [
+        round(haversine(a, b, unit=Unit.METERS), 1) for a, b in zip(points, points[1:])
+    ]
+
+
+def bounding_box(
+    points: Iterable[Point], bbox: Optional[list] = None
+) -> Optional[list]:
+    # [min_lng, min_lat, max_lng, max_lat] (마커 export 의 bbox 필터와 같은 순서), 기존 bbox 가 있으면 확장
+    for lat, lng in points:
+        if bbox is None:
+            bbox = [lng, lat, lng, lat]
+        else:
+            bbox = [
+                min(bbox[0], lng),
+                min(bbox[1], lat),
+                max(bbox[2], lng),
+                max(bbox[3], lat),
+            ]
+    return bbox
+
+
+def _to_e5(value: float) -> int:
+    # 참조 구현(JavaScript Math.round)과 같게 .5 는 올림 (파이썬 round 는 짝수 쪽으로 반올림)
+    return math.floor(value * 10**POLYLINE_PRECISION + 0.5)
+
+
+def _encode_value(value: int) -> str:
+    value = ~(value << 1) if value < 0 else value << 1
+    chunks = []
+    while value >= 0x20:
+        chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    chunks.append(chr(value + 63))
+    return "".join(chunks)
+
+
+def encode_polyline(points: Iterable[Point], previous: Optional[Point] = None) -> str:
+    """
+    Google encoded polyline 알고리즘으로 좌표 목록을 인코딩합니다.
+    각 좌표는 직전 좌표와의 차이로 인코딩되므로, previous(기존 폴리라인의 마지막 좌표)를 주면
+    기존 문자열 뒤에 그대로 이어 붙일 수 있는 조각을 반환합니다.
+    """
+    prev_lat, prev_lng = (
+        (_to_e5(previous[0]), _to_e5(previous[1])) if previous else (0, 0)
+    )
+    encoded = []
+    for lat, lng in points:
+        lat_e5, lng_e5 = _to_e5(lat), _to_e5(lng)
+        encoded.append(_encode_value(lat_e5 - prev_lat))
+        encoded.append(_encode_value(lng_e5 - prev_lng))
+        prev_lat, prev_lng = lat_e5, lng_e5
+    return "".join(encoded)
+
+
+def decode_polyline(encoded: str) -> List[Point]:
+    factor = 10**POLYLINE_PRECISION
+    points: List[Point] = []
+    index = lat = lng = 0
+    while index < len(encoded):
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lng += deltas[1]
+        points.append((lat / factor, lng / factor))
+    return points
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from apps.route.models import Route
+from apps.route.services import RouteGeometryService
+
+
+class Command(BaseCommand):
+    help = "경로 형상(구간 거리, 총 거리, 영역, 폴리라인)을 처음부터 다시 계산합니다. (최초 도입 시 백필용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only-missing",
+            action="store_true",
+            help="형상이 한 번도 계산되지 않은 경로만 처리",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        queryset = Route.objects.order_by("pk")
+        if options["only_missing"]:
+            queryset = queryset.filter(geometry_updated_at__isnull=True)
+
+        count = 0
+        for route_id in queryset.values_list("pk", flat=True).iterator(
+            chunk_size=options["batch_size"]
+        ):
+            RouteGeometryService.recompute(route_id)
+            count += 1
+        self.stdout.write(f"경로 형상 재계산: {count}개")
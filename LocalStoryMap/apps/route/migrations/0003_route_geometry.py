@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-19 15:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("route", "0002_route_like_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="route",
+            name="bbox",
+            field=models.JSONField(
+                blank=True,
+                help_text="[min_lng, min_lat, max_lng, max_lat], 마커가 없으면 null",
+                null=True,
+                verbose_name="영역",
+            ),
+        ),
+        migrations.AddField(
+            model_name="route",
+            name="encoded_polyline",
+            field=models.TextField(
+                blank=True,
+                default="",
+                help_text="Google encoded polyline (정밀도 5)",
+                verbose_name="인코딩된 폴리라인",
+            ),
+        ),
+        migrations.AddField(
+            model_name="route",
+            name="geometry_updated_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="형상 갱신일시"),
+        ),
+        migrations.AddField(
+            model_name="route",
+            name="leg_distances",
+            field=models.JSONField(
+                default=list, help_text="연속한 두 마커 사이 직선 거리 목록 (m)", verbose_name="구간 거리"
+            ),
+        ),
+        migrations.AddField(
+            model_name="route",
+            name="total_distance",
+            field=models.FloatField(
+                default=0, help_text="구간 거리 합계 (m)", verbose_name="총 거리"
+            ),
+        ),
+    ]
@@ -36,6 +36,34 @@ class Route(models.Model):
         default=0,
         verbose_name="경로 좋아요 수",
     )
+    # ─── 순서대로 이은 마커 좌표로 미리 계산한 형상 (RouteGeometryService 가 갱신) ───
+    leg_distances = models.JSONField(
+        default=list,
+        verbose_name="구간 거리",
+        help_text="연속한 두 마커 사이 직선 거리 목록 (m)",
+    )
+    total_distance = models.FloatField(
+        default=0,
+        verbose_name="총 거리",
+        help_text="구간 거리 합계 (m)",
+    )
+    bbox = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name="영역",
+        help_text="[min_lng, min_lat, max_lng, max_lat], 마커가 없으면 null",
+    )
+    encoded_polyline = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="인코딩된 폴리라인",
+        help_text="Google encoded polyline (정밀도 5)",
+    )
+    geometry_updated_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="형상 갱신일시",
+    )
 
     class Meta:
         db_table = "routes"
@@ -112,16 +112,37 @@ class RouteWithOrderedMarkersSerializer(RouteSerializer):
             "sequence"
         )
 
-        # Marker에 sequence 정보를 추가
+        # Marker에 sequence 정보를 추가 (경로 내 마커 목록은 썸네일 사용)
+        context = {**self.context, "image_variant": "thumb"}
         markers_with_sequence = []
         for rm in ordered_route_markers:
-            marker_data = MarkerSerializer(rm.marker, context=self.context).data
+            marker_data = MarkerSerializer(rm.marker, context=context).data
             marker_data["sequence"] = rm.sequence
             markers_with_sequence.append(marker_data)
 
         return markers_with_sequence
 
 
+class RouteSummarySerializer(serializers.ModelSerializer):
+    # 마커 목록 없이 미리 계산된 형상만 담는 경로 요약 (마커 직렬화 없음, 마커 수는 COUNT 1번)
+    marker_count = serializers.IntegerField(read_only=True)  # @property 필드
+
+    class Meta:
+        model = Route
+        fields = [
+            "id",
+            "name",
+            "is_public",
+            "marker_count",
+            "total_distance",
+            "leg_distances",
+            "bbox",
+            "encoded_polyline",
+            "geometry_updated_at",
+        ]
+        read_only_fields = fields
+
+
 class RouteListFilterSerializer(serializers.Serializer):
     # 경로 목록 조회의 쿼리 파라미터 유효성 검사 시리얼라이저
     user_id = serializers.IntegerField(required=False)
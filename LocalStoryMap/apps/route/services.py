@@ -1,8 +1,13 @@
 # apps/route/services.py
 from django.core.paginator import Paginator
+from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
+from apps.route_marker.models import RouteMarker
+
+from . import geometry
 from .models import Route
 from .serializers import RouteCreateSerializer, RouteUpdateSerializer
 
@@ -61,3 +66,59 @@ class RouteService:
         if route.user != user:
             raise PermissionError("이 경로를 삭제할 권한이 없습니다.")
         route.delete()
+
+
+class RouteGeometryService:
+    # 경로 형상(구간 거리, 총 거리, 영역, 인코딩된 폴리라인)을 Route 에 미리 계산해 둠
+    # · 맨 뒤에 마커를 추가하면 기존 값에 새 구간만 이어 붙임 (extend)
+    # · 중간 삽입/삭제/순서 변경/마커 좌표 변경은 좌표 조회 1번 + UPDATE 1번으로 다시 계산 (recompute)
+
+    @staticmethod
+    def ordered_points(route_id: int) -> list:
+        # 순서대로 정렬된 마커 좌표 [(위도, 경도), ...]
+        return [
+            (float(lat), float(lng))
+            for lat, lng in RouteMarker.objects.filter(route_id=route_id)
+            .order_by("sequence")
+            .values_list("marker__latitude", "marker__longitude")
+        ]
+
+    @staticmethod
+    def recompute(route_id: int) -> None:
+        points = RouteGeometryService.ordered_points(route_id)
+        legs = geometry.leg_distances(points)
+        Route.objects.filter(pk=route_id).update(
+            leg_distances=legs,
+            total_distance=round(sum(legs), 1),
+            bbox=geometry.bounding_box(points),
+            encoded_polyline=geometry.encode_polyline(points),
+            geometry_updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def extend(route: Route, last_point, new_points: list) -> None:
+        """
+        route 맨 뒤에 new_points 가 추가된 경우, 새 구간만 계산해 기존 형상에 이어 붙입니다.
+        route 는 같은 트랜잭션에서 잠근(select_for_update) 최신 행이어야 하고,
+        last_point 는 추가 전 마지막 마커 좌표(없으면 None)입니다.
+        """
+        if route.geometry_updated_at is None:
+            # 형상이 한 번도 계산되지 않은 경로 (백필 전) → 전체 계산
+            RouteGeometryService.recompute(route.pk)
+            return
+        legs = route.leg_distances + geometry.leg_distances(
+            new_points, start=last_point
+        )
+        Route.objects.filter(pk=route.pk).update(
+            leg_distances=legs,
+            total_distance=round(sum(legs), 1),
+            bbox=geometry.bounding_box(new_points, route.bbox),
+            encoded_polyline=route.encoded_polyline
+            + geometry.encode_polyline(new_points, previous=last_point),
+            geometry_updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def schedule_recompute(route_id: int) -> None:
+        # 커밋 후 다시 계산 (같은 트랜잭션의 다른 변경까지 반영된 상태로 계산)
+        transaction.on_commit(lambda: RouteGeometryService.recompute(route_id))
@@ -0,0 +1,33 @@
+# apps/route/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.marker.models import Marker
+from apps.route_marker.models import RouteMarker
+
+from .services import RouteGeometryService
+
+
+@receiver(post_save, sender=RouteMarker)
+@receiver(post_delete, sender=RouteMarker)
+def recompute_route_geometry(sender, instance, **kwargs):
+    # 단건 추가/순서 수정/연결 해제 시 경로 형상 재계산
+    # (bulk_create/update 로 처리하는 일괄 추가·순서 변경은 RouteMarkerService 가 직접 갱신)
+    RouteGeometryService.schedule_recompute(instance.route_id)
+
+
+@receiver(post_save, sender=Marker)
+def recompute_routes_of_marker(sender, instance, created, update_fields=None, **kwargs):
+    # 마커 좌표가 바뀌면 그 마커를 지나는 경로들의 형상 재계산
+    # (좋아요 수 등 좌표와 무관한 필드만 저장한 경우는 건너뜀)
+    if created:
+        return
+    if update_fields is not None and not {"latitude", "longitude"} & set(update_fields):
+        return
+    route_ids = set(
+        RouteMarker.objects.filter(marker_id=instance.pk).values_list(
+            "route_id", flat=True
+        )
+    )
+    for route_id in route_ids:
+        RouteGeometryService.schedule_recompute(route_id)
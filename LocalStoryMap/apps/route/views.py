@@ -1,5 +1,6 @@
 # apps/route/views.py
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
@@ -8,9 +9,10 @@ from .models import Route
 from .serializers import (
     RouteListFilterSerializer,
     RouteSerializer,
+    RouteSummarySerializer,
     RouteWithOrderedMarkersSerializer,
 )
-from .services import RouteService
+from .services import RouteGeometryService, RouteService
 
 
 class RouteViewSet(viewsets.ViewSet):
@@ -73,6 +75,20 @@ class RouteViewSet(viewsets.ViewSet):
                 {"error": "경로를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND
             )
 
+    @action(detail=True, methods=["get"], url_path="summary")
+    def summary(self, request, pk=None):
+        # GET /routes/{route_id}/summary: 총 거리, 구간 거리, 영역, 인코딩된 폴리라인만 반환 (마커 직렬화 없음)
+        try:
+            route = RouteService.get_route(user=request.user, route_id=pk)
+            if route.geometry_updated_at is None:
+                # 형상이 한 번도 계산되지 않은 경로 (백필 전) → 지금 계산해서 응답
+                RouteGeometryService.recompute(route.pk)
+                route.refresh_from_db()
+            serializer = RouteSummarySerializer(route, context={"request": request})
+            return Response({"success": True, "data": serializer.data})
+        except PermissionError as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+
     def update(self, request, pk=None):
         # PUT /routes/{route_id}: 특정 경로 수정
         try:
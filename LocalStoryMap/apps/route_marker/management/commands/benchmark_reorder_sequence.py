@@ -0,0 +1,104 @@
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.marker.models import Marker
+from apps.route.models import Route
+from apps.route_marker.models import RouteMarker
+from apps.users.models import User
+
+
+class _Rollback(Exception):
+    pass
+
+
+class _QueryCounter:
+    # connection.execute_wrapper 용: 실행된 SQL 문 수만 셈 (쿼리 로그 상한과 무관)
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "경로 마커 수별 RouteMarker.reorder_sequence 실행 시간과 쿼리 수를 측정합니다. "
+        "(임시 데이터는 트랜잭션 롤백으로 남지 않음)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="10,100,1000",
+            help="경로당 마커 수 목록 (쉼표 구분, 기본값: 10,100,1000)",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="크기별 반복 횟수")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",")]
+        except ValueError:
+            raise CommandError("--sizes 는 쉼표로 구분한 정수여야 합니다.")
+        repeat = max(1, options["repeat"])
+
+        self.stdout.write(
+            f"{'markers':>8} {'queries':>8} {'median_ms':>10} {'max_ms':>10}"
+        )
+        for size in sizes:
+            try:
+                with transaction.atomic():
+                    queries, timings = self._measure(size, repeat)
+                    raise _Rollback
+            except _Rollback:
+                pass
+            self.stdout.write(
+                f"{size:>8} {queries:>8} {statistics.median(timings):>10.1f} "
+                f"{max(timings):>10.1f}"
+            )
+
+    @staticmethod
+    def _measure(size: int, repeat: int):
+        user = User.objects.create(
+            email=f"reorder-benchmark-{time.time_ns()}@example.com",
+            nickname="reorder-benchmark",
+        )
+        route = Route.objects.create(user=user, name=f"benchmark {size}")
+        markers = Marker.objects.bulk_create(
+            [
+                Marker(
+                    marker_name=f"benchmark {i}",
+                    latitude=Decimal("37.5"),
+                    longitude=Decimal("127.0"),
+                )
+                for i in range(size)
+            ]
+        )
+        RouteMarker.objects.bulk_create(
+            [
+                RouteMarker(route=route, marker=marker, sequence=i + 1)
+                for i, marker in enumerate(markers)
+            ]
+        )
+        ids = list(
+            RouteMarker.objects.filter(route=route)
+            .order_by("sequence")
+            .values_list("id", flat=True)
+        )
+
+        queries, timings = 0, []
+        for run in range(repeat):
+            # 매번 순서를 뒤집어 모든 행의 순서가 바뀌도록 함
+            ordered = ids if run % 2 else list(reversed(ids))
+            new_order_list = [(pk, i + 1) for i, pk in enumerate(ordered)]
+            counter = _QueryCounter()
+            with connection.execute_wrapper(counter):
+                started = time.perf_counter()
+                RouteMarker.reorder_sequence(route, new_order_list)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries = counter.count
+        return queries, timings
@@ -1,4 +1,5 @@
 from django.db import models, transaction
+from django.db.models import F
 
 
 class RouteMarker(models.Model):
@@ -41,8 +42,6 @@ class RouteMarker(models.Model):
         return f"{self.route.name} - {self.marker.marker_name} ({self.sequence})"
 
     def save(self, *args, user=None, **kwargs):
-        print(f"[DEBUG] self.route: {self.route}")
-        print(f"[DEBUG] self.route.user: {getattr(self.route, 'user', None)}")
         if user is not None:
             self.validate_user_permission(user)
         self.full_clean()
@@ -66,16 +65,26 @@ class RouteMarker(models.Model):
     def reorder_sequence(cls, route, new_order_list):
         # 경로의 마커 순서를 일괄 변경
         # new_order_list: [(route_marker_id, new_sequence), ...]
+        # 마커 수와 무관하게 잠금 조회 1번 + UPDATE 2번 (행마다 save/UPDATE 하지 않음 → 잠금 유지 시간 단축)
         with transaction.atomic():
-            existing_connections = cls.objects.select_for_update().filter(route=route)
+            locked = dict(
+                cls.objects.select_for_update()
+                .filter(route=route)
+                .values_list("id", "sequence")
+            )
+            if not locked:
+                return
 
-            temp_offset = existing_connections.count() + 10000
+            # (route, sequence) 유니크 제약을 피하려고 먼저 전체를 기존 최대값 뒤로 한 번에 밀어냄
+            temp_offset = max(locked.values()) + len(locked) + 1
+            cls.objects.filter(route=route).update(sequence=F("sequence") + temp_offset)
 
-            for conn in existing_connections:
-                conn.sequence += temp_offset
-                conn.save(update_fields=["sequence"])
-
-            for route_marker_id, new_sequence in new_order_list:
-                cls.objects.filter(id=route_marker_id, route=route).update(
-                    sequence=new_sequence
-                )
+            # 새 순서는 CASE WHEN 한 문장으로 반영 (다른 경로의 연결 id 는 무시)
+            cls.objects.bulk_update(
+                [
+                    cls(id=route_marker_id, sequence=new_sequence)
+                    for route_marker_id, new_sequence in new_order_list
+                    if route_marker_id in locked
+                ],
+                ["sequence"],
+            )
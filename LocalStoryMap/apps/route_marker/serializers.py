@@ -126,3 +126,55 @@ class RouteMarkerBulkUpdateSerializer(serializers.Serializer):
             raise serializers.ValidationError("요청된 순서 번호에 중복이 있습니다.")
 
         return attrs
+
+
+class RouteMarkerBulkCreateSerializer(serializers.Serializer):
+    # 경로에 여러 마커를 한 번에 추가하기 위한 시리얼라이저 (마커 수와 무관하게 검증 쿼리 3번)
+    MAX_MARKERS = 100
+
+    route_id = serializers.IntegerField()
+    marker_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_MARKERS,
+        help_text="추가할 마커 id 목록 (이 순서대로 경로에 들어감)",
+    )
+    position = serializers.IntegerField(
+        min_value=1,
+        required=False,
+        help_text="이 순서 번호 자리에 끼워 넣음 (기존 마커는 뒤로 밀림). 생략 시 맨 뒤에 추가",
+    )
+
+    def validate(self, attrs):
+        marker_ids = attrs["marker_ids"]
+        user = self.context["request"].user
+
+        if len(marker_ids) != len(set(marker_ids)):
+            raise serializers.ValidationError("요청된 마커 목록에 중복이 있습니다.")
+
+        try:
+            route = Route.objects.get(pk=attrs["route_id"])
+        except Route.DoesNotExist:
+            raise serializers.ValidationError("존재하지 않는 경로입니다.")
+
+        if route.user_id != user.id:
+            raise serializers.ValidationError("이 경로에 마커를 추가할 권한이 없습니다.")
+
+        missing = set(marker_ids) - set(
+            Marker.objects.filter(pk__in=marker_ids).values_list("pk", flat=True)
+        )
+        if missing:
+            raise serializers.ValidationError(f"존재하지 않는 마커가 있습니다: {sorted(missing)}")
+
+        existing = list(
+            RouteMarker.objects.filter(
+                route=route, marker_id__in=marker_ids
+            ).values_list("marker_id", flat=True)
+        )
+        if existing:
+            raise serializers.ValidationError(
+                f"이미 이 경로에 추가된 마커가 있습니다: {sorted(existing)}"
+            )
+
+        attrs["route"] = route
+        return attrs
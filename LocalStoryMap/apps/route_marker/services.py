@@ -1,7 +1,11 @@
 # apps/route_marker/services.py
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
 
+from apps.marker.models import Marker
 from apps.route.models import Route
+from apps.route.services import RouteGeometryService
 
 from .models import RouteMarker
 from .serializers import (
@@ -62,4 +66,75 @@ class RouteMarkerService:
         new_order_list = [
             (item["route_marker_id"], item["sequence"]) for item in markers_data
         ]
-        RouteMarker.reorder_sequence(route, new_order_list)
+        with transaction.atomic():
+            RouteMarker.reorder_sequence(route, new_order_list)
+            RouteGeometryService.recompute(route.pk)
+
+    @staticmethod
+    def bulk_add_markers(route: Route, marker_ids: list, position=None) -> list:
+        # 경로에 여러 마커를 순서대로 추가 (position 이 있으면 그 자리에 끼워 넣고 기존 마커를 뒤로 밂)
+        # 검증은 RouteMarkerBulkCreateSerializer 가 집합 단위로 끝낸 상태 → 저장은 bulk_create 한 번
+        count = len(marker_ids)
+        try:
+            with transaction.atomic():
+                # 같은 경로에 대한 동시 추가/순서 변경이 같은 순서 번호를 잡지 않도록 경로 행을 잠금
+                # (잠근 뒤 다시 읽은 행의 형상 값에 새 구간을 이어 붙임)
+                route = Route.objects.select_for_update().get(pk=route.pk)
+                last = (
+                    RouteMarker.objects.filter(route=route)
+                    .order_by("-sequence")
+                    .values("sequence", "marker__latitude", "marker__longitude")
+                    .first()
+                )
+                max_sequence = last["sequence"] if last else 0
+
+                if position is None or position > max_sequence:
+                    start = max_sequence + 1
+                else:
+                    start = position
+                    # (route, sequence) 유니크 제약을 피하려고 뒤쪽 마커를 최대값 뒤로 밀었다가 제자리 + count 로 당김
+                    temp_offset = max_sequence + count + 1
+                    shifted = RouteMarker.objects.filter(
+                        route=route, sequence__gte=position
+                    )
+                    shifted.update(sequence=F("sequence") + temp_offset)
+                    RouteMarker.objects.filter(
+                        route=route, sequence__gte=position + temp_offset
+                    ).update(sequence=F("sequence") - temp_offset + count)
+
+                created = RouteMarker.objects.bulk_create(
+                    [
+                        RouteMarker(
+                            route=route, marker_id=marker_id, sequence=start + i
+                        )
+                        for i, marker_id in enumerate(marker_ids)
+                    ]
+                )
+
+                if start > max_sequence:
+                    # 맨 뒤에 추가: 새 구간만 계산해 이어 붙임
+                    coordinates = {
+                        pk: (float(lat), float(lng))
+                        for pk, lat, lng in Marker.objects.filter(
+                            pk__in=marker_ids
+                        ).values_list("pk", "latitude", "longitude")
+                    }
+                    last_point = (
+                        (
+                            float(last["marker__latitude"]),
+                            float(last["marker__longitude"]),
+                        )
+                        if last
+                        else None
+                    )
+                    RouteGeometryService.extend(
+                        route,
+                        last_point,
+                        [coordinates[marker_id] for marker_id in marker_ids],
+                    )
+                else:
+                    RouteGeometryService.recompute(route.pk)
+                return created
+        except IntegrityError:
+            # 검증 이후 다른 요청이 같은 마커를 먼저 추가한 경우
+            raise ValidationError("이미 이 경로에 추가된 마커가 있습니다.")
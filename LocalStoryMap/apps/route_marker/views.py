@@ -7,6 +7,7 @@ from rest_framework.response import Response
 
 from .models import RouteMarker
 from .serializers import (
+    RouteMarkerBulkCreateSerializer,
     RouteMarkerBulkUpdateSerializer,
     RouteMarkerCreateSerializer,
     RouteMarkerSerializer,
@@ -70,6 +71,32 @@ class RouteMarkerViewSet(viewsets.ViewSet):
         except PermissionError as e:
             return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
 
+    @action(detail=False, methods=["post"], url_path="bulk-create")
+    def bulk_create(self, request):
+        # POST /api/route-markers/bulk-create: 경로에 여러 마커를 한 번에 추가
+        # {"route_id": 1, "marker_ids": [3, 7, 5], "position": 2}
+        serializer = RouteMarkerBulkCreateSerializer(
+            data=request.data, context={"request": request}
+        )
+        serializer.is_valid(raise_exception=True)
+        validated_data = serializer.validated_data
+        created = RouteMarkerService.bulk_add_markers(
+            route=validated_data["route"],
+            marker_ids=validated_data["marker_ids"],
+            position=validated_data.get("position"),
+        )
+        # 연결마다 경로/마커 전체를 직렬화하지 않고 생성된 연결 정보만 반환
+        return Response(
+            {
+                "route_id": validated_data["route"].pk,
+                "route_markers": [
+                    {"id": rm.pk, "marker_id": rm.marker_id, "sequence": rm.sequence}
+                    for rm in created
+                ],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
     @action(detail=False, methods=["put"], url_path="bulk-update")
     def bulk_update(self, request):
         serializer = RouteMarkerBulkUpdateSerializer(
@@ -8,6 +8,7 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.marker.services import MarkerTrendingService
 from apps.story.models import CommentLike, Story, StoryComment, StoryLike
 from apps.story.serializers import (
     BasicStorySerializer,
@@ -16,6 +17,7 @@ from apps.story.serializers import (
     FullStorySerializer,
     StoryLikeSerializer,
 )
+from apps.subscribes.services.entitlement import EntitlementService
 
 
 class StoryAPIView(APIView):
@@ -26,11 +28,8 @@ class StoryAPIView(APIView):
 
     def get_serializer_class(self):
         user = self.request.user
-        # 인증되지 않은 사용자 처리
-        if not user or not user.is_authenticated:
-            return BasicStorySerializer
-        # is_paid_user로 구독 여부 체크
-        if getattr(user, "is_paid_user", False):
+        # 캐시된 구독 만료 시각으로 구독 여부 체크 (비로그인 사용자는 비구독자)
+        if EntitlementService.is_paid(user):
             return FullStorySerializer
         return BasicStorySerializer
 
@@ -76,7 +75,7 @@ class StoryAPIView(APIView):
         tags=["스토리"],
     )
     def post(self, request, *args, **kwargs):
-        # is_paid_user=True인 경우만 이 메서드에 진입합니다.
+        # 구독자인 경우만 이 메서드에 진입합니다.
         serializer = FullStorySerializer(
             data=request.data, context={"request": request}
         )
@@ -92,8 +91,8 @@ class MyStoryListAPIView(APIView):
 
     def get_serializer_class(self):
         user = self.request.user
-        # is_paid_user로 구독 여부 체크
-        if getattr(user, "is_paid_user", False):
+        # 캐시된 구독 만료 시각으로 구독 여부 체크 (비로그인 사용자는 비구독자)
+        if EntitlementService.is_paid(user):
             return FullStorySerializer
         return BasicStorySerializer
 
@@ -140,10 +139,8 @@ class MarkerStoryListAPIView(APIView):
 
     def get_serializer_class(self):
         user = self.request.user
-        # 인증되지 않은 사용자 처리
-        if not user or not user.is_authenticated:
-            return BasicStorySerializer
-        if getattr(user, "is_paid_user", False):
+        # 캐시된 구독 만료 시각으로 구독 여부 체크 (비로그인 사용자는 비구독자)
+        if EntitlementService.is_paid(user):
             return FullStorySerializer
         return BasicStorySerializer
 
@@ -177,10 +174,8 @@ class StoryDetailAPIView(APIView):
 
     def get_serializer_class(self):
         user = self.request.user
-        # 인증되지 않은 사용자 처리
-        if not user or not user.is_authenticated:
-            return BasicStorySerializer
-        if getattr(user, "is_paid_user", False):
+        # 캐시된 구독 만료 시각으로 구독 여부 체크 (비로그인 사용자는 비구독자)
+        if EntitlementService.is_paid(user):
             return FullStorySerializer
         return BasicStorySerializer
 
@@ -203,6 +198,7 @@ class StoryDetailAPIView(APIView):
         if increase_view:
             story.view_count += 1
             story.save(update_fields=["view_count"])
+            MarkerTrendingService.record_event(story.marker_id, "story_view")
         SerializerClass = self.get_serializer_class()
         serializer = SerializerClass(story, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -387,6 +383,7 @@ class StoryLikeAPIView(APIView):
         # like_count 동기화
         story.like_count += 1
         story.save(update_fields=["like_count"])
+        MarkerTrendingService.record_event(story.marker_id, "story_like")
 
         serializer = StoryLikeSerializer(story_like)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
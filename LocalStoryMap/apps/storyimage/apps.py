@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class StoryimageConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.storyimage"
+
+    def ready(self):
+        # 이미지 변형 생성 시그널 등록
+        from . import signals  # noqa: F401
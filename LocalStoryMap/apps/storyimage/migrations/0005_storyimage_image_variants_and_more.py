@@ -0,0 +1,27 @@
+# Generated by Django 5.2.1 on 2026-10-19 14:47
+
+from django.db import migrations, models
+
+import apps.images.storage
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("storyimage", "0004_alter_storyimage_image_file"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="storyimage",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name="storyimage",
+            name="image_file",
+            field=models.ImageField(
+                storage=apps.images.storage.select_s3_storage,
+                upload_to="story_images/%Y/%m/%d/",
+            ),
+        ),
+    ]
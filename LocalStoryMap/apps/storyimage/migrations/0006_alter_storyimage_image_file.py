@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-19 14:51
+
+from django.db import migrations, models
+
+import apps.images.fields
+import apps.images.storage
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("storyimage", "0005_storyimage_image_variants_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="storyimage",
+            name="image_file",
+            field=apps.images.fields.ContentAddressedImageField(
+                storage=apps.images.storage.select_s3_storage,
+                upload_to="story_images/%Y/%m/%d/",
+            ),
+        ),
+        migrations.AddField(
+            model_name="storyimage",
+            name="upload_key",
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+    ]
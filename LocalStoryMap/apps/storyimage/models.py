@@ -1,12 +1,11 @@
 from django.conf import settings
 from django.db import models
-from storages.backends.s3boto3 import S3Boto3Storage
 
+from apps.images.fields import ContentAddressedImageField
+from apps.images.storage import select_s3_storage
 from apps.story.models import Story
 from apps.users.models import User
 
-s3_storage = S3Boto3Storage()
-
 
 class StoryImage(models.Model):
     image_id = models.BigAutoField(primary_key=True)
@@ -14,10 +13,15 @@ class StoryImage(models.Model):
     story = models.ForeignKey(
         Story, on_delete=models.CASCADE, related_name="storyimages"
     )
-    image_file = models.ImageField(
+    # 내용 해시 기반 키로 저장 (같은 이미지는 한 번만 업로드, apps.images.fields 참고)
+    image_file = ContentAddressedImageField(
         upload_to="story_images/%Y/%m/%d/",
-        storage=s3_storage,
+        storage=select_s3_storage,
     )
+    # 썸네일/카드/원본 크기 변형 이미지 경로 (apps.images.services.ImageVariantService 참고)
+    image_variants = models.JSONField(default=dict, blank=True)
+    # 직접 업로드(presigned)로 올라온 원래 키, 같은 업로드의 확인 요청을 한 번만 처리하는 데 사용
+    upload_key = models.CharField(max_length=255, null=True, blank=True, unique=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -1,11 +1,17 @@
 from rest_framework import serializers
 
+from apps.images.serializers import ImageVariantSerializerMixin
 from apps.story.models import Story
 
 from .models import StoryImage
+from .services import UPLOAD_CONTENT_TYPES
 
 
-class ImageSerializer(serializers.ModelSerializer):
+class ImageSerializer(ImageVariantSerializerMixin, serializers.ModelSerializer):
+    # 이미지 변형: 스토리 화면은 카드 크기를 기본으로 사용
+    image_field_name = "image_file"
+    default_image_variant = "card"
+
     # story_id 필드에 타입 애너테이션을 추가하고, 직접 import한 Story 모델을 사용
     story_id: serializers.PrimaryKeyRelatedField = serializers.PrimaryKeyRelatedField(
         source="story",
@@ -16,8 +22,21 @@ class ImageSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = StoryImage
-        fields = ["image_id", "story_id", "image_file", "image_url", "uploaded_at"]
-        read_only_fields = ["image_id", "uploaded_at"]
+        fields = [
+            "image_id",
+            "story_id",
+            "image_file",
+            "image_url",
+            "display_image",
+            "image_variants",
+            "uploaded_at",
+        ]
+        read_only_fields = [
+            "image_id",
+            "uploaded_at",
+            "display_image",
+            "image_variants",
+        ]
 
     def get_image_url(self, obj):
         request = self.context.get("request")
@@ -30,3 +49,13 @@ class ImageSerializer(serializers.ModelSerializer):
         print("🔥 user:", request.user)  # 로그 확인
         validated_data["user"] = request.user
         return super().create(validated_data)
+
+
+class StoryImageUploadRequestSerializer(serializers.Serializer):
+    content_type = serializers.ChoiceField(choices=list(UPLOAD_CONTENT_TYPES.keys()))
+    # POST 는 스토리지에서 크기 제한까지 검사하므로 기본값으로 사용
+    method = serializers.ChoiceField(choices=["post", "put"], default="post")
+
+
+class StoryImageUploadConfirmSerializer(serializers.Serializer):
+    upload_token = serializers.CharField()
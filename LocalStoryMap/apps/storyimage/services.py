@@ -0,0 +1,177 @@
+import logging
+import uuid
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core import signing
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+
+from apps.images.services import ImageBlobService
+
+from .models import StoryImage
+
+logger = logging.getLogger(__name__)
+
+# 직접 업로드를 허용하는 Content-Type 과 저장 확장자
+UPLOAD_CONTENT_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+
+class DirectUploadError(Exception):
+    pass
+
+
+class StoryImageUploadService:
+    """
+    스토리 이미지를 앱 서버를 거치지 않고 오브젝트 스토리지(S3)에 직접 올리는 2단계 업로드
+
+    1) create_upload: story_images/direct/... 키에 대한 presigned POST(또는 PUT)와 업로드 토큰 발급
+    2) 클라이언트가 스토리지에 직접 업로드
+    3) confirm: 토큰 검증 → HEAD 로 객체 크기/타입 확인 → 해시 기반 blob 으로 옮김 → StoryImage 행 생성
+       직접 업로드도 일반 업로드와 같은 blob(중복 제거, 참조 수)을 쓰고, 원래 키는 upload_key 로만 남김
+    """
+
+    TOKEN_SALT = "storyimage.direct-upload"
+
+    @staticmethod
+    def _storage():
+        return StoryImage._meta.get_field("image_file").storage
+
+    @staticmethod
+    def _client_and_bucket(storage):
+        if not isinstance(storage, S3Boto3Storage):
+            raise DirectUploadError("직접 업로드는 S3 스토리지에서만 사용할 수 있습니다.")
+        return storage.bucket.meta.client, storage.bucket_name
+
+    @staticmethod
+    def _object_key(storage, name: str) -> str:
+        # 스토리지 location(prefix)을 포함한 실제 S3 키
+        return storage._normalize_name(clean_name(name))
+
+    @staticmethod
+    def build_name(content_type: str) -> str:
+        extension = UPLOAD_CONTENT_TYPES[content_type]
+        today = timezone.localdate()
+        return f"story_images/direct/{today:%Y/%m/%d}/{uuid.uuid4().hex}{extension}"
+
+    @staticmethod
+    def create_upload(user, story, content_type: str, method: str = "post") -> dict:
+        if content_type not in UPLOAD_CONTENT_TYPES:
+            raise DirectUploadError("지원하지 않는 이미지 형식입니다.")
+
+        storage = StoryImageUploadService._storage()
+        client, bucket = StoryImageUploadService._client_and_bucket(storage)
+        name = StoryImageUploadService.build_name(content_type)
+        key = StoryImageUploadService._object_key(storage, name)
+        expires_in = settings.STORY_IMAGE_UPLOAD_EXPIRES
+        acl = getattr(storage, "default_acl", None)
+
+        upload: dict
+        if method == "put":
+            params = {"Bucket": bucket, "Key": key, "ContentType": content_type}
+            headers = {"Content-Type": content_type}
+            if acl:
+                params["ACL"] = acl
+                headers["x-amz-acl"] = acl
+            upload = {
+                "method": "PUT",
+                "url": client.generate_presigned_url(
+                    "put_object", Params=params, ExpiresIn=expires_in
+                ),
+                "headers": headers,
+            }
+        else:
+            # POST 는 content-length-range 조건으로 스토리지에서 크기 제한까지 강제됨
+            fields = {"Content-Type": content_type}
+            conditions: list = [
+                {"Content-Type": content_type},
+                ["content-length-range", 1, settings.STORY_IMAGE_UPLOAD_MAX_BYTES],
+            ]
+            if acl:
+                fields["acl"] = acl
+                conditions.append({"acl": acl})
+            presigned = client.generate_presigned_post(
+                Bucket=bucket,
+                Key=key,
+                Fields=fields,
+                Conditions=conditions,
+                ExpiresIn=expires_in,
+            )
+            upload = {"method": "POST", **presigned}
+
+        token = signing.dumps(
+            {"name": name, "user": user.id, "story": story.story_id},
+            salt=StoryImageUploadService.TOKEN_SALT,
+        )
+        return {
+            **upload,
+            "upload_key": name,
+            "upload_token": token,
+            "expires_in": expires_in,
+        }
+
+    @staticmethod
+    def confirm(user, story, upload_token: str) -> StoryImage:
+        try:
+            payload = signing.loads(
+                upload_token,
+                salt=StoryImageUploadService.TOKEN_SALT,
+                # 만료 직전에 시작한 업로드가 끝날 시간을 조금 더 줌
+                max_age=settings.STORY_IMAGE_UPLOAD_EXPIRES * 2,
+            )
+        except signing.BadSignature:
+            raise DirectUploadError("업로드 토큰이 유효하지 않거나 만료되었습니다.")
+        if payload["user"] != user.id or payload["story"] != story.story_id:
+            raise DirectUploadError("업로드 토큰이 이 요청과 일치하지 않습니다.")
+
+        name = payload["name"]
+        # 같은 토큰으로 다시 확인 요청이 오면 기존 행 반환 (멱등)
+        existing = StoryImage.objects.filter(upload_key=name).first()
+        if existing is not None:
+            return existing
+
+        storage = StoryImageUploadService._storage()
+        client, bucket = StoryImageUploadService._client_and_bucket(storage)
+        key = StoryImageUploadService._object_key(storage, name)
+        try:
+            head = client.head_object(Bucket=bucket, Key=key)
+        except ClientError:
+            raise DirectUploadError("업로드된 파일을 찾을 수 없습니다.")
+
+        size = head.get("ContentLength", 0)
+        content_type = head.get("ContentType", "")
+        if (
+            size <= 0
+            or size > settings.STORY_IMAGE_UPLOAD_MAX_BYTES
+            or content_type not in UPLOAD_CONTENT_TYPES
+        ):
+            # PUT 은 크기 제한을 강제할 수 없으므로 여기서 걸러내고 객체를 지움
+            logger.warning("직접 업로드 거부: %s (%s, %s bytes)", key, content_type, size)
+            client.delete_object(Bucket=bucket, Key=key)
+            raise DirectUploadError("업로드된 파일의 크기 또는 형식이 올바르지 않습니다.")
+
+        try:
+            blob_name = ImageBlobService.ingest(storage, name)
+        except (ClientError, OSError):
+            # 같은 업로드의 확인 요청이 동시에 와서 다른 요청이 먼저 옮긴 경우
+            existing = StoryImage.objects.filter(upload_key=name).first()
+            if existing is not None:
+                return existing
+            raise DirectUploadError("업로드된 파일을 찾을 수 없습니다.")
+
+        # 파일 경로만 지정하므로 FileField 가 다시 업로드하지 않음
+        # (blob 참조 수와 변형 이미지 예약은 post_save 에서 처리)
+        try:
+            with transaction.atomic():
+                return StoryImage.objects.create(
+                    user=user, story=story, image_file=blob_name, upload_key=name
+                )
+        except IntegrityError:
+            return StoryImage.objects.get(upload_key=name)
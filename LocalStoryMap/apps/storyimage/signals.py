@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.images.services import ImageVariantService
+
+from .models import StoryImage
+
+
+@receiver(post_save, sender=StoryImage)
+def schedule_story_image_variants(sender, instance, **kwargs):
+    # 업로드된 스토리 이미지의 썸네일 등 변형 이미지를 백그라운드에서 생성
+    ImageVariantService.schedule(instance, "image_file")
@@ -1,3 +1,141 @@
+import importlib.util
+import io
+from unittest import mock, skipUnless
+
+import boto3
+import requests
+from botocore.exceptions import ClientError
 from django.test import TestCase
+from PIL import Image
+from rest_framework.test import APIClient
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from apps.images.models import ImageBlob
+from apps.marker.models import Marker
+from apps.story.models import Story
+from apps.users.models import User
+
+from .models import StoryImage
+
+BUCKET = "storyimage-test"
+
+
+def _png(color: str = "red") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@skipUnless(importlib.util.find_spec("moto"), "moto 가 설치된 환경에서만 실행")
+class StoryImageDirectUploadTests(TestCase):
+    """
+    presigned 직접 업로드 전체 흐름 (업로드 URL 발급 → 스토리지에 직접 업로드 → 업로드 확인)
+    moto 로 S3 를 흉내 내고, 스토리 이미지 필드의 스토리지를 그 버킷으로 바꿔서 확인합니다.
+    """
+
+    def setUp(self):
+        from moto import mock_aws
+
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+
+        self.storage = S3Boto3Storage(
+            bucket_name=BUCKET,
+            region_name="us-east-1",
+            endpoint_url=None,
+            custom_domain=None,
+            default_acl=None,
+            object_parameters={},
+            access_key="testing",
+            secret_key="testing",
+        )
+        field = StoryImage._meta.get_field("image_file")
+        patcher = mock.patch.object(field, "storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(email="uploader@example.com")
+        marker = Marker.objects.create(
+            marker_name="테스트 마커", latitude="37.5", longitude="127.0"
+        )
+        self.story = Story.objects.create(user=self.user, marker=marker, title="스토리")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _url(self, action: str) -> str:
+        return f"/api/stories/{self.story.story_id}/images/{action}/"
+
+    def _upload(self, body: bytes, method: str = "post", content_type="image/png"):
+        resp = self.client.post(
+            self._url("upload-url"),
+            {"content_type": content_type, "method": method},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, 200, resp.content)
+        upload = resp.json()
+        if upload["method"] == "POST":
+            stored = requests.post(
+                upload["url"], data=upload["fields"], files={"file": body}
+            )
+        else:
+            stored = requests.put(upload["url"], data=body, headers=upload["headers"])
+        self.assertLess(stored.status_code, 300, stored.text)
+        return upload
+
+    def _confirm(self, upload: dict):
+        return self.client.post(
+            self._url("upload-confirm"),
+            {"upload_token": upload["uploadToken"]},
+            format="json",
+        )
+
+    def _exists(self, name: str) -> bool:
+        try:
+            self.storage.bucket.meta.client.head_object(Bucket=BUCKET, Key=name)
+        except ClientError:
+            return False
+        return True
+
+    def test_confirm_moves_upload_into_content_addressed_blob(self):
+        upload = self._upload(_png())
+        self.assertTrue(upload["uploadKey"].startswith("story_images/direct/"))
+
+        resp = self._confirm(upload)
+        self.assertEqual(resp.status_code, 201, resp.content)
+
+        image = StoryImage.objects.get(image_id=resp.json()["imageId"])
+        blob = ImageBlob.objects.get()
+        self.assertEqual(image.image_file.name, blob.name)
+        self.assertEqual(image.upload_key, upload["uploadKey"])
+        self.assertEqual(blob.ref_count, 1)
+        self.assertTrue(self._exists(blob.name))
+        # 직접 업로드된 원래 객체는 blob 으로 옮긴 뒤 지움
+        self.assertFalse(self._exists(upload["uploadKey"]))
+
+        # 같은 토큰으로 다시 확인하면 같은 행을 돌려줌
+        again = self._confirm(upload)
+        self.assertEqual(again.status_code, 201)
+        self.assertEqual(again.json()["imageId"], image.image_id)
+        self.assertEqual(StoryImage.objects.count(), 1)
+
+    def test_same_bytes_share_one_blob(self):
+        first = self._confirm(self._upload(_png(), method="post"))
+        second = self._confirm(self._upload(_png(), method="put"))
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 201)
+
+        names = set(StoryImage.objects.values_list("image_file", flat=True))
+        self.assertEqual(len(names), 1)
+        self.assertEqual(ImageBlob.objects.get().ref_count, 2)
 
-# Create your tests here.
+    def test_rejected_upload_is_deleted(self):
+        # PUT 은 Content-Type 을 서명에 넣으므로, 허용 형식으로 서명받고 크기 제한을 넘긴 경우로 확인
+        with self.settings(STORY_IMAGE_UPLOAD_MAX_BYTES=10):
+            upload = self._upload(_png(), method="put")
+            resp = self._confirm(upload)
+        self.assertEqual(resp.status_code, 400)
+        self.assertFalse(self._exists(upload["uploadKey"]))
+        self.assertFalse(StoryImage.objects.exists())
+        self.assertFalse(ImageBlob.objects.exists())
@@ -1,12 +1,19 @@
 from django.shortcuts import get_object_or_404
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import parsers, permissions, viewsets
+from rest_framework import parsers, permissions, status, viewsets
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.story.models import Story  # Story 모델 import 추가
 
 from .models import StoryImage
-from .serializers import ImageSerializer
+from .serializers import (
+    ImageSerializer,
+    StoryImageUploadConfirmSerializer,
+    StoryImageUploadRequestSerializer,
+)
+from .services import DirectUploadError, StoryImageUploadService
 
 
 class StoryImageViewSet(viewsets.ModelViewSet):
@@ -61,3 +68,66 @@ class StoryImageViewSet(viewsets.ModelViewSet):
     )
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
+
+
+class StoryImageUploadURLAPIView(APIView):
+    """
+    스토리 이미지 직접 업로드 1단계: presigned POST/PUT 발급
+    (파일은 앱 서버를 거치지 않고 클라이언트가 스토리지에 바로 업로드)
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    # 스토리지에 그대로 보내야 하는 폼 필드/헤더 이름은 camelCase 로 바꾸지 않음
+    camelize_exclude_fields = ("fields", "headers")
+
+    @swagger_auto_schema(
+        tags=["스토리 이미지"],
+        operation_summary="스토리 이미지 업로드 URL 발급",
+        operation_description=(
+            "method=post 이면 url 로 fields 와 file 을 multipart POST, "
+            "method=put 이면 url 로 headers 를 붙여 파일을 PUT 한 뒤 "
+            "upload_token 으로 업로드 완료를 확인합니다."
+        ),
+        request_body=StoryImageUploadRequestSerializer,
+        responses={200: openapi.Response(description="업로드 URL 발급 성공.")},
+    )
+    def post(self, request, story_id):
+        story = get_object_or_404(Story, story_id=story_id)
+        serializer = StoryImageUploadRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload = StoryImageUploadService.create_upload(
+                request.user, story, **serializer.validated_data
+            )
+        except DirectUploadError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(upload, status=status.HTTP_200_OK)
+
+
+class StoryImageUploadConfirmAPIView(APIView):
+    """
+    스토리 이미지 직접 업로드 2단계: 업로드된 객체를 HEAD 로 확인하고 StoryImage 생성
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["스토리 이미지"],
+        operation_summary="스토리 이미지 업로드 완료 확인",
+        request_body=StoryImageUploadConfirmSerializer,
+        responses={
+            201: openapi.Response(description="이미지 생성 성공.", schema=ImageSerializer())
+        },
+    )
+    def post(self, request, story_id):
+        story = get_object_or_404(Story, story_id=story_id)
+        serializer = StoryImageUploadConfirmSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            image = StoryImageUploadService.confirm(
+                request.user, story, serializer.validated_data["upload_token"]
+            )
+        except DirectUploadError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        out = ImageSerializer(image, context={"request": request})
+        return Response(out.data, status=status.HTTP_201_CREATED)
@@ -1,5 +1,6 @@
 from typing import cast
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -12,8 +13,14 @@ from rest_framework.views import APIView
 from apps.users.models import User
 
 from .models import Subscribe
-from .serializers import SubscribeCreateSerializer, SubscribeSerializer
+from .serializers import (
+    PaymentWebhookSerializer,
+    SubscribeCreateSerializer,
+    SubscribeSerializer,
+)
+from .services.entitlement import EntitlementService
 from .services.payment import PaymentService, PaymentVerificationError
+from .services.webhook import PaymentWebhookService
 
 
 class SubscribeListCreateAPIView(APIView):
@@ -98,15 +105,41 @@ class SubscribeDetailAPIView(APIView):
     def delete(self, request: Request, subscribe_id: int) -> Response:
         sub = self.get_object(request, subscribe_id)
 
-        sub.is_active = False
-        sub.save(update_fields=["is_active"])
-
         if not request.user.is_authenticated:
             raise NotAuthenticated("인증된 사용자만 접근 가능합니다")
         user = cast(User, request.user)
 
-        if not Subscribe.objects.filter(user=user, is_active=True).exists():
-            user.is_paid_user = False
-            user.save(update_fields=["is_paid_user"])
+        with transaction.atomic():
+            sub.is_active = False
+            sub.save(update_fields=["is_active"])
+            # 남은 활성 구독 기준으로 is_paid_user 재계산 + 커밋 후 권한 캐시 무효화
+            EntitlementService.sync_users([user.pk])
 
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class PaymentWebhookAPIView(APIView):
+    """
+    POST /api/subscribes/webhook/iamport/ : 아임포트 결제 웹훅 수신
+    {"imp_uid": "imp_1234567890", "merchant_uid": "order_1", "status": "paid"}
+
+    아임포트를 호출하지 않고 기록만 한 뒤 바로 200 으로 응답합니다. 검증과 구독 생성은 백그라운드 워커가
+    imp_uid 기준으로 한 번만 처리합니다 (PaymentWebhookService). 본문은 위조될 수 있으므로 결제 상태/금액/사용자는
+    처리 시 아임포트 결제 조회 결과만 사용합니다.
+    """
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="아임포트 결제 웹훅",
+        request_body=PaymentWebhookSerializer,
+        responses={200: "수신 완료", 400: "잘못된 웹훅 본문"},
+        tags=["구독"],
+    )
+    def post(self, request: Request) -> Response:
+        serializer = PaymentWebhookSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        PaymentWebhookService.receive(dict(serializer.validated_data))
+        return Response({"received": True}, status=status.HTTP_200_OK)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SubscribesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.subscribes"
+
+    def ready(self):
+        # 구독 권한 캐시 무효화 시그널 등록
+        from . import signals  # noqa: F401
@@ -0,0 +1,222 @@
+import math
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.paymenthistory.models import PaymentHistory, PaymentStatus
+from apps.subscribes.models import PaymentWebhookEvent, Subscribe
+from apps.subscribes.services.entitlement import EntitlementService
+from apps.subscribes.services.reconcile import PaymentReconciler
+from apps.subscribes.utils.fake_iamport import fake_iamport_handler
+from apps.users.models import User
+from config.stub_server import run_stub_server
+
+
+class Command(BaseCommand):
+    help = (
+        "가짜 아임포트 API(일괄 조회/상태별 목록)를 띄우고 결제 대조(PaymentReconciler)를 확인합니다. "
+        "불일치를 심은 결제 이력을 만들어 보고/복구/복구 후 재대조를 차례로 실행하고, "
+        "일괄 조회 호출 수와 동시 호출 수까지 기대와 다르면 실패 코드로 끝납니다. 만든 데이터는 끝나면 지웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", required=True, help="결제한 사용자로 쓸 기존 사용자 이메일")
+        parser.add_argument(
+            "--count", type=int, default=250, help="만들 로컬 결제 이력 수 (최소 6)"
+        )
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--concurrency", type=int, default=3)
+        parser.add_argument(
+            "--delay", type=float, default=0.2, help="가짜 아임포트 조회 응답 지연(초)"
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"사용자를 찾을 수 없습니다: {options['email']}")
+        if options["count"] < 6:
+            raise CommandError("--count 는 6 이상이어야 합니다.")
+
+        prefix = f"imp_rc{uuid.uuid4().hex[:8]}"
+        payments, expected = self._seed(user, prefix, options["count"])
+        failures: list = []
+
+        def check(name: str, ok: bool, detail: str) -> None:
+            self.stdout.write(f"{'OK  ' if ok else 'FAIL'} {name}: {detail}")
+            if not ok:
+                failures.append(name)
+
+        # buyer_email 을 넘기지 않으므로 payments 에 없는 결제는 아임포트에 없는 것으로 응답
+        handler = fake_iamport_handler(payments, delay=options["delay"])
+        try:
+            with run_stub_server(handler) as server, override_settings(
+                IMP_API_BASE_URL=server.url
+            ):
+                # 1) 보고만: 심은 불일치가 종류별로 하나씩 나와야 함
+                found, reconciler = self._reconcile(options, prefix, repair=False)
+                check(
+                    "불일치 보고",
+                    found == expected,
+                    f"{dict(sorted(found.items()))} (기대 {dict(sorted(expected.items()))})",
+                )
+                batches = math.ceil(reconciler.checked / options["batch_size"])
+                check(
+                    "일괄 조회 호출 수",
+                    handler.stats.calls.get("batch") == batches
+                    and not handler.stats.calls.get("single"),
+                    f"로컬 결제 {reconciler.checked}건 → 일괄 조회 {handler.stats.calls.get('batch')}회 "
+                    f"(기대 {batches}), 단건 조회 {handler.stats.calls.get('single', 0)}회",
+                )
+                check(
+                    "동시 조회 수",
+                    handler.stats.peak_in_flight <= options["concurrency"],
+                    f"최대 {handler.stats.peak_in_flight} (--concurrency {options['concurrency']})",
+                )
+
+                # 2) 복구: 로컬 누락은 웹훅 대기열로 넘어가므로 처리가 끝날 때까지 기다림
+                found, _ = self._reconcile(options, prefix, repair=True)
+                check("복구 실행", found == expected, f"{dict(sorted(found.items()))}")
+                self._wait_webhooks(prefix)
+
+                # 3) 복구 후 재대조: 보고만 하는 항목(금액/주문번호 불일치, 아임포트 누락)만 남아야 함
+                found, _ = self._reconcile(options, prefix, repair=False)
+                remaining = Counter(
+                    {
+                        kind: n
+                        for kind, n in expected.items()
+                        if kind
+                        in (
+                            PaymentReconciler.MISSING_REMOTE,
+                            PaymentReconciler.AMOUNT_MISMATCH,
+                            PaymentReconciler.MERCHANT_MISMATCH,
+                        )
+                    }
+                )
+                check(
+                    "복구 후 재대조",
+                    found == remaining,
+                    f"{dict(sorted(found.items()))} (기대 {dict(sorted(remaining.items()))})",
+                )
+        finally:
+            self._cleanup(user, prefix)
+
+        if failures:
+            raise CommandError(f"확인 실패: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("결제 대조 확인 완료"))
+
+    @staticmethod
+    def _seed(user: User, prefix: str, count: int) -> tuple:
+        """
+        로컬 결제 이력/구독과 가짜 아임포트 결제 내역을 만들고, 앞쪽 결제에 불일치를 하나씩 심습니다.
+        반환: (가짜 아임포트 결제 {imp_uid: 결제 정보}, 기대하는 불일치 종류별 수)
+        """
+        now = timezone.now()
+        expires_at = now + timedelta(days=settings.SINGLE_PLAN_DURATION)
+
+        def payment(imp_uid: str, merchant_uid: str, **fields) -> dict:
+            return {
+                "imp_uid": imp_uid,
+                "merchant_uid": merchant_uid,
+                "status": PaymentStatus.PAID.value,
+                "amount": settings.SINGLE_PLAN_PRICE,
+                "pay_method": "card",
+                "buyer_email": user.email,
+                "paid_at": int(now.timestamp()),
+                **fields,
+            }
+
+        keys = [f"{prefix}{i:05d}" for i in range(count)]
+        payments = {key: payment(key, key.replace("imp_", "sim_", 1)) for key in keys}
+        histories = {
+            key: PaymentHistory(
+                user=user,
+                imp_uid=key,
+                merchant_uid=key.replace("imp_", "sim_", 1),
+                amount=settings.SINGLE_PLAN_PRICE,
+                status=PaymentStatus.PAID,
+                paid_at=now,
+            )
+            for key in keys
+        }
+        subscribed = set(keys)
+
+        # 0: 아임포트에 없음 / 1: 아임포트에서 취소됨 / 2: 금액 불일치 / 3: 주문번호 불일치
+        # 4: 결제 완료인데 구독 없음 / 5: 양쪽 다 취소인데 구독 활성 / 아임포트에만 있는 결제 하나
+        del payments[keys[0]]
+        payments[keys[1]]["status"] = PaymentStatus.CANCELLED.value
+        payments[keys[2]]["amount"] += 1000
+        payments[keys[3]]["merchant_uid"] += "_other"
+        subscribed.discard(keys[4])
+        histories[keys[5]].status = PaymentStatus.CANCELLED
+        payments[keys[5]]["status"] = PaymentStatus.CANCELLED.value
+        extra = f"{prefix}extra"
+        payments[extra] = payment(extra, extra.replace("imp_", "sim_", 1))
+
+        PaymentHistory.objects.bulk_create(histories.values())
+        Subscribe.objects.bulk_create(
+            Subscribe(
+                user=user,
+                imp_uid=key,
+                merchant_uid=histories[key].merchant_uid,
+                expires_at=expires_at,
+                is_active=True,
+            )
+            for key in keys
+            if key in subscribed
+        )
+        expected = Counter(
+            {
+                PaymentReconciler.MISSING_REMOTE: 1,
+                PaymentReconciler.STATUS_MISMATCH: 1,
+                PaymentReconciler.AMOUNT_MISMATCH: 1,
+                PaymentReconciler.MERCHANT_MISMATCH: 1,
+                PaymentReconciler.SUBSCRIPTION_MISSING: 1,
+                PaymentReconciler.SUBSCRIPTION_NOT_PAID: 1,
+                PaymentReconciler.MISSING_LOCAL: 1,
+            }
+        )
+        return payments, expected
+
+    @staticmethod
+    def _reconcile(options: dict, prefix: str, repair: bool) -> tuple:
+        # 오늘 하루를 대조하고, 이 확인에서 만든 결제의 불일치만 셈 (기존 개발 데이터는 무시)
+        today = timezone.localdate()
+        since = timezone.make_aware(datetime.combine(today, datetime.min.time()))
+        reconciler = PaymentReconciler(
+            since=since,
+            until=since + timedelta(days=1),
+            batch_size=options["batch_size"],
+            concurrency=options["concurrency"],
+            repair=repair,
+        )
+        found = Counter(
+            item.kind for item in reconciler.run() if item.imp_uid.startswith(prefix)
+        )
+        return found, reconciler
+
+    @staticmethod
+    def _wait_webhooks(prefix: str, timeout: float = 10) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not PaymentWebhookEvent.objects.filter(
+                imp_uid__startswith=prefix,
+                state__in=[
+                    PaymentWebhookEvent.State.PENDING,
+                    PaymentWebhookEvent.State.PROCESSING,
+                ],
+            ).exists():
+                return
+            time.sleep(0.2)
+
+    @staticmethod
+    def _cleanup(user: User, prefix: str) -> None:
+        Subscribe.objects.filter(imp_uid__startswith=prefix).delete()
+        PaymentHistory.objects.filter(imp_uid__startswith=prefix).delete()
+        PaymentWebhookEvent.objects.filter(imp_uid__startswith=prefix).delete()
+        EntitlementService.sync_users([user.pk])
@@ -1,18 +1,21 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.utils import timezone
 
-from apps.subscribes.models import Subscribe
-from apps.users.models import User
+from apps.subscribes.services.entitlement import EntitlementService
 
 
 class Command(BaseCommand):
-    help = "만료일 지난 구독은 is_active=False로 일괄 처리"
+    help = "만료일 지난 구독은 is_active=False로 청크 단위 처리 (크론 5분마다 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.SUBSCRIPTION_EXPIRE_BATCH_SIZE,
+            help="한 트랜잭션에서 처리할 구독 수",
+        )
 
     def handle(self, *args, **options):
-        now = timezone.now()
-        expired_subs = Subscribe.objects.filter(is_active=True, expires_at__lt=now)
-        user_ids = list(expired_subs.values_list("user_id", flat=True))
-        expired_count = expired_subs.update(is_active=False)
-        # 만료된 유저의 is_paid_user도 False로 동기화
-        User.objects.filter(id__in=user_ids).update(is_paid_user=False)
+        # 만료된 유저의 is_paid_user 는 남은 활성 구독 기준으로 다시 계산
+        expired_count = EntitlementService.expire_due(options["batch_size"])
         self.stdout.write(f"Expired {expired_count} subscriptions.")
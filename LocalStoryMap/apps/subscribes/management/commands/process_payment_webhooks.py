@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.subscribes.models import PaymentWebhookEvent
+from apps.subscribes.services.webhook import PaymentWebhookService
+
+
+class Command(BaseCommand):
+    help = (
+        "처리되지 않았거나 실패/중단된 결제 웹훅을 다시 처리합니다. (크론 매분 실행) "
+        "실패한 이벤트는 재시도 시각(next_attempt_at)이 지난 것만 처리합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=500, help="한 번에 처리할 최대 이벤트 수")
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=30,
+            help="받은 지 이 시간(초)이 지난 대기 이벤트만 처리 (수신 직후에는 백그라운드 워커가 처리)",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        stale_before = now - timedelta(
+            seconds=settings.PAYMENT_WEBHOOK_PROCESSING_TIMEOUT
+        )
+        event_ids = list(
+            PaymentWebhookEvent.objects.filter(
+                attempts__lt=settings.PAYMENT_WEBHOOK_MAX_ATTEMPTS
+            )
+            .filter(
+                Q(
+                    state=PaymentWebhookEvent.State.PENDING,
+                    updated_at__lt=now - timedelta(seconds=options["min_age"]),
+                )
+                | Q(
+                    Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+                    state=PaymentWebhookEvent.State.FAILED,
+                )
+                | Q(
+                    state=PaymentWebhookEvent.State.PROCESSING,
+                    updated_at__lt=stale_before,
+                )
+            )
+            .order_by("updated_at")
+            .values_list("pk", flat=True)[: options["limit"]]
+        )
+
+        done = 0
+        for event_id in event_ids:
+            done += PaymentWebhookService.process(event_id)
+        self.stdout.write(f"결제 웹훅 재처리: 대상 {len(event_ids)}건, 완료 {done}건")
@@ -0,0 +1,83 @@
+import csv
+import sys
+from dataclasses import asdict
+from datetime import datetime, time, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.subscribes.services.payment import PaymentGatewayError
+from apps.subscribes.services.reconcile import PaymentReconciler
+
+
+class Command(BaseCommand):
+    help = "기간 안의 결제 이력/구독을 아임포트 결제 내역과 대조해 불일치 보고서(CSV)를 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", help="시작일 YYYY-MM-DD (기본값: 어제)")
+        parser.add_argument("--until", help="종료일 YYYY-MM-DD, 당일 포함 (기본값: 시작일)")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="아임포트 일괄 조회 한 번에 넣을 결제 수 (최대 100)",
+        )
+        parser.add_argument("--concurrency", type=int, default=4, help="아임포트 동시 조회 수")
+        parser.add_argument("--output", dest="path", help="보고서 파일 경로 (생략 시 stdout)")
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="상태 불일치/구독 누락/로컬 누락을 복구 (금액·주문번호 불일치는 보고만)",
+        )
+
+    @staticmethod
+    def _parse_date(value: str):
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            raise CommandError(f"날짜 형식이 잘못됐습니다: {value} (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        since = (
+            self._parse_date(options["since"])
+            if options["since"]
+            else today - timedelta(days=1)
+        )
+        until = self._parse_date(options["until"]) if options["until"] else since
+        if until < since:
+            raise CommandError("--until 은 --since 이후여야 합니다.")
+
+        reconciler = PaymentReconciler(
+            since=timezone.make_aware(datetime.combine(since, time.min)),
+            until=timezone.make_aware(
+                datetime.combine(until + timedelta(days=1), time.min)
+            ),
+            batch_size=options["batch_size"],
+            concurrency=options["concurrency"],
+            repair=options["repair"],
+        )
+
+        path = options["path"]
+        out = open(path, "w", encoding="utf-8", newline="") if path else sys.stdout
+        counts: dict = {}
+        try:
+            writer = csv.DictWriter(out, fieldnames=PaymentReconciler.REPORT_FIELDS)
+            writer.writeheader()
+            for item in reconciler.run():
+                writer.writerow(asdict(item))
+                counts[item.kind] = counts.get(item.kind, 0) + 1
+        except PaymentGatewayError as e:
+            raise CommandError(f"아임포트 조회 실패로 중단: {e}")
+        finally:
+            if path:
+                out.close()
+
+        summary = ", ".join(f"{kind} {n}건" for kind, n in sorted(counts.items()))
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"결제 대조 완료 ({since} ~ {until}): 로컬 결제 {reconciler.checked}건 확인, "
+                f"불일치 {sum(counts.values())}건{f' ({summary})' if summary else ''}"
+                f"{', 복구 적용' if options['repair'] else ''}"
+            )
+        )
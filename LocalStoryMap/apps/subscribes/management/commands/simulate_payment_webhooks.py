@@ -0,0 +1,113 @@
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from requests.adapters import HTTPAdapter
+
+from apps.subscribes.models import PaymentWebhookEvent, Subscribe
+from apps.subscribes.utils.fake_iamport import fake_iamport_handler
+from apps.users.models import User
+from config.stub_server import run_stub_server
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 테스트용 결제 웹훅 시뮬레이터: 웹훅 엔드포인트에 결제 웹훅을 동시에 보내고 처리 결과를 집계합니다. "
+        "--iamport-port 를 주면 가짜 아임포트 API 도 띄우므로, 서버를 IMP_API_BASE_URL=http://127.0.0.1:<포트> 로 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url",
+            default="http://127.0.0.1:8000/api/subscribes/webhook/iamport/",
+            help="웹훅 엔드포인트 URL",
+        )
+        parser.add_argument("--count", type=int, default=50, help="보낼 결제 수")
+        parser.add_argument(
+            "--duplicates", type=int, default=1, help="결제마다 같은 웹훅을 보내는 횟수"
+        )
+        parser.add_argument("--concurrency", type=int, default=20, help="동시 전송 수")
+        parser.add_argument("--email", required=True, help="결제한 사용자로 쓸 기존 사용자 이메일")
+        parser.add_argument(
+            "--iamport-port", type=int, default=0, help="가짜 아임포트 API 포트 (0 이면 띄우지 않음)"
+        )
+        parser.add_argument(
+            "--wait", type=int, default=30, help="전송 후 처리 완료를 기다리는 최대 시간(초)"
+        )
+
+    def handle(self, *args, **options):
+        if not User.objects.filter(email=options["email"]).exists():
+            raise CommandError(f"사용자를 찾을 수 없습니다: {options['email']}")
+
+        with ExitStack() as stack:
+            if options["iamport_port"]:
+                # 모든 결제를 --email 사용자의 결제 완료로 응답하는 가짜 아임포트
+                server = stack.enter_context(
+                    run_stub_server(
+                        fake_iamport_handler(buyer_email=options["email"]),
+                        options["iamport_port"],
+                    )
+                )
+                self.stdout.write(f"가짜 아임포트 API: {server.url}")
+            self._simulate(options)
+
+    def _simulate(self, options):
+        run_id = uuid.uuid4().hex[:8]
+        keys = [f"{run_id}{i:05d}" for i in range(options["count"])]
+        jobs = [key for key in keys for _ in range(options["duplicates"])]
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_maxsize=options["concurrency"]))
+
+        def send(key: str):
+            started = time.monotonic()
+            resp = session.post(
+                options["url"],
+                json={
+                    "imp_uid": f"imp_{key}",
+                    "merchant_uid": f"sim_{key}",
+                    "status": "paid",
+                },
+                timeout=10,
+            )
+            return resp.status_code, (time.monotonic() - started) * 1000
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            results = list(pool.map(send, jobs))
+        elapsed = time.monotonic() - started
+
+        latencies = sorted(ms for _, ms in results)
+        codes: dict = {}
+        for code, _ in results:
+            codes[code] = codes.get(code, 0) + 1
+        self.stdout.write(
+            f"전송 {len(results)}건 / {elapsed:.2f}s, 응답 코드 {codes}, "
+            f"응답 시간 p50={statistics.median(latencies):.0f}ms "
+            f"p95={latencies[int(len(latencies) * 0.95) - 1]:.0f}ms"
+        )
+
+        imp_uids = [f"imp_{key}" for key in keys]
+        events = PaymentWebhookEvent.objects.filter(imp_uid__in=imp_uids)
+        deadline = time.monotonic() + options["wait"]
+        while time.monotonic() < deadline:
+            if not events.filter(
+                state__in=[
+                    PaymentWebhookEvent.State.PENDING,
+                    PaymentWebhookEvent.State.PROCESSING,
+                ]
+            ).exists():
+                break
+            time.sleep(0.5)
+
+        states: dict = {}
+        for state in events.values_list("state", flat=True):
+            states[state] = states.get(state, 0) + 1
+        subscriptions = Subscribe.objects.filter(imp_uid__in=imp_uids).count()
+        self.stdout.write(
+            f"처리 결과 {states}, 생성된 구독 {subscriptions}건 (결제 {len(keys)}건) "
+            f"/ 전송 시작부터 {time.monotonic() - started:.2f}s"
+        )
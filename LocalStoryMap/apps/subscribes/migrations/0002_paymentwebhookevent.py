@@ -0,0 +1,75 @@
+# Generated by Django 5.2.1 on 2026-10-19 15:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subscribes", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentWebhookEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "imp_uid",
+                    models.CharField(
+                        help_text="아임포트 imp_uid", max_length=255, unique=True
+                    ),
+                ),
+                (
+                    "merchant_uid",
+                    models.CharField(help_text="아임포트 merchant_uid", max_length=100),
+                ),
+                ("status", models.CharField(help_text="웹훅으로 받은 결제 상태", max_length=20)),
+                ("payload", models.JSONField(default=dict, help_text="웹훅 원문")),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("processing", "처리 중"),
+                            ("done", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("retries", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="실패한 이벤트를 다시 처리할 수 있는 시각",
+                        null=True,
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("received_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "결제 웹훅",
+                "verbose_name_plural": "결제 웹훅 목록",
+                "db_table": "payment_webhook_events",
+                "indexes": [
+                    models.Index(
+                        fields=["state", "updated_at"], name="payment_webhook_state_idx"
+                    )
+                ],
+            },
+        ),
+    ]
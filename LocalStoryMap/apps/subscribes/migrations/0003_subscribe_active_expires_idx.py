@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-19 15:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subscribes", "0002_paymentwebhookevent"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="subscribe",
+            index=models.Index(
+                fields=["is_active", "expires_at"], name="subscribe_active_expires_idx"
+            ),
+        ),
+    ]
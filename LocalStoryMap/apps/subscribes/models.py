@@ -42,7 +42,59 @@ class Subscribe(models.Model):
         db_table = "Subscribe"
         verbose_name = "구독"
         verbose_name_plural = "구독 목록"
+        indexes = [
+            # 만료 처리(expire_subscriptions)가 만료된 활성 구독을 만료일 순으로 읽는 범위
+            models.Index(
+                fields=["is_active", "expires_at"], name="subscribe_active_expires_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         status = "활성" if self.is_active else "만료"
         return f"#{self.subscribe_id} – {self.user} ({status})"
+
+
+class PaymentWebhookEvent(models.Model):
+    """
+    아임포트 결제 웹훅 수신 기록 겸 처리 대기열 (imp_uid 당 한 행)
+
+    웹훅은 받자마자 이 테이블에 기록하고 200 으로 응답하며, 검증/구독 생성은 워커가 처리합니다.
+    (apps.subscribes.services.webhook.PaymentWebhookService)
+    """
+
+    class State(models.TextChoices):
+        PENDING = "pending", "대기"
+        PROCESSING = "processing", "처리 중"
+        DONE = "done", "완료"
+        FAILED = "failed", "실패"
+
+    imp_uid = models.CharField(max_length=255, unique=True, help_text="아임포트 imp_uid")
+    merchant_uid = models.CharField(max_length=100, help_text="아임포트 merchant_uid")
+    status = models.CharField(max_length=20, help_text="웹훅으로 받은 결제 상태")
+    payload = models.JSONField(default=dict, help_text="웹훅 원문")
+    state = models.CharField(
+        max_length=20, choices=State.choices, default=State.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # 아임포트 장애로 미룬 시도까지 포함한 연속 실패 횟수 (재시도 간격 계산용)
+    retries = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(
+        null=True, blank=True, help_text="실패한 이벤트를 다시 처리할 수 있는 시각"
+    )
+    last_error = models.TextField(blank=True, default="")
+    received_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "payment_webhook_events"
+        verbose_name = "결제 웹훅"
+        verbose_name_plural = "결제 웹훅 목록"
+        indexes = [
+            models.Index(
+                fields=["state", "updated_at"], name="payment_webhook_state_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.imp_uid} ({self.status}, {self.state})"
@@ -1,11 +1,12 @@
-from django.utils import timezone
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
+from apps.subscribes.services.entitlement import EntitlementService
+
 
 class SubscriberPermission(BasePermission):
     """
-    1) is_subscriber=True 면 모든 요청 허용
-    2) is_subscriber=False 면 스토리 조회(GET, HEAD, OPTIONS) 뷰에서만 허용
+    1) 구독자(만료되지 않은 활성 구독 보유)면 모든 요청 허용
+    2) 비구독자면 스토리 조회(GET, HEAD, OPTIONS) 뷰에서만 허용
     3) 그 외는 모두 403
     """
 
@@ -17,8 +18,8 @@ class SubscriberPermission(BasePermission):
         if not user or not user.is_authenticated:
             return False
 
-        # 2) Boolean 필드로 구독 여부 판단
-        if getattr(user, "is_subscriber", False):
+        # 2) 캐시된 구독 만료 시각으로 구독 여부 판단 (DB 조회 없음)
+        if EntitlementService.is_paid(user):
             return True
 
         # 3) 비구독자는 SAFE_METHODS & 스토리 조회 뷰만 허용
@@ -43,3 +43,11 @@ class SubscribeCreateSerializer(serializers.Serializer):
 
     imp_uid = serializers.CharField()
     merchant_uid = serializers.CharField()
+
+
+class PaymentWebhookSerializer(serializers.Serializer):
+    """아임포트 결제 웹훅 본문 (결제 정보는 처리할 때 아임포트에서 다시 조회하므로 식별자만 검사)"""
+
+    imp_uid = serializers.RegexField(r"^imp_[0-9A-Za-z]+$", max_length=255)
+    merchant_uid = serializers.CharField(max_length=100)
+    status = serializers.CharField(max_length=20, required=False, default="")
@@ -0,0 +1,161 @@
+import logging
+import time
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef, Q
+from django.utils import timezone
+
+from apps.subscribes.models import Subscribe
+from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class EntitlementService:
+    """
+    구독 권한(is_paid_user) 관리
+
+    · 권한은 사용자별로 "만료되지 않은 활성 구독이 하나라도 있는지" 로 계산합니다.
+      다른 구독이 남아 있는 사용자의 권한을 끄지 않도록, 대상 사용자 전체를 한 번의 UPDATE 로 다시 계산합니다.
+    · 권한이 바뀌면 커밋 후 사용자별 권한 캐시를 지웁니다.
+    · 권한 판단(is_paid)은 캐시된 "구독 만료 시각(paid_until)" 만 보고 현재 시각과 비교하므로,
+      만료 처리(expire_subscriptions)가 돌기 전이라도 만료 시각이 지나면 바로 비구독자로 취급합니다.
+      캐시 TTL 도 만료 시각에 맞춰 끝나므로, 요청 경로에서는 DB 를 조회하지 않습니다.
+    """
+
+    CACHE_KEY_PREFIX = "subscribes:entitlement"
+    EXPIRE_LOCK_KEY = "subscribes:expire:lock"
+
+    # 캐시 값: 구독이 없으면 NOT_PAID, 만료일 없는 구독이면 UNLIMITED, 그 외에는 만료 시각(unix time)
+    NOT_PAID = 0.0
+    UNLIMITED = float("inf")
+    # 요청 안에서 권한을 여러 번 확인해도(권한 클래스 + 시리얼라이저 선택) 캐시를 한 번만 읽도록 user 객체에 보관
+    USER_ATTR = "_entitlement_paid_until"
+
+    @classmethod
+    def cache_key(cls, user_id: int) -> str:
+        return f"{cls.CACHE_KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def active_subscriptions(now=None):
+        now = now or timezone.now()
+        # expires_at 이 없는 구독은 만료되지 않는 구독으로 취급 (expire_subscriptions 와 동일)
+        return Subscribe.objects.filter(is_active=True).filter(
+            Q(expires_at__isnull=True) | Q(expires_at__gt=now)
+        )
+
+    @classmethod
+    def _compute(cls, user_id: int) -> float:
+        subscriptions = cls.active_subscriptions().filter(user_id=user_id)
+        if subscriptions.filter(expires_at__isnull=True).exists():
+            return cls.UNLIMITED
+        paid_until = subscriptions.aggregate(paid_until=Max("expires_at"))["paid_until"]
+        return paid_until.timestamp() if paid_until else cls.NOT_PAID
+
+    @classmethod
+    def paid_until(cls, user_id: int) -> float:
+        """
+        사용자의 구독 만료 시각(unix time)을 반환합니다. 캐시에 없을 때만 Subscribe 를 조회합니다.
+        """
+        key = cls.cache_key(user_id)
+        try:
+            cached = cache.get(key)
+        except Exception as e:
+            logger.warning("구독 권한 캐시 조회 실패: %s", e)
+            return cls._compute(user_id)
+        if cached is not None:
+            return cached
+
+        value = cls._compute(user_id)
+        # 구독 중이면 만료 시각까지만, 비구독자/무기한 구독은 ENTITLEMENT_CACHE_TTL 동안 보관
+        # (구매/취소 시에는 무효화되므로 TTL 은 누락된 무효화에 대한 안전장치)
+        timeout = settings.ENTITLEMENT_CACHE_TTL
+        if cls.NOT_PAID < value < cls.UNLIMITED:
+            timeout = max(1, min(timeout, int(value - time.time()) + 1))
+        try:
+            cache.set(key, value, timeout=timeout)
+        except Exception as e:
+            logger.warning("구독 권한 캐시 저장 실패: %s", e)
+        return value
+
+    @classmethod
+    def is_paid(cls, user) -> bool:
+        """
+        권한 클래스/시리얼라이저 선택에서 쓰는 구독 여부 (비로그인 사용자는 False)
+        """
+        if not user or not user.is_authenticated:
+            return False
+        paid_until: Optional[float] = getattr(user, cls.USER_ATTR, None)
+        if paid_until is None:
+            paid_until = cls.paid_until(user.pk)
+            setattr(user, cls.USER_ATTR, paid_until)
+        return paid_until > time.time()
+
+    @classmethod
+    def invalidate(cls, user_ids: Iterable[int]) -> None:
+        keys = [cls.cache_key(user_id) for user_id in set(user_ids)]
+        if not keys:
+            return
+        try:
+            cache.delete_many(keys)
+        except Exception as e:
+            # 캐시 장애로 만료 처리 자체가 실패하지 않도록 (캐시 항목은 TTL 로 소멸)
+            logger.warning("구독 권한 캐시 삭제 실패: %s", e)
+
+    @classmethod
+    def sync_users(cls, user_ids: Iterable[int]) -> int:
+        """
+        주어진 사용자들의 is_paid_user 를 활성 구독 기준으로 다시 계산합니다. (집합 단위 UPDATE 한 번)
+        """
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return 0
+        updated = User.objects.filter(pk__in=user_ids).update(
+            is_paid_user=Exists(
+                cls.active_subscriptions().filter(user_id=OuterRef("pk"))
+            )
+        )
+        transaction.on_commit(lambda: cls.invalidate(user_ids))
+        return updated
+
+    @classmethod
+    def expire_due(cls, batch_size: int = 0) -> int:
+        """
+        만료일이 지난 활성 구독을 batch_size 개씩 비활성화하고, 해당 사용자의 권한을 다시 계산합니다.
+
+        (is_active, expires_at) 인덱스 범위를 expires_at 순으로 읽습니다. 처리한 행은 is_active=False 가 되어
+        범위에서 빠지므로 다음 청크는 항상 범위의 앞에서부터 읽으면 되고(키셋), 청크마다 커밋하므로
+        잠금도 청크 크기만큼만 잡습니다. 반환: 비활성화한 구독 수
+        """
+        batch_size = batch_size or settings.SUBSCRIPTION_EXPIRE_BATCH_SIZE
+        # 크론 실행이 겹치면 같은 청크를 두 번 읽으므로 한 번에 하나만
+        if not cache.add(
+            cls.EXPIRE_LOCK_KEY, 1, timeout=settings.SUBSCRIPTION_EXPIRE_LOCK_TIMEOUT
+        ):
+            logger.info("구독 만료 처리가 이미 실행 중입니다.")
+            return 0
+
+        now = timezone.now()
+        expired = 0
+        try:
+            while True:
+                with transaction.atomic():
+                    chunk = list(
+                        Subscribe.objects.filter(is_active=True, expires_at__lt=now)
+                        .order_by("expires_at", "pk")
+                        .values_list("pk", "user_id")[:batch_size]
+                    )
+                    if not chunk:
+                        break
+                    expired += Subscribe.objects.filter(
+                        pk__in=[pk for pk, _ in chunk], is_active=True
+                    ).update(is_active=False)
+                    cls.sync_users(user_id for _, user_id in chunk)
+                if len(chunk) < batch_size:
+                    break
+        finally:
+            cache.delete(cls.EXPIRE_LOCK_KEY)
+        return expired
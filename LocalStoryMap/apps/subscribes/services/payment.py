@@ -1,19 +1,24 @@
 # apps/services/payment.py
 
+import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Tuple
 
 import requests
 from django.conf import settings
-from django.db import transaction
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
 from apps.paymenthistory.models import PaymentHistory, PaymentStatus
 from apps.subscribes.models import Subscribe
 from apps.users.models import User
+from config.http import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -62,42 +67,198 @@ class PaymentVerificationError(Exception):
     pass
 
 
+class PaymentGatewayError(PaymentVerificationError):
+    # 아임포트 API 호출 자체가 실패한 경우 (다시 시도하면 성공할 수 있음)
+    pass
+
+
 class ImpClient:
+    """
+    아임포트(PortOne) REST API 클라이언트
+
+    액세스 토큰(유효 30분)은 프로세스 메모리 → Redis 순으로 찾아 재사용하므로, 결제 검증마다 토큰 발급
+    왕복이 생기지 않습니다. 만료가 가까워지면 잠금을 잡은 요청 하나만 재발급하고(single-flight)
+    나머지는 아직 유효한 기존 토큰을 그대로 씁니다. 토큰이 거절(401)되면 한 번 재발급 후 다시 호출합니다.
+    """
+
+    TOKEN_CACHE_KEY = "iamport:access_token"
+    TOKEN_LOCK_KEY = "iamport:access_token:lock"
+    WAIT_INTERVAL = 0.1  # 다른 요청의 재발급을 기다리며 확인하는 간격(초)
+
+    # 프로세스 안에서 공유하는 토큰 사본 {"token": str, "expires_at": float}
+    _memo: Optional[Dict[str, Any]] = None
+
     def __init__(self) -> None:
-        self.base_url = "https://api.iamport.kr"
-        self._access_token: Optional[str] = None
+        self.base_url = settings.IMP_API_BASE_URL
 
-    def _get_token(self) -> str:
-        if self._access_token:
-            return self._access_token
+    @staticmethod
+    def _cache_call(func, *args, **kwargs):
+        # Redis 장애 시에는 공유 없이 직접 발급 (결제 자체는 계속 동작)
         try:
-            resp = requests.post(
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.warning("아임포트 토큰 캐시 접근 실패: %s", e)
+            return None
+
+    @staticmethod
+    def _usable(entry: Optional[Dict[str, Any]], margin: float = 0) -> bool:
+        if not entry:
+            return False
+        return entry["expires_at"] - margin > time.time()
+
+    def _get_token(self, rejected: Optional[str] = None) -> str:
+        """
+        유효한 액세스 토큰을 반환합니다. rejected: 방금 401 로 거절된 토큰 (같은 토큰이면 재발급)
+        """
+        margin = settings.IMP_TOKEN_REFRESH_MARGIN
+
+        entry = ImpClient._memo
+        if (
+            entry is not None
+            and self._usable(entry, margin)
+            and entry["token"] != rejected
+        ):
+            return entry["token"]
+
+        cached = self._cache_call(cache.get, self.TOKEN_CACHE_KEY)
+        if cached and cached["token"] == rejected:
+            cached = None
+        if self._usable(cached, margin):
+            ImpClient._memo = cached
+            return cached["token"]
+
+        lock_timeout = settings.IMP_TOKEN_LOCK_TIMEOUT
+        deadline = time.monotonic() + lock_timeout
+        while True:
+            acquired = self._cache_call(
+                cache.add, self.TOKEN_LOCK_KEY, 1, timeout=lock_timeout
+            )
+            if acquired or acquired is None:
+                # 잠금을 잡았거나(None: 캐시 장애) 직접 발급
+                try:
+                    return self._refresh_token()
+                finally:
+                    if acquired:
+                        self._cache_call(cache.delete, self.TOKEN_LOCK_KEY)
+
+            # 다른 요청이 재발급 중: 기존 토큰이 아직 유효하면 기다리지 않고 사용
+            if self._usable(cached):
+                return cached["token"]
+            while time.monotonic() < deadline:
+                time.sleep(self.WAIT_INTERVAL)
+                fresh = self._cache_call(cache.get, self.TOKEN_CACHE_KEY)
+                if self._usable(fresh, margin) and fresh["token"] != rejected:
+                    ImpClient._memo = fresh
+                    return fresh["token"]
+                if not self._cache_call(cache.get, self.TOKEN_LOCK_KEY):
+                    # 먼저 발급하던 요청이 실패하고 잠금을 풀었으면 다시 잠금을 잡아 직접 발급
+                    break
+            else:
+                return self._refresh_token()
+
+    def _refresh_token(self) -> str:
+        try:
+            # 토큰 발급은 같은 요청을 반복해도 안전하므로 재시도 허용
+            resp = get_client("iamport").post(
                 f"{self.base_url}/users/getToken",
                 json={"imp_key": settings.IMP_KEY, "imp_secret": settings.IMP_SECRET},
-                timeout=5,
+                idempotent=True,
             )
             resp.raise_for_status()
-            token = resp.json()["response"]["access_token"]
+            data = resp.json()["response"]
+            token = data["access_token"]
             if not token:
-                raise PaymentVerificationError("토큰 발급 실패")
-            self._access_token = token
-            return token
+                raise PaymentGatewayError("토큰 발급 실패")
         except requests.RequestException as e:
             logger.error(f"토큰 발급 실패: {e}")
-            raise PaymentVerificationError("결제 검증 중 오류가 발생했습니다.")
+            raise PaymentGatewayError("결제 검증 중 오류가 발생했습니다.")
+
+        # expired_at 은 아임포트 서버 시각 기준 → 서버 시각(now)과의 차이만큼만 유효하다고 봄
+        lifetime = int(data.get("expired_at") or 0) - int(data.get("now") or 0)
+        if lifetime <= 0:
+            lifetime = 30 * 60
+        entry = {"token": token, "expires_at": time.time() + lifetime}
+        self._cache_call(cache.set, self.TOKEN_CACHE_KEY, entry, timeout=lifetime)
+        ImpClient._memo = entry
+        return token
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        # 토큰이 거절(401)되면(다른 곳에서 재발급되어 무효화된 경우 등) 한 번만 재발급 후 다시 호출
+        token = self._get_token()
+        resp = get_client("iamport").request(
+            method,
+            f"{self.base_url}{path}",
+            headers={"Authorization": f"Bearer {token}"},
+            **kwargs,
+        )
+        if resp.status_code == 401:
+            resp.close()
+            token = self._get_token(rejected=token)
+            resp = get_client("iamport").request(
+                method,
+                f"{self.base_url}{path}",
+                headers={"Authorization": f"Bearer {token}"},
+                **kwargs,
+            )
+        return resp
 
     def get_payment(self, imp_uid: str) -> Dict[str, Any]:
         try:
-            resp = requests.get(
-                f"{self.base_url}/payments/{imp_uid}",
-                headers={"Authorization": f"Bearer {self._get_token()}"},
-                timeout=5,
-            )
+            resp = self._request("GET", f"/payments/{imp_uid}")
             resp.raise_for_status()
             return resp.json()["response"]
         except requests.RequestException as e:
             logger.error(f"결제 내역 조회 실패: {e}")
-            raise PaymentVerificationError("결제 내역을 조회하는 중 오류가 발생했습니다.")
+            raise PaymentGatewayError("결제 내역을 조회하는 중 오류가 발생했습니다.")
+
+    # 한 번에 조회할 수 있는 최대 imp_uid 수 / 목록 조회 페이지 크기 (아임포트 API 제한)
+    BATCH_LIMIT = 100
+
+    def get_payments(self, imp_uids: list) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 결제를 한 번에 조회합니다 (GET /payments?imp_uid[]=...). 아임포트에 없는 imp_uid 는 결과에서 빠집니다.
+        반환: {imp_uid: 결제 정보}
+        """
+        payments: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(imp_uids), self.BATCH_LIMIT):
+            chunk = imp_uids[start : start + self.BATCH_LIMIT]
+            try:
+                resp = self._request("GET", "/payments", params={"imp_uid[]": chunk})
+                # 하나도 찾지 못하면 404
+                if resp.status_code == 404:
+                    continue
+                resp.raise_for_status()
+            except requests.RequestException as e:
+                logger.error(f"결제 내역 일괄 조회 실패: {e}")
+                raise PaymentGatewayError("결제 내역을 조회하는 중 오류가 발생했습니다.")
+            for payment in resp.json()["response"] or []:
+                payments[payment["imp_uid"]] = payment
+        return payments
+
+    def list_payments(
+        self, status: str, since: datetime, until: datetime, page: int = 1
+    ) -> Tuple[list, bool]:
+        """
+        기간 안의 결제 목록 한 페이지를 조회합니다 (GET /payments/status/{status}).
+        반환: (결제 목록, 다음 페이지 존재 여부)
+        """
+        try:
+            resp = self._request(
+                "GET",
+                f"/payments/status/{status}",
+                params={
+                    "page": page,
+                    "limit": self.BATCH_LIMIT,
+                    "from": int(since.timestamp()),
+                    "to": int(until.timestamp()),
+                },
+            )
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"결제 목록 조회 실패: {e}")
+            raise PaymentGatewayError("결제 목록을 조회하는 중 오류가 발생했습니다.")
+        data = resp.json()["response"] or {}
+        return data.get("list") or [], bool(data.get("next"))
 
 
 class PaymentService:
@@ -109,9 +270,10 @@ class PaymentService:
     ) -> Tuple[PaymentResult, Subscribe]:
         user_id = user.id
 
-        # 1️⃣ 멱등성 처리
+        # 1️⃣ 멱등성 처리 (웹훅 워커가 먼저 처리한 결제 포함)
         existing = Subscribe.objects.filter(
-            user_id=user_id, merchant_uid=merchant_uid, is_active=True
+            Q(user_id=user_id, merchant_uid=merchant_uid, is_active=True)
+            | Q(user_id=user_id, imp_uid=imp_uid)
         ).first()
         if existing:
             # 기존 구독과 페이먼트 결과를 stub으로 반환
@@ -124,6 +286,32 @@ class PaymentService:
         payment = self.imp_client.get_payment(imp_uid)
         if payment.get("status") != "paid":
             raise PaymentVerificationError("결제가 완료되지 않았습니다.")
+        self._verify(payment, merchant_uid)
+
+        # 3️⃣ 결과 파싱 → 4️⃣ 이력 + 구독 생성
+        result = PaymentResult.from_payment(payment)
+        return result, self._activate(user, result)
+
+    def process_webhook_payment(self, imp_uid: str) -> Optional[Subscribe]:
+        """
+        웹훅으로 받은 결제를 아임포트에서 다시 조회해 검증하고 구독을 만듭니다. (imp_uid 기준 멱등)
+        결제 완료(paid)가 아닌 결제(가상계좌 발급, 취소 등)는 None 을 반환합니다.
+        """
+        existing = Subscribe.objects.filter(imp_uid=imp_uid).first()
+        if existing:
+            return existing
+
+        # 웹훅 본문은 위조될 수 있으므로 결제 상태/금액/사용자는 아임포트 조회 결과만 사용
+        payment = self.imp_client.get_payment(imp_uid)
+        if payment.get("status") != "paid":
+            return None
+        self._verify(payment, payment.get("merchant_uid"))
+
+        result = PaymentResult.from_payment(payment)
+        return self._activate(self._resolve_user(payment), result)
+
+    @staticmethod
+    def _verify(payment: Dict[str, Any], merchant_uid: Optional[str]) -> None:
         if payment.get("merchant_uid") != merchant_uid:
             raise PaymentVerificationError("merchant_uid가 일치하지 않습니다.")
         amount = int(payment.get("amount", 0))
@@ -132,37 +320,66 @@ class PaymentService:
                 f"결제 금액 불일치: 기대={settings.SINGLE_PLAN_PRICE}, 실제={amount}"
             )
 
-        # 3️⃣ 결과 파싱
-        result = PaymentResult.from_payment(payment)
+    @staticmethod
+    def _resolve_user(payment: Dict[str, Any]) -> User:
+        # 결제창 호출 시 custom_data 에 {"user_id": ...} 를 넣고, 없으면 구매자 이메일로 찾음
+        custom_data = payment.get("custom_data")
+        if isinstance(custom_data, str):
+            try:
+                custom_data = json.loads(custom_data)
+            except ValueError:
+                custom_data = None
+        user_id = custom_data.get("user_id") if isinstance(custom_data, dict) else None
 
-        # 4️⃣ 트랜잭션 단위로 이력 + 구독 생성
-        with transaction.atomic():
-            # 4-1) 결제 이력 저장
-            history = PaymentHistory.objects.create(
-                user=user,
-                imp_uid=result.imp_uid,
-                merchant_uid=result.merchant_uid,
-                amount=result.amount,
-                status=PaymentStatus.PAID,
-                payment_method=result.payment_method,
-                card_name=result.card_name,
-                card_number=result.card_number,
-                paid_at=result.paid_at,
-                receipt_url=result.receipt_url,
-            )
+        user = None
+        if user_id:
+            user = User.objects.filter(pk=user_id).first()
+        if user is None and payment.get("buyer_email"):
+            user = User.objects.filter(email=payment["buyer_email"]).first()
+        if user is None:
+            raise PaymentVerificationError("결제한 사용자를 찾을 수 없습니다.")
+        return user
 
-            # 4-2) 구독 생성 (merchant_uid 필수 저장)
-            expires_at = timezone.now() + timedelta(days=settings.SINGLE_PLAN_DURATION)
-            subscription = Subscribe.objects.create(
-                user=user,
-                imp_uid=history.imp_uid,
-                merchant_uid=history.merchant_uid,
-                expires_at=expires_at,
-                is_active=True,
-            )
+    @staticmethod
+    def _activate(user: User, result: PaymentResult) -> Subscribe:
+        # 트랜잭션 단위로 이력 + 구독 생성 (같은 imp_uid 를 동시에 처리하면 먼저 커밋된 구독을 반환)
+        try:
+            with transaction.atomic():
+                # 4-1) 결제 이력 저장
+                history = PaymentHistory.objects.create(
+                    user=user,
+                    imp_uid=result.imp_uid,
+                    merchant_uid=result.merchant_uid,
+                    amount=result.amount,
+                    status=PaymentStatus.PAID,
+                    payment_method=result.payment_method,
+                    card_name=result.card_name,
+                    card_number=result.card_number,
+                    paid_at=result.paid_at,
+                    receipt_url=result.receipt_url,
+                )
+
+                # 4-2) 구독 생성 (merchant_uid 필수 저장)
+                expires_at = timezone.now() + timedelta(
+                    days=settings.SINGLE_PLAN_DURATION
+                )
+                subscription = Subscribe.objects.create(
+                    user=user,
+                    imp_uid=history.imp_uid,
+                    merchant_uid=history.merchant_uid,
+                    expires_at=expires_at,
+                    is_active=True,
+                )
 
-            # 4-3) 사용자 상태 동기화
-            user.is_paid_user = True
-            user.save(update_fields=["is_paid_user"])
+                # 4-3) 사용자 상태 동기화 (권한 캐시는 Subscribe 저장 시그널이 커밋 후 무효화)
+                user.is_paid_user = True
+                user.save(update_fields=["is_paid_user"])
+        except IntegrityError:
+            existing = Subscribe.objects.filter(imp_uid=result.imp_uid).first()
+            if existing is None:
+                raise
+            if existing.user_id != user.id:
+                raise PaymentVerificationError("이미 다른 사용자에게 적용된 결제입니다.")
+            return existing
 
-        return result, subscription
+        return subscription
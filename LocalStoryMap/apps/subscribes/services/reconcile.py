@@ -0,0 +1,276 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Any, Dict, Iterator, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.paymenthistory.models import PaymentHistory, PaymentStatus
+from apps.subscribes.models import Subscribe
+
+from .entitlement import EntitlementService
+from .payment import ImpClient
+from .webhook import PaymentWebhookService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Discrepancy:
+    kind: str
+    imp_uid: str
+    merchant_uid: str = ""
+    local_status: str = ""
+    remote_status: str = ""
+    local_amount: Optional[int] = None
+    remote_amount: Optional[int] = None
+    detail: str = ""
+    repaired: bool = False
+
+
+class PaymentReconciler:
+    """
+    로컬 결제 이력(PaymentHistory)/구독(Subscribe)과 아임포트 결제 내역 대조
+
+    · 기간 안의 로컬 결제를 pk 기준 페이지(batch_size, 최대 100)로 읽고, 페이지마다 아임포트 일괄 조회
+      (GET /payments?imp_uid[]=...) 한 번으로 비교 → 결제 수만큼이 아니라 페이지 수만큼만 호출
+    · 일괄 조회는 동시에 concurrency 개까지만 보내고, 결과를 비교한 페이지만큼 다음 페이지를 읽음 (메모리 일정)
+    · 마지막으로 아임포트의 기간 내 결제 완료 목록을 훑어 로컬에 없는 결제를 찾음
+    repair=True 면 복구 가능한 항목(상태 불일치, 구독 누락, 로컬 누락)을 고칩니다.
+    금액/주문번호 불일치, 아임포트에 없는 결제는 보고만 합니다.
+    """
+
+    MISSING_REMOTE = "missing_remote"  # 로컬에만 있음
+    MISSING_LOCAL = "missing_local"  # 아임포트에서 결제 완료인데 로컬 이력 없음
+    STATUS_MISMATCH = "status_mismatch"
+    AMOUNT_MISMATCH = "amount_mismatch"
+    MERCHANT_MISMATCH = "merchant_mismatch"
+    SUBSCRIPTION_MISSING = "subscription_missing"  # 결제 완료인데 구독 없음
+    SUBSCRIPTION_NOT_PAID = "subscription_not_paid"  # 결제 취소/실패인데 구독 활성
+
+    REPORT_FIELDS = [
+        "kind",
+        "imp_uid",
+        "merchant_uid",
+        "local_status",
+        "remote_status",
+        "local_amount",
+        "remote_amount",
+        "detail",
+        "repaired",
+    ]
+
+    def __init__(
+        self,
+        since: datetime,
+        until: datetime,
+        batch_size: int = ImpClient.BATCH_LIMIT,
+        concurrency: int = 4,
+        repair: bool = False,
+        imp_client: Optional[ImpClient] = None,
+    ) -> None:
+        self.since = since
+        self.until = until
+        self.batch_size = min(batch_size, ImpClient.BATCH_LIMIT)
+        self.concurrency = concurrency
+        self.repair = repair
+        self.imp_client = imp_client or ImpClient()
+        self.checked = 0
+
+    def iter_local_batches(self) -> Iterator[list]:
+        # pk 기준 키셋 페이지 (커서를 열어 두지 않음, 소프트 삭제된 이력 포함)
+        queryset = PaymentHistory.all_objects.filter(
+            created_at__gte=self.since, created_at__lt=self.until
+        ).order_by("pk")
+        last_pk = 0
+        while True:
+            batch = list(
+                queryset.filter(pk__gt=last_pk).values(
+                    "pk", "user_id", "imp_uid", "merchant_uid", "amount", "status"
+                )[: self.batch_size]
+            )
+            if not batch:
+                return
+            yield batch
+            last_pk = batch[-1]["pk"]
+
+    def run(self) -> Iterator[Discrepancy]:
+        local_imp_uids = set()
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="reconcile"
+        ) as pool:
+            pending: deque = deque()
+            for batch in self.iter_local_batches():
+                imp_uids = [row["imp_uid"] for row in batch]
+                local_imp_uids.update(imp_uids)
+                pending.append(
+                    (batch, pool.submit(self.imp_client.get_payments, imp_uids))
+                )
+                if len(pending) >= self.concurrency:
+                    batch, future = pending.popleft()
+                    yield from self._diff_batch(batch, future.result())
+            while pending:
+                batch, future = pending.popleft()
+                yield from self._diff_batch(batch, future.result())
+
+        yield from self._find_missing_local(local_imp_uids)
+
+    def _diff_batch(
+        self, batch: list, remote: Dict[str, Dict[str, Any]]
+    ) -> Iterator[Discrepancy]:
+        subscriptions = {
+            sub["imp_uid"]: sub
+            for sub in Subscribe.objects.filter(
+                imp_uid__in=[row["imp_uid"] for row in batch]
+            ).values("imp_uid", "is_active")
+        }
+        for row in batch:
+            self.checked += 1
+            payment = remote.get(row["imp_uid"])
+            base = Discrepancy(
+                kind="",
+                imp_uid=row["imp_uid"],
+                merchant_uid=row["merchant_uid"],
+                local_status=row["status"],
+                remote_status=payment.get("status", "") if payment else "",
+                local_amount=row["amount"],
+                remote_amount=int(payment.get("amount", 0)) if payment else None,
+            )
+            yield from self._diff_row(row, payment, subscriptions, base)
+
+    def _diff_row(
+        self,
+        row: dict,
+        payment: Optional[Dict[str, Any]],
+        subscriptions: dict,
+        base: Discrepancy,
+    ) -> Iterator[Discrepancy]:
+        def found(kind: str, detail: str = "") -> Discrepancy:
+            return replace(base, kind=kind, detail=detail)
+
+        if payment is None:
+            yield found(self.MISSING_REMOTE, "아임포트에 결제 내역이 없습니다.")
+            return
+
+        if payment.get("merchant_uid") != row["merchant_uid"]:
+            yield found(
+                self.MERCHANT_MISMATCH,
+                f"아임포트 merchant_uid={payment.get('merchant_uid')}",
+            )
+        if base.remote_amount != row["amount"]:
+            yield found(self.AMOUNT_MISMATCH)
+
+        remote_status = payment.get("status")
+        subscription = subscriptions.get(row["imp_uid"])
+        if remote_status != row["status"]:
+            item = found(self.STATUS_MISMATCH)
+            if self.repair and remote_status in {s.value for s in PaymentStatus}:
+                self._repair_status(row, remote_status)
+                item.repaired = True
+            yield item
+        elif (
+            remote_status != PaymentStatus.PAID
+            and subscription
+            and subscription["is_active"]
+        ):
+            item = found(self.SUBSCRIPTION_NOT_PAID)
+            if self.repair:
+                self._deactivate(row["imp_uid"], row["user_id"])
+                item.repaired = True
+            yield item
+
+        if remote_status == PaymentStatus.PAID and subscription is None:
+            item = found(self.SUBSCRIPTION_MISSING)
+            if self.repair:
+                self._create_subscription(row, payment)
+                item.repaired = True
+            yield item
+
+    def _find_missing_local(self, local_imp_uids: set) -> Iterator[Discrepancy]:
+        page, has_next = 1, True
+        while has_next:
+            payments, has_next = self.imp_client.list_payments(
+                PaymentStatus.PAID.value, self.since, self.until, page=page
+            )
+            page += 1
+            candidates = [p for p in payments if p.get("imp_uid") not in local_imp_uids]
+            if not candidates:
+                continue
+            # 로컬 기간(created_at)과 아임포트 결제 시각이 어긋날 수 있으므로 기간과 무관하게 한 번 더 확인
+            known = set(
+                PaymentHistory.all_objects.filter(
+                    imp_uid__in=[p["imp_uid"] for p in candidates]
+                ).values_list("imp_uid", flat=True)
+            )
+            for payment in candidates:
+                if payment["imp_uid"] in known:
+                    continue
+                item = Discrepancy(
+                    kind=self.MISSING_LOCAL,
+                    imp_uid=payment["imp_uid"],
+                    merchant_uid=payment.get("merchant_uid") or "",
+                    remote_status=payment.get("status", ""),
+                    remote_amount=int(payment.get("amount", 0)),
+                    detail="로컬 결제 이력이 없습니다.",
+                )
+                if self.repair:
+                    # 웹훅 대기열로 넘겨 웹훅과 같은 검증/구독 생성 절차를 거침
+                    # (아임포트에서 확인한 결제이므로 이미 완료된 이벤트도 다시 처리)
+                    PaymentWebhookService.receive(
+                        {
+                            "imp_uid": payment["imp_uid"],
+                            "merchant_uid": item.merchant_uid,
+                            "status": item.remote_status,
+                            "source": "reconcile",
+                        },
+                        force=True,
+                    )
+                    item.repaired = True
+                yield item
+
+    # ─── 복구 ───
+
+    def _deactivate(self, imp_uid: str, user_id: int) -> None:
+        with transaction.atomic():
+            Subscribe.objects.filter(imp_uid=imp_uid, is_active=True).update(
+                is_active=False
+            )
+            EntitlementService.sync_users([user_id])
+
+    def _repair_status(self, row: dict, remote_status: str) -> None:
+        with transaction.atomic():
+            PaymentHistory.all_objects.filter(pk=row["pk"]).update(status=remote_status)
+            if remote_status != PaymentStatus.PAID:
+                self._deactivate(row["imp_uid"], row["user_id"])
+        logger.info(
+            "결제 상태 복구: imp_uid=%s %s → %s",
+            row["imp_uid"],
+            row["status"],
+            remote_status,
+        )
+
+    def _create_subscription(self, row: dict, payment: Dict[str, Any]) -> None:
+        # 결제 시각 기준으로 만료일 계산 (이미 만료됐으면 비활성 구독으로 기록만)
+        paid_at = payment.get("paid_at")
+        paid_at = (
+            datetime.fromtimestamp(int(paid_at), tz=dt_timezone.utc)
+            if paid_at
+            else timezone.now()
+        )
+        expires_at = paid_at + timedelta(days=settings.SINGLE_PLAN_DURATION)
+        with transaction.atomic():
+            Subscribe.objects.get_or_create(
+                imp_uid=row["imp_uid"],
+                defaults={
+                    "user_id": row["user_id"],
+                    "merchant_uid": row["merchant_uid"],
+                    "expires_at": expires_at,
+                    "is_active": expires_at > timezone.now(),
+                },
+            )
+            EntitlementService.sync_users([row["user_id"]])
@@ -0,0 +1,168 @@
+import logging
+from datetime import timedelta
+from typing import Optional, Union
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.db.models.expressions import Combinable
+from django.utils import timezone
+
+from apps.subscribes.models import PaymentWebhookEvent
+from config import background
+
+from .payment import PaymentGatewayError, PaymentService, PaymentVerificationError
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentWebhookService:
+    """
+    아임포트 결제 웹훅 처리
+
+    · 수신: imp_uid 당 한 행(PaymentWebhookEvent)으로 기록하고 바로 응답, 처리는 백그라운드 워커 풀에 넘김
+      → 결제가 몰려도 요청 워커는 아임포트를 기다리지 않고, 워커 풀 크기만큼씩 차례로 처리됨
+    · 처리: 조건부 UPDATE 로 이벤트를 선점한 워커 하나만 PaymentService.process_webhook_payment 실행
+    · 재시도: 실패/중단된 이벤트는 process_payment_webhooks 명령(크론)이 다시 처리
+      실패할 때마다 재시도 간격을 두 배로 늘리고(next_attempt_at), 아임포트 장애는 시도 횟수로 세지 않음
+      → 아임포트가 몇 분 동안 내려가도 결제 완료 웹훅이 최종 실패로 끝나지 않음
+    """
+
+    @staticmethod
+    def receive(payload: dict, force: bool = False) -> PaymentWebhookEvent:
+        """
+        웹훅을 기록하고 처리 대기열에 넣습니다.
+
+        웹훅 엔드포인트는 인증이 없어 imp_uid 만 알면 누구나 같은 웹훅을 다시 보낼 수 있으므로,
+        이미 있는 이벤트는 실패했고 재시도 시각이 지났거나 처리 중에 멈춘 것만 다시 대기열에 넣습니다.
+        완료/대기/처리 중인 이벤트는 건드리지 않고 아임포트 조회도 예약하지 않습니다.
+        force=True 는 아임포트에서 직접 확인한 경우(결제 대조 복구)에만 쓰며 완료된 이벤트도 다시 처리합니다.
+        """
+        imp_uid = payload["imp_uid"]
+        event, created = PaymentWebhookEvent.objects.get_or_create(
+            imp_uid=imp_uid,
+            defaults={
+                "merchant_uid": payload.get("merchant_uid", ""),
+                "status": payload.get("status", ""),
+                "payload": payload,
+            },
+        )
+        if not created:
+            now = timezone.now()
+            stale_before = now - timedelta(
+                seconds=settings.PAYMENT_WEBHOOK_PROCESSING_TIMEOUT
+            )
+            requeue = Q(
+                Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+                state=PaymentWebhookEvent.State.FAILED,
+            ) | Q(
+                state=PaymentWebhookEvent.State.PROCESSING, updated_at__lt=stale_before
+            )
+            if force:
+                requeue |= Q(
+                    state__in=[
+                        PaymentWebhookEvent.State.FAILED,
+                        PaymentWebhookEvent.State.DONE,
+                    ]
+                )
+            # 시도 횟수는 되살리되 연속 실패 횟수(retries)는 남겨 재전송으로 재시도 간격이 줄지 않게 함
+            requeued = (
+                PaymentWebhookEvent.objects.filter(pk=event.pk)
+                .filter(requeue)
+                .update(
+                    status=payload.get("status", ""),
+                    payload=payload,
+                    state=PaymentWebhookEvent.State.PENDING,
+                    attempts=0,
+                    next_attempt_at=None,
+                    last_error="",
+                )
+            )
+            if not requeued:
+                return event
+        background.submit_on_commit(PaymentWebhookService.process, event.pk)
+        return event
+
+    @staticmethod
+    def _claim(event_id: int) -> Optional[PaymentWebhookEvent]:
+        # 대기 상태, 재시도 시각이 된 실패 상태, 처리 중에 멈춘(타임아웃 지난) 이벤트만 선점
+        now = timezone.now()
+        stale_before = now - timedelta(
+            seconds=settings.PAYMENT_WEBHOOK_PROCESSING_TIMEOUT
+        )
+        claimed = (
+            PaymentWebhookEvent.objects.filter(pk=event_id)
+            .filter(
+                Q(state=PaymentWebhookEvent.State.PENDING)
+                | Q(
+                    Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+                    state=PaymentWebhookEvent.State.FAILED,
+                )
+                | Q(
+                    state=PaymentWebhookEvent.State.PROCESSING,
+                    updated_at__lt=stale_before,
+                )
+            )
+            .filter(attempts__lt=settings.PAYMENT_WEBHOOK_MAX_ATTEMPTS)
+            .update(
+                state=PaymentWebhookEvent.State.PROCESSING,
+                attempts=F("attempts") + 1,
+                next_attempt_at=None,
+                updated_at=now,
+            )
+        )
+        if not claimed:
+            return None
+        return PaymentWebhookEvent.objects.get(pk=event_id)
+
+    @staticmethod
+    def _backoff(retries: int) -> timedelta:
+        # 연속 실패 횟수에 따라 두 배씩 늘어나는 재시도 간격 (최대 PAYMENT_WEBHOOK_RETRY_BACKOFF_MAX)
+        seconds = settings.PAYMENT_WEBHOOK_RETRY_BACKOFF * 2 ** min(retries, 16)
+        return timedelta(
+            seconds=min(seconds, settings.PAYMENT_WEBHOOK_RETRY_BACKOFF_MAX)
+        )
+
+    @staticmethod
+    def process(event_id: int) -> bool:
+        """
+        이벤트 하나를 처리합니다. 다른 워커가 이미 선점했거나 처리한 이벤트면 False.
+        """
+        event = PaymentWebhookService._claim(event_id)
+        if event is None:
+            return False
+
+        state = PaymentWebhookEvent.State.DONE
+        error = ""
+        # 시도 횟수는 선점할 때 늘린 값 그대로 두는 것이 기본
+        attempts: Union[int, Combinable] = F("attempts")
+        try:
+            subscription = PaymentService().process_webhook_payment(event.imp_uid)
+            if subscription is None:
+                error = "결제 완료 상태가 아니어서 구독을 만들지 않았습니다."
+        except PaymentGatewayError as e:
+            # 아임포트 장애(서킷 열림/벌크헤드 초과 포함): 우리 쪽 처리 실패가 아니므로
+            # 이번 시도를 횟수에서 되돌리고, 늘어나는 간격으로 process_payment_webhooks 에서 다시 시도
+            logger.warning("결제 웹훅 처리 보류: imp_uid=%s (%s)", event.imp_uid, e)
+            state, error = PaymentWebhookEvent.State.FAILED, str(e)
+            attempts = F("attempts") - 1
+        except PaymentVerificationError as e:
+            # 금액/주문번호 불일치 등은 다시 시도해도 같으므로 실패로 남기고 재시도하지 않음
+            state, error = PaymentWebhookEvent.State.FAILED, str(e)
+            attempts = settings.PAYMENT_WEBHOOK_MAX_ATTEMPTS
+        except Exception as e:
+            logger.exception("결제 웹훅 처리 실패: imp_uid=%s", event.imp_uid)
+            state, error = PaymentWebhookEvent.State.FAILED, str(e)
+
+        done = state == PaymentWebhookEvent.State.DONE
+        now = timezone.now()
+        PaymentWebhookEvent.objects.filter(pk=event.pk).update(
+            state=state,
+            attempts=attempts,
+            retries=0 if done else event.retries + 1,
+            next_attempt_at=None
+            if done
+            else now + PaymentWebhookService._backoff(event.retries),
+            last_error=error,
+            processed_at=now if done else None,
+        )
+        return done
@@ -0,0 +1,16 @@
+# apps/subscribes/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Subscribe
+from .services.entitlement import EntitlementService
+
+
+@receiver(post_save, sender=Subscribe)
+@receiver(post_delete, sender=Subscribe)
+def invalidate_entitlement_cache(sender, instance, **kwargs):
+    # 구매/취소/관리자 수정으로 구독이 바뀌면 권한 캐시 무효화
+    # (update() 로 일괄 변경하는 만료 처리/대조는 EntitlementService.sync_users 가 무효화)
+    user_id = instance.user_id
+    transaction.on_commit(lambda: EntitlementService.invalidate([user_id]))
@@ -1,6 +1,10 @@
 from django.urls import path
 
-from .apis import SubscribeDetailAPIView, SubscribeListCreateAPIView
+from .apis import (
+    PaymentWebhookAPIView,
+    SubscribeDetailAPIView,
+    SubscribeListCreateAPIView,
+)
 
 app_name = "subscribes"
 
@@ -15,4 +19,9 @@ urlpatterns = [
         SubscribeDetailAPIView.as_view(),
         name="subscribe-detail",
     ),
+    path(
+        "webhook/iamport/",
+        PaymentWebhookAPIView.as_view(),
+        name="payment-webhook",
+    ),
 ]
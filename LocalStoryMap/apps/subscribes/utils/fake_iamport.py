@@ -0,0 +1,150 @@
+import re
+import threading
+import time
+import uuid
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from django.conf import settings
+
+from config.stub_server import JsonStubHandler
+
+
+class FakeIamportStats:
+    # 가짜 아임포트가 받은 조회 요청 집계 (엔드포인트별 호출 수, 최대 동시 처리 수)
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: dict = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def started(self, endpoint: str) -> None:
+        with self._lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+def fake_iamport_handler(
+    payments: Optional[dict] = None,
+    buyer_email: str = "",
+    delay: float = 0.0,
+    page_size: int = 100,
+):
+    """
+    아임포트 REST API 중 결제 검증/대조에 쓰는 엔드포인트를 흉내 내는 가짜 API 핸들러
+
+      POST /users/getToken                       토큰 발급
+      GET  /payments/{imp_uid}                   결제 단건 조회
+      GET  /payments?imp_uid[]=...               결제 일괄 조회 (하나도 없으면 404)
+      GET  /payments/status/{status}?page&from&to 상태별 결제 목록 (paid_at 기준 기간, {list, next})
+
+    payments({imp_uid: 결제 정보})에 있는 결제는 그대로 돌려주고, 없는 imp_uid 는 buyer_email 이 있으면
+    그 사용자의 결제 완료(merchant_uid 는 imp_ → sim_)로, 없으면 404 로 응답합니다.
+    조회마다 delay 초 기다리며, 집계는 Handler.stats 로 확인합니다.
+    """
+    payments = payments if payments is not None else {}
+
+    def find(imp_uid: str) -> Optional[dict]:
+        if imp_uid in payments:
+            return payments[imp_uid]
+        if not buyer_email or not imp_uid.startswith("imp_"):
+            return None
+        return {
+            "imp_uid": imp_uid,
+            "merchant_uid": f"sim_{imp_uid[len('imp_'):]}",
+            "status": "paid",
+            "amount": settings.SINGLE_PLAN_PRICE,
+            "pay_method": "card",
+            "buyer_email": buyer_email,
+            "paid_at": int(time.time()),
+        }
+
+    class Handler(JsonStubHandler):
+        stats = FakeIamportStats()
+
+        def do_POST(self):
+            self.read_json()
+            if self.path != "/users/getToken":
+                return self.send_json(404, {"code": 1, "response": None})
+            now = int(time.time())
+            self.send_json(
+                200,
+                {
+                    "code": 0,
+                    "response": {
+                        "access_token": uuid.uuid4().hex,
+                        "now": now,
+                        "expired_at": now + 1800,
+                    },
+                },
+            )
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            status_match = re.match(r"^/payments/status/(\w+)$", url.path)
+            single_match = re.match(r"^/payments/(imp_\w+)$", url.path)
+            if url.path == "/payments":
+                endpoint = "batch"
+            elif status_match:
+                endpoint = "status"
+            elif single_match:
+                endpoint = "single"
+            else:
+                return self.send_json(404, {"code": 1, "response": None})
+
+            self.stats.started(endpoint)
+            try:
+                if delay:
+                    time.sleep(delay)
+                if endpoint == "batch":
+                    found = [
+                        payment
+                        for payment in map(find, query.get("imp_uid[]", []))
+                        if payment
+                    ]
+                    if not found:
+                        return self.send_json(404, {"code": 1, "response": None})
+                    return self.send_json(200, {"code": 0, "response": found})
+
+                if endpoint == "status":
+                    page = int(query.get("page", ["1"])[0])
+                    since = int(query.get("from", ["0"])[0])
+                    until = int(query.get("to", [str(2**31)])[0])
+                    matched = sorted(
+                        (
+                            payment
+                            for payment in payments.values()
+                            if payment["status"] == status_match.group(1)
+                            and since <= int(payment.get("paid_at") or 0) <= until
+                        ),
+                        key=lambda payment: payment["imp_uid"],
+                    )
+                    start = (page - 1) * page_size
+                    return self.send_json(
+                        200,
+                        {
+                            "code": 0,
+                            "response": {
+                                "total": len(matched),
+                                "list": matched[start : start + page_size],
+                                "next": page + 1
+                                if start + page_size < len(matched)
+                                else 0,
+                            },
+                        },
+                    )
+
+                payment = find(single_match.group(1))
+                if payment is None:
+                    return self.send_json(404, {"code": 1, "response": None})
+                self.send_json(200, {"code": 0, "response": payment})
+            finally:
+                self.stats.finished()
+
+    return Handler
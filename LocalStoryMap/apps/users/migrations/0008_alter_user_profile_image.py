@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-19 15:20
+
+from django.db import migrations, models
+
+import apps.images.storage
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0007_alter_user_profile_image"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="profile_image",
+            field=models.ImageField(
+                blank=True,
+                max_length=300,
+                null=True,
+                storage=apps.images.storage.select_s3_storage,
+                upload_to="profile_images/%Y/%m/%d/",
+            ),
+        ),
+    ]
@@ -2,9 +2,8 @@ from typing import Any, ClassVar, List, Optional, TypeVar
 
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
-from storages.backends.s3boto3 import S3Boto3Storage
 
-s3_storage = S3Boto3Storage()
+from apps.images.storage import select_s3_storage
 
 UserType = TypeVar("UserType", bound="User")
 
@@ -86,7 +85,7 @@ class User(AbstractUser):
     social_id = models.CharField(max_length=300, blank=True, null=True)
     profile_image = models.ImageField(
         upload_to="profile_images/%Y/%m/%d/",
-        storage=s3_storage,
+        storage=select_s3_storage,
         max_length=300,
         blank=True,
         null=True,
@@ -0,0 +1,122 @@
+import io
+import logging
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from PIL import Image, ImageOps
+
+from config import background
+from config.http import get_client
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileImageService:
+    """
+    소셜 로그인 프로필 이미지를 로그인 요청 밖(백그라운드)에서 내려받아
+    정사각형 아바타로 리사이즈한 뒤 User.profile_image 에 저장합니다.
+
+    · 같은 사용자에 대한 동시 로그인은 캐시 잠금으로 한 번만 내려받음
+    · 작업 중에 사용자가 직접 이미지를 올렸으면 덮어쓰지 않음
+    """
+
+    @staticmethod
+    def _lock_key(user_id: int) -> str:
+        return f"users:profile_image:fetch:{user_id}"
+
+    @staticmethod
+    def placeholder_url(source_url: str) -> str:
+        # 저장이 끝나기 전까지 응답에 쓰는 URL (설정이 없으면 소셜 서비스의 원본 URL)
+        return settings.PROFILE_IMAGE_PLACEHOLDER_URL or source_url
+
+    @staticmethod
+    def schedule(user: User, source_url: Optional[str]) -> bool:
+        """
+        프로필 이미지가 없는 사용자면 백그라운드 수집을 예약하고 True 를 반환합니다.
+        (이미 같은 사용자의 수집이 진행 중이어도 True — 응답에는 placeholder 를 사용)
+        """
+        if not source_url or user.profile_image:
+            return False
+        if cache.add(
+            ProfileImageService._lock_key(user.id),
+            source_url,
+            timeout=settings.PROFILE_IMAGE_FETCH_LOCK_SECONDS,
+        ):
+            background.submit_on_commit(ProfileImageService.ingest, user.id, source_url)
+        return True
+
+    @staticmethod
+    def _download(source_url: str) -> bytes:
+        max_bytes = settings.PROFILE_IMAGE_MAX_BYTES
+        # 소셜 서비스마다 이미지 호스트가 다르므로 호스트별 클라이언트(세션/서킷 브레이커)를 사용
+        # → 한 호스트의 장애로 다른 소셜 서비스의 이미지 수집까지 막히지 않음
+        host = urlparse(source_url).hostname or ""
+        with get_client(f"profile_image:{host}").get(
+            source_url, timeout=settings.PROFILE_IMAGE_FETCH_TIMEOUT, stream=True
+        ) as resp:
+            resp.raise_for_status()
+            buffer = io.BytesIO()
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                buffer.write(chunk)
+                if buffer.tell() > max_bytes:
+                    raise ValueError(f"프로필 이미지가 너무 큽니다: {source_url}")
+        return buffer.getvalue()
+
+    @staticmethod
+    def build_avatar(data: bytes) -> bytes:
+        size = settings.PROFILE_IMAGE_SIZE
+        image: Image.Image = Image.open(io.BytesIO(data))
+        image.draft("RGB", (size * 2, size * 2))
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        # 가운데 기준으로 정사각형으로 잘라서 리사이즈
+        avatar = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        avatar.save(buffer, "JPEG", quality=85, optimize=True)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _store(user_id: int, avatar: bytes) -> bool:
+        user = User.objects.filter(pk=user_id).first()
+        if user is None or user.profile_image:
+            return False
+
+        field = User._meta.get_field("profile_image")
+        name = field.generate_filename(user, f"profile_{user_id}.jpg")
+        name = field.storage.save(
+            name, ContentFile(avatar), max_length=field.max_length
+        )
+        # 그 사이 사용자가 직접 올린 이미지가 있으면 조건부 UPDATE 가 0건 → 방금 올린 파일 삭제
+        updated = (
+            User.objects.filter(pk=user_id)
+            .filter(Q(profile_image="") | Q(profile_image__isnull=True))
+            .update(profile_image=name)
+        )
+        if not updated:
+            field.storage.delete(name)
+        return bool(updated)
+
+    @staticmethod
+    def ingest(user_id: int, source_url: str) -> bool:
+        # 백그라운드 워커에서 실행 (실패해도 로그인에는 영향 없음, 다음 로그인에서 다시 시도)
+        try:
+            data = ProfileImageService._download(source_url)
+            return ProfileImageService._store(
+                user_id, ProfileImageService.build_avatar(data)
+            )
+        except (
+            requests.RequestException,
+            OSError,
+            ValueError,
+            Image.DecompressionBombError,
+        ) as e:
+            logger.warning("프로필 이미지 수집 실패: user=%s (%s)", user_id, e)
+            return False
+        finally:
+            cache.delete(ProfileImageService._lock_key(user_id))
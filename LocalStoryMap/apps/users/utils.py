@@ -1,6 +1,7 @@
-import requests
 from django.conf import settings
 
+from config.http import get_client
+
 
 class KakaoAPI:
     @staticmethod
@@ -17,7 +18,8 @@ class KakaoAPI:
             "code": code,
         }
         headers = {"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
-        response = requests.post(url, data=data, headers=headers)
+        # 인가 코드는 한 번만 쓸 수 있으므로 재시도하지 않음 (POST 기본값)
+        response = get_client("kakao").post(url, data=data, headers=headers)
         if response.status_code != 200:
             raise Exception(f"토큰 교환 실패: {response.status_code} - {response.text}")
 
@@ -33,7 +35,7 @@ class KakaoAPI:
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
         }
-        response = requests.get(url, headers=headers)
+        response = get_client("kakao").get(url, headers=headers)
         if response.status_code != 200:
             raise Exception(f"Kakao API 에러: {response.status_code} - {response.text}")
 
@@ -64,13 +66,13 @@ def get_google_user_info(code: str) -> dict:
         "client_id": settings.GOOGLE_OAUTH2_CLIENT_ID,
         "client_secret": settings.GOOGLE_OAUTH2_CLIENT_SECRET,
     }
-    token_resp = requests.post(token_url, data=data)
+    token_resp = get_client("google").post(token_url, data=data)
     token_resp.raise_for_status()
     access_token = token_resp.json().get("access_token")
 
     # 2) 사용자 정보 조회 (OpenID Connect)
     userinfo_url = "https://openidconnect.googleapis.com/v1/userinfo"
     headers = {"Authorization": f"Bearer {access_token}"}
-    userinfo_resp = requests.get(userinfo_url, headers=headers)
+    userinfo_resp = get_client("google").get(userinfo_url, headers=headers)
     userinfo_resp.raise_for_status()
     return userinfo_resp.json()
@@ -1,8 +1,6 @@
 import logging
 from urllib.parse import unquote
 
-import requests
-from django.core.files.base import ContentFile
 from django.db import transaction
 from django.utils import timezone
 from drf_yasg import openapi
@@ -16,6 +14,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from .models import User
 from .serializers import UserSerializer
+from .services import ProfileImageService
 from .utils import KakaoAPI, get_google_user_info
 
 
@@ -77,26 +76,11 @@ class KakaoLoginView(APIView):
                     existing.social_id = social_id
                     existing.last_login = timezone.now()
                     set_nick = not existing.nickname and bool(nickname)
-                    set_image = not existing.profile_image and bool(profile_image)
 
                     update_fields = ["provider", "social_id", "last_login"]
                     if set_nick:
                         existing.nickname = nickname
                         update_fields.append("nickname")
-                    if set_image:
-                        resp = requests.get(profile_image)
-                        if resp.status_code == 200:
-                            # URL 끝의 '/' 제거 → '…/profile_42.q70'
-                            raw = profile_image.split("?", 1)[0].rstrip("/")
-                            # 파일명에서 확장자 분리, 없으면 jpg 사용
-                            ext = raw.rsplit(".", 1)[-1] if "." in raw else "jpg"
-                            fname = f"profile_{existing.id}.{ext}"
-                            existing.profile_image.save(
-                                fname,
-                                ContentFile(resp.content),
-                                save=False,
-                            )
-                        update_fields.append("profile_image")
                     existing.save(update_fields=update_fields)
                     user = existing
                     created = False
@@ -108,17 +92,11 @@ class KakaoLoginView(APIView):
                         provider="kakao",
                         social_id=social_id,
                     )
-                    if profile_image:
-                        resp = requests.get(profile_image)
-                        if resp.status_code == 200:
-                            raw = profile_image.split("?", 1)[0].rstrip("/")
-                            ext = raw.rsplit(".", 1)[-1] if "." in raw else "jpg"
-                            fname = f"profile_{user.id}.{ext}"
-                            user.profile_image.save(
-                                fname, ContentFile(resp.content), save=True
-                            )
                     created = True
 
+            # 프로필 이미지가 없으면 백그라운드에서 내려받아 저장 (로그인 응답은 기다리지 않음)
+            image_pending = ProfileImageService.schedule(user, profile_image)
+
             # 4) JWT 토큰 발급
             refresh = RefreshToken.for_user(user)
             access_jwt = str(refresh.access_token)
@@ -126,6 +104,10 @@ class KakaoLoginView(APIView):
 
             # 5) 응답 구성
             user_data = UserSerializer(user).data
+            if image_pending:
+                user_data["profile_image"] = ProfileImageService.placeholder_url(
+                    profile_image
+                )
             return Response(
                 {
                     "access": access_jwt,
@@ -195,19 +177,6 @@ class GoogleLoginView(APIView):
                 user.nickname = name
                 update_fields.append("nickname")
 
-            # 2-3) 프로필 이미지가 없을 때만 설정
-            if picture and not user.profile_image:
-                resp = requests.get(picture)
-                if resp.status_code == 200:
-                    ext = picture.split("?")[0].rsplit(".", 1)[-1]
-                    fname = f"profile_{user.id}.{ext}"
-                    user.profile_image.save(
-                        fname,
-                        ContentFile(resp.content),
-                        save=False,
-                    )
-                update_fields.append("profile_image")
-
             user.save(update_fields=update_fields)
             created = False
 
@@ -220,23 +189,11 @@ class GoogleLoginView(APIView):
                 existing.last_login = timezone.now()
 
                 set_nick = not existing.nickname and bool(name)
-                set_image = not existing.profile_image and bool(picture)
 
                 update_fields = ["provider", "social_id", "last_login"]
                 if set_nick:
                     existing.nickname = name
                     update_fields.append("nickname")
-                if set_image:
-                    resp = requests.get(picture)
-                    if resp.status_code == 200:
-                        ext = picture.split("?")[0].rsplit(".", 1)[-1]
-                        fname = f"profile_{existing.id}.{ext}"
-                        existing.profile_image.save(
-                            fname,
-                            ContentFile(resp.content),
-                            save=False,
-                        )
-                    update_fields.append("profile_image")
                 existing.save(update_fields=update_fields)
 
                 user = existing
@@ -251,14 +208,8 @@ class GoogleLoginView(APIView):
                 )
                 created = True
 
-                if picture:
-                    resp = requests.get(picture)
-                    if resp.status_code == 200:
-                        ext = picture.split("?")[0].rsplit(".", 1)[-1]
-                        fname = f"profile_{user.id}.{ext}"
-                        user.profile_image.save(
-                            fname, ContentFile(resp.content), save=True
-                        )
+        # 3) 프로필 이미지가 없으면 백그라운드에서 내려받아 저장 (로그인 응답은 기다리지 않음)
+        image_pending = ProfileImageService.schedule(user, picture)
 
         # 5) JWT 발급 및 응답
         refresh = RefreshToken.for_user(user)
@@ -266,6 +217,8 @@ class GoogleLoginView(APIView):
         refresh_jwt = str(refresh)
 
         user_data = UserSerializer(user).data
+        if image_pending:
+            user_data["profile_image"] = ProfileImageService.placeholder_url(picture)
         return Response(
             {
                 "access": access_jwt,
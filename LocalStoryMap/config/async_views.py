@@ -0,0 +1,40 @@
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    핸들러(post 등)를 async def 로 작성할 수 있는 APIView
+
+    인증/권한/스로틀(initial)은 DB 를 쓰므로 스레드에서 실행하고, 핸들러는 이벤트 루프에서 바로 await 합니다.
+    외부 API(Clova 등)를 기다리는 동안 워커 스레드를 잡지 않으므로 ASGI 에서 동시 처리량이 늘어납니다.
+    렌더링/예외 처리(finalize_response, handle_exception)는 APIView 와 같습니다.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            # options / http_method_not_allowed 는 동기 메서드
+            if hasattr(response, "__await__"):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
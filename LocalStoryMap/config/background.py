@@ -0,0 +1,57 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    # 프로세스당 하나의 백그라운드 워커 풀 (첫 사용 시 생성)
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BACKGROUND_WORKERS,
+                    thread_name_prefix="background",
+                )
+    return _executor
+
+
+def _run(func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    # 워커 스레드마다 DB 커넥션이 따로 열리므로 작업 전후로 정리
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception("백그라운드 작업 실패: %s", getattr(func, "__name__", func))
+        raise
+    finally:
+        close_old_connections()
+
+
+def submit(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """
+    요청 스레드를 막지 않도록 작업을 백그라운드 워커 풀에 넘깁니다.
+    BACKGROUND_TASKS_EAGER=True(테스트)면 즉시 동기 실행합니다.
+    """
+    if getattr(settings, "BACKGROUND_TASKS_EAGER", False):
+        future: Future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+    return get_executor().submit(_run, func, args, kwargs)
+
+
+def submit_on_commit(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    # 트랜잭션이 커밋된 뒤에 작업을 넘김 (커밋 전 데이터를 읽는 일이 없도록)
+    transaction.on_commit(lambda: submit(func, *args, **kwargs))
@@ -1,8 +1,21 @@
+from rest_framework import status
+from rest_framework.response import Response
 from rest_framework.views import exception_handler as drf_exception_handler
 from sentry_sdk import capture_exception
 
+from config.resilience import DependencyUnavailable
+
 
 def custom_exception_handler(exc, context):
+    # 서킷 열림/동시 호출 상한으로 외부 연동을 호출하지 않은 경우: 잠시 후 다시 시도하도록 503
+    # (장애 중에는 요청마다 발생하므로 Sentry 에는 남기지 않음, 거부 수는 config.http 지표로 집계)
+    if isinstance(exc, DependencyUnavailable):
+        return Response(
+            {"detail": str(exc)},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     # 기본 DRF 예외 핸들링
     response = drf_exception_handler(exc, context)
 
@@ -0,0 +1,371 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import defaultdict
+from typing import Any, Optional
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from config.resilience import (
+    AsyncBulkhead,
+    Bulkhead,
+    DependencyUnavailable,
+    breaker_states,
+    get_breaker,
+)
+
+logger = logging.getLogger(__name__)
+
+# 재시도해도 결과가 같은 메서드 (POST 는 호출하는 쪽에서 idempotent=True 로 명시)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# 일시적인 장애로 보고 재시도하는 응답 코드
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class OutboundMetrics:
+    """
+    외부 연동(integration)별 호출 수/오류 수/재시도 수/지연 시간/거부 수 집계 (프로세스 단위)
+    호출마다 config.http 로거에도 한 줄씩 남기므로 로그 수집기에서 워커 전체를 합산할 수 있습니다.
+    거부(rejected_*)는 서킷 열림/동시 호출 상한 초과로 외부 연동을 호출하지 않은 수입니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict = defaultdict(
+            lambda: {
+                "calls": 0,
+                "errors": 0,
+                "retries": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "rejected_circuit_open": 0,
+                "rejected_bulkhead_full": 0,
+            }
+        )
+
+    def record(self, integration: str, elapsed_ms: float, error: bool, retries: int):
+        with self._lock:
+            stats = self._stats[integration]
+            stats["calls"] += 1
+            stats["errors"] += int(error)
+            stats["retries"] += retries
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def record_rejection(self, integration: str, reason: str):
+        with self._lock:
+            self._stats[integration][f"rejected_{reason}"] += 1
+
+    def snapshot(self) -> dict:
+        states = breaker_states()
+        with self._lock:
+            return {
+                name: {
+                    **stats,
+                    "avg_ms": stats["total_ms"] / stats["calls"]
+                    if stats["calls"]
+                    else 0,
+                    "breaker": states.get(name, "closed"),
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+metrics = OutboundMetrics()
+
+
+def _load_config(integration: str) -> dict:
+    # "연동:호스트" 처럼 나눈 클라이언트는 앞쪽 연동 이름의 설정을 함께 사용
+    config = dict(settings.OUTBOUND_HTTP["default"])
+    config.update(settings.OUTBOUND_HTTP.get(integration.split(":", 1)[0], {}))
+    return config
+
+
+class _RetryPolicy:
+    """
+    HttpClient / AsyncHttpClient 공통: 재시도 간격 계산과 호출 결과 기록, 서킷 브레이커 (config.resilience)
+    """
+
+    def _configure(self, integration: str, config: dict) -> None:
+        self.integration = integration
+        self.timeout = config["timeout"]
+        self.retries = config["retries"]
+        self.backoff = config["backoff"]
+        self.backoff_max = config["backoff_max"]
+        self.breaker = get_breaker(integration, config)
+
+    def _max_attempts(self, method: str, idempotent: Optional[bool]) -> int:
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        return 1 + (self.retries if idempotent else 0)
+
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        # full jitter: 0 ~ min(최대, 기본 * 2^attempt) 사이 임의 시간
+        delay = random.uniform(0, min(self.backoff_max, self.backoff * 2**attempt))
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.backoff_max))
+        return delay
+
+    def _record(
+        self,
+        method: str,
+        started: float,
+        attempt: int,
+        response,
+        error: Optional[Exception],
+    ) -> bool:
+        # 반환값: 서킷 브레이커에 실패로 기록할지 (연결 오류/타임아웃/429·5xx)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        failed = error is not None or (
+            response is not None and response.status_code >= 500
+        )
+        metrics.record(self.integration, elapsed_ms, failed, attempt)
+        logger.info(
+            "outbound integration=%s method=%s status=%s elapsed_ms=%.0f retries=%s%s",
+            self.integration,
+            method,
+            response.status_code if response is not None else "-",
+            elapsed_ms,
+            attempt,
+            f" error={type(error).__name__}" if error is not None else "",
+        )
+        return failed or (response is not None and response.status_code == 429)
+
+    def _reject(self, method: str, error: DependencyUnavailable) -> None:
+        metrics.record_rejection(self.integration, error.reason)
+        logger.info(
+            "outbound integration=%s method=%s rejected=%s",
+            self.integration,
+            method,
+            error.reason,
+        )
+
+
+class HttpClient(_RetryPolicy):
+    """
+    외부 연동 하나(kakao, google, iamport, clova ...)를 위한 HTTP 클라이언트
+
+    · 연동별 requests.Session 하나를 프로세스 전체에서 공유 → 호스트별 커넥션 풀/keep-alive 재사용
+    · 모든 호출에 (연결, 읽기) 타임아웃 적용
+    · 멱등 호출만 연결 오류/타임아웃/429·5xx 에 대해 지터를 준 지수 백오프로 재시도
+    · 연동별 서킷 브레이커와 동시 호출 상한(max_concurrent)으로 장애 연동은 바로 실패 (DependencyUnavailable)
+    설정은 settings.OUTBOUND_HTTP["default"] 에 연동별 값을 덮어써서 사용합니다.
+    """
+
+    def __init__(self, integration: str):
+        config = _load_config(integration)
+        self._configure(integration, config)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config["pool_connections"],
+            pool_maxsize=config["pool_size"],
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.bulkhead = Bulkhead(
+            integration, config["max_concurrent"], config["bulkhead_wait"]
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: Optional[bool] = None,
+        timeout: Any = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        requests.Session.request 와 같은 인자를 받습니다. 응답 코드 검사(raise_for_status)는 호출하는 쪽에서 합니다.
+        """
+        method = method.upper()
+        max_attempts = self._max_attempts(method, idempotent)
+        timeout = timeout or self.timeout
+
+        try:
+            with self.bulkhead.acquire():
+                probe = self.breaker.before_call()
+                return self._send(method, url, max_attempts, timeout, probe, kwargs)
+        except DependencyUnavailable as e:
+            self._reject(method, e)
+            raise
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        max_attempts: int,
+        timeout: Any,
+        probe: bool,
+        kwargs: dict,
+    ) -> requests.Response:
+        started = time.monotonic()
+        attempt = 0
+        response = None
+        error: Optional[Exception] = None
+        try:
+            while True:
+                try:
+                    response = self.session.request(
+                        method, url, timeout=timeout, **kwargs
+                    )
+                    error = None
+                    if (
+                        response.status_code not in RETRY_STATUS_CODES
+                        or attempt + 1 >= max_attempts
+                    ):
+                        return response
+                    response.close()
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error, response = e, None
+                    if attempt + 1 >= max_attempts:
+                        raise
+                time.sleep(self._retry_delay(attempt, response))
+                attempt += 1
+        finally:
+            failed = self._record(method, started, attempt, response, error)
+            self.breaker.after_call(failed, probe)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+
+class AsyncHttpClient(_RetryPolicy):
+    """
+    HttpClient 의 비동기 버전 (httpx.AsyncClient)
+
+    ASGI 에서 외부 호출을 기다리는 동안 워커 스레드를 잡지 않으므로, 한 이벤트 루프에서
+    수백 개의 느린 호출(Clova 등)을 동시에 기다릴 수 있습니다. 타임아웃/재시도/지표 기록/서킷 브레이커는 HttpClient 와 같습니다.
+    동시 호출 수는 OUTBOUND_HTTP 의 async_max_connections 로 제한하고, 넘는 호출은 기다리지 않고 바로 실패합니다.
+    """
+
+    def __init__(self, integration: str):
+        config = _load_config(integration)
+        self._configure(integration, config)
+        self.client = httpx.AsyncClient(
+            timeout=self._httpx_timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=config["async_max_connections"],
+                max_keepalive_connections=config["pool_size"],
+            ),
+        )
+        self.bulkhead = AsyncBulkhead(
+            integration, config["async_max_connections"], config["bulkhead_wait"]
+        )
+
+    @staticmethod
+    def _httpx_timeout(timeout: Any) -> httpx.Timeout:
+        # requests 와 같은 (연결, 읽기) 튜플 또는 숫자 하나를 받음
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+            # 풀에서 연결을 기다리는 시간도 읽기 타임아웃으로 제한
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: Optional[bool] = None,
+        timeout: Any = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        httpx.AsyncClient.request 와 같은 인자를 받습니다. 응답 코드 검사(raise_for_status)는 호출하는 쪽에서 합니다.
+        """
+        method = method.upper()
+        max_attempts = self._max_attempts(method, idempotent)
+        timeout = self._httpx_timeout(timeout or self.timeout)
+
+        try:
+            async with self.bulkhead.acquire():
+                probe = await self.breaker.abefore_call()
+                return await self._send(
+                    method, url, max_attempts, timeout, probe, kwargs
+                )
+        except DependencyUnavailable as e:
+            self._reject(method, e)
+            raise
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        max_attempts: int,
+        timeout: httpx.Timeout,
+        probe: bool,
+        kwargs: dict,
+    ) -> httpx.Response:
+        started = time.monotonic()
+        attempt = 0
+        response = None
+        error: Optional[Exception] = None
+        try:
+            while True:
+                try:
+                    response = await self.client.request(
+                        method, url, timeout=timeout, **kwargs
+                    )
+                    error = None
+                    if (
+                        response.status_code not in RETRY_STATUS_CODES
+                        or attempt + 1 >= max_attempts
+                    ):
+                        return response
+                except (httpx.TransportError, httpx.TimeoutException) as e:
+                    error, response = e, None
+                    if attempt + 1 >= max_attempts:
+                        raise
+                await asyncio.sleep(self._retry_delay(attempt, response))
+                attempt += 1
+        finally:
+            failed = self._record(method, started, attempt, response, error)
+            await self.breaker.aafter_call(failed, probe)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+_clients: dict = {}
+_clients_lock = threading.Lock()
+# httpx.AsyncClient 는 만들어진 이벤트 루프에 묶이므로 루프별로 따로 보관 (루프가 사라지면 함께 정리)
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_client(integration: str) -> HttpClient:
+    # 연동별 클라이언트(세션)는 프로세스당 하나 (첫 사용 시 생성)
+    # 여러 호스트를 부르는 연동은 "연동:호스트" 로 나눠서 호스트마다 세션/서킷 브레이커를 따로 둠
+    client = _clients.get(integration)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(integration)
+            if client is None:
+                client = _clients[integration] = HttpClient(integration)
+    return client
+
+
+def get_async_client(integration: str) -> AsyncHttpClient:
+    # 현재 이벤트 루프에서 연동별 비동기 클라이언트는 하나 (ASGI 워커에서는 프로세스당 하나)
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(integration)
+    if client is None:
+        client = clients[integration] = AsyncHttpClient(integration)
+    return client
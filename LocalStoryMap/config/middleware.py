@@ -1,16 +1,33 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from sentry_sdk import capture_exception
 
 
 class LogAllErrorsMiddleware:
+    # ASGI 에서 async 뷰 앞에 동기 미들웨어가 있으면 요청마다 스레드를 잡으므로 양쪽 모두 지원
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         response = self.get_response(request)
+        self._capture(request, response)
+        return response
 
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        self._capture(request, response)
+        return response
+
+    @staticmethod
+    def _capture(request, response):
         if response.status_code in [400, 403, 404, 405]:
             capture_exception(
                 Exception(f"{response.status_code} Error on path: {request.path}")
             )
-
-        return response
@@ -5,6 +5,9 @@ from rest_framework.renderers import JSONRenderer
 class CamelCaseJSONRenderer(JSONRenderer):
     """
     DRF가 반환하는 JSON 응답의 key를 pyhumps.camelize() 로 snake_case → camelCase 로 변환합니다.
+
+    뷰에 camelize_exclude_fields 를 지정하면 해당 최상위 key 의 값(하위 dict 포함)은 변환하지 않습니다.
+    (presigned POST 의 폼 필드처럼 클라이언트가 그대로 돌려보내야 하는 key 용)
     """
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
@@ -14,4 +17,9 @@ class CamelCaseJSONRenderer(JSONRenderer):
 
         # pyhumps.camelize() 로 중첩된 딕셔너리/리스트 내부의 모든 키를 camelCase로 변환
         camelized = camelize(data)
+        view = (renderer_context or {}).get("view")
+        if isinstance(data, dict):
+            for key in getattr(view, "camelize_exclude_fields", ()):
+                if key in data:
+                    camelized[camelize(key)] = data[key]
         return super().render(camelized, accepted_media_type, renderer_context)
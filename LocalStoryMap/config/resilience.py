@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable
+
+import requests
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyUnavailable(requests.RequestException):
+    """
+    외부 연동을 호출하지 않고 바로 실패한 경우 (서킷 열림 / 동시 호출 상한 초과)
+    기존 호출부의 requests 예외 처리(except requests.RequestException)에 그대로 걸리도록 상속합니다.
+    """
+
+    reason = "unavailable"
+
+    def __init__(self, integration: str, retry_after: int = 0):
+        super().__init__(f"{integration} 연동을 일시적으로 사용할 수 없습니다. ({self.reason})")
+        self.integration = integration
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(DependencyUnavailable):
+    reason = "circuit_open"
+
+
+class BulkheadFullError(DependencyUnavailable):
+    reason = "bulkhead_full"
+
+
+def _cache_call(func: Callable, *args, **kwargs):
+    # 캐시(Redis) 장애 시에는 서킷이 닫힌 것으로 보고 호출을 허용 (장애가 외부 연동 전체로 번지지 않도록)
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.warning("서킷 브레이커 상태 접근 실패: %s", e)
+        return None
+
+
+class CircuitBreaker:
+    """
+    외부 연동별 서킷 브레이커 (상태는 기본 캐시(Redis)에 저장 → 모든 워커가 같은 상태를 봄)
+
+    · closed    : breaker_window 초 안에 실패(연결 오류/타임아웃/429·5xx)가 breaker_failures 번 쌓이면 open
+    · open      : breaker_reset 초 동안 호출하지 않고 바로 CircuitOpenError
+    · half_open : 워커 전체에서 시험 호출 하나만 보내고, 성공하면 closed, 실패하면 다시 open
+    공유 상태는 SYNC_INTERVAL 초마다 다시 읽으므로, 정상 상태의 호출은 캐시에 접근하지 않습니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # 공유 상태(open_until)를 다시 읽는 간격(초)
+    SYNC_INTERVAL = 1.0
+
+    def __init__(self, integration: str, config: dict):
+        self.integration = integration
+        self.failure_threshold = config["breaker_failures"]
+        self.window = config["breaker_window"]
+        self.reset_timeout = config["breaker_reset"]
+
+        self._open_until = 0.0  # 공유 상태의 로컬 사본 (time.time() 기준, 0 이면 closed)
+        self._synced_at = float("-inf")
+
+    def _key(self, name: str) -> str:
+        return f"outbound:breaker:{self.integration}:{name}"
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._synced_at < self.SYNC_INTERVAL
+
+    def _refresh(self) -> None:
+        if self._is_fresh():
+            return
+        self._open_until = float(_cache_call(cache.get, self._key("open_until")) or 0)
+        self._synced_at = time.monotonic()
+
+    @property
+    def state(self) -> str:
+        if not self._open_until:
+            return self.CLOSED
+        if time.time() < self._open_until:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def _retry_after(self) -> int:
+        return max(1, int(self._open_until - time.time()) + 1)
+
+    def before_call(self) -> bool:
+        """
+        호출해도 되면 half-open 시험 호출인지 여부를 반환하고, 아니면 CircuitOpenError
+        """
+        self._refresh()
+        state = self.state
+        if state == self.CLOSED:
+            return False
+        if state == self.OPEN:
+            raise CircuitOpenError(self.integration, self._retry_after())
+        # half-open: 시험 호출 하나만 (시험 호출이 응답 없이 끝나도 reset_timeout 뒤 다시 시도)
+        probe = _cache_call(
+            cache.add, self._key("probe"), 1, timeout=self.reset_timeout
+        )
+        if probe is False:
+            raise CircuitOpenError(self.integration, 1)
+        return True
+
+    def after_call(self, failed: bool, probe: bool) -> None:
+        if not failed:
+            # 열리기 전에 시작한 호출의 성공으로는 닫지 않음 (시험 호출 결과로만 닫음)
+            if probe:
+                self._close()
+            return
+        if probe:
+            # 시험 호출 실패 → 다시 open
+            self._open()
+            return
+
+        # 창(window) 안 실패 횟수: 첫 실패에 만든 키가 만료되면 0 부터 다시 셈
+        _cache_call(cache.add, self._key("failures"), 0, timeout=self.window)
+        failures = _cache_call(cache.incr, self._key("failures"))
+        if failures is not None and failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self._open_until = time.time() + self.reset_timeout
+        self._synced_at = time.monotonic()
+        _cache_call(
+            cache.set,
+            self._key("open_until"),
+            self._open_until,
+            # half-open 상태를 기억할 수 있도록 open 시간보다 길게 유지
+            timeout=self.reset_timeout + self.window,
+        )
+        _cache_call(cache.delete_many, [self._key("failures"), self._key("probe")])
+        logger.warning(
+            "서킷 열림: integration=%s reset_after=%ss",
+            self.integration,
+            self.reset_timeout,
+        )
+
+    def _close(self) -> None:
+        self._open_until = 0.0
+        self._synced_at = time.monotonic()
+        _cache_call(
+            cache.delete_many,
+            [self._key("open_until"), self._key("failures"), self._key("probe")],
+        )
+        logger.warning("서킷 닫힘: integration=%s", self.integration)
+
+    # ─── 비동기 버전: 캐시 접근이 필요할 때만 스레드에서 실행 (정상 상태에서는 이벤트 루프에서 바로 처리) ───
+
+    async def abefore_call(self) -> bool:
+        if self._is_fresh() and self.state != self.HALF_OPEN:
+            return self.before_call()
+        return await sync_to_async(self.before_call, thread_sensitive=False)()
+
+    async def aafter_call(self, failed: bool, probe: bool) -> None:
+        if failed or probe:
+            await sync_to_async(self.after_call, thread_sensitive=False)(failed, probe)
+
+
+class Bulkhead:
+    """
+    외부 연동별 동시 호출 상한 (프로세스 단위)
+    느린 연동 하나가 워커 스레드를 모두 잡지 않도록, 상한을 넘는 호출은 bulkhead_wait 초만 기다린 뒤 BulkheadFullError
+    """
+
+    def __init__(self, integration: str, limit: int, wait: float):
+        self.integration = integration
+        self.limit = limit
+        self.wait = wait
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    @contextmanager
+    def acquire(self):
+        if not self._semaphore.acquire(timeout=self.wait):
+            raise BulkheadFullError(self.integration, 1)
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+class AsyncBulkhead:
+    # Bulkhead 의 비동기 버전 (이벤트 루프 단위, AsyncHttpClient 마다 하나)
+
+    def __init__(self, integration: str, limit: int, wait: float):
+        self.integration = integration
+        self.limit = limit
+        self.wait = wait
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self._semaphore.locked():
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.wait)
+            except asyncio.TimeoutError:
+                raise BulkheadFullError(self.integration, 1)
+        else:
+            await self._semaphore.acquire()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+_breakers: dict = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(integration: str, config: dict) -> CircuitBreaker:
+    # 연동별 브레이커는 프로세스당 하나 (동기/비동기 클라이언트가 공유)
+    breaker = _breakers.get(integration)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(integration)
+            if breaker is None:
+                breaker = _breakers[integration] = CircuitBreaker(integration, config)
+    return breaker
+
+
+def breaker_states() -> dict:
+    # 지표용: 이 프로세스가 마지막으로 본 연동별 서킷 상태
+    return {name: breaker.state for name, breaker in list(_breakers.items())}
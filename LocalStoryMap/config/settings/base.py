@@ -27,7 +27,10 @@ AWS_ACCESS_KEY_ID = os.getenv("NCP_ACCESS_KEY")
 AWS_SECRET_ACCESS_KEY = os.getenv("NCP_SECRET_KEY")
 AWS_STORAGE_BUCKET_NAME = os.getenv("NCP_BUCKET_NAME")
 AWS_S3_REGION_NAME = "kr-standard"
-AWS_S3_ENDPOINT_URL = "https://kr.object.ncloudstorage.com"
+# 로컬 S3 대체(moto server 등)로 테스트할 때 AWS_S3_ENDPOINT_URL 로 덮어씀
+AWS_S3_ENDPOINT_URL = os.getenv(
+    "AWS_S3_ENDPOINT_URL", "https://kr.object.ncloudstorage.com"
+)
 AWS_S3_ADDRESSING_STYLE = "path"
 AWS_QUERYSTRING_AUTH = False
 AWS_DEFAULT_ACL = "public-read"
@@ -115,6 +118,7 @@ INSTALLED_APPS = [
     "apps.route_like",
     "apps.paymenthistory",
     "apps.story",
+    "apps.images",
 ]
 
 ASGI_APPLICATION = "config.asgi.application"
@@ -375,14 +379,38 @@ LOGGING = {
 SINGLE_PLAN_PRICE = int(os.getenv("SINGLE_PLAN_PRICE", "4000"))  # 기본 10,000원
 SINGLE_PLAN_DURATION = int(os.getenv("SINGLE_PLAN_DURATION", "30"))  # 기본 30일
 
-# 매일 자정(00:00)에 `expire_subscriptions` 명령을 호출,
-# 배포 서버에서 python manage.py crontab add 한 번 실행하시면 매일 자정에 expire_subscriptions 커맨드가 돌아갑니다
+# 만료 처리는 청크 단위(SUBSCRIPTION_EXPIRE_BATCH_SIZE)로 커밋하며, 실행이 겹치지 않도록 잠금을 잡습니다.
+SUBSCRIPTION_EXPIRE_BATCH_SIZE = 500
+SUBSCRIPTION_EXPIRE_LOCK_TIMEOUT = 240  # 초 (크론 간격보다 짧게)
+# 사용자별 구독 권한 캐시 최대 보관 시간(초). 구독 중이면 만료 시각에 맞춰 더 일찍 끝나고,
+# 구매/취소/만료 처리 시에는 바로 무효화됩니다 (apps.subscribes.services.entitlement.EntitlementService)
+ENTITLEMENT_CACHE_TTL = 60 * 60
+
+# 5분마다 `expire_subscriptions` 명령을 호출 (구독 권한이 최대 5분 안에 만료에 반영됨),
+# 배포 서버에서 python manage.py crontab add 한 번 실행하시면 크론 작업이 등록됩니다
 CRONJOBS = [
-    ("0 0 * * *", "django.core.management.call_command", ["expire_subscriptions"]),
+    ("*/5 * * * *", "django.core.management.call_command", ["expire_subscriptions"]),
+    ("* * * * *", "django.core.management.call_command", ["process_payment_webhooks"]),
+    ("0 3 * * *", "django.core.management.call_command", ["summarize_markers"]),
+    ("0 4 * * *", "django.core.management.call_command", ["gc_image_blobs"]),
+    ("30 4 * * 0", "django.core.management.call_command", ["gc_orphaned_media"]),
 ]
 # PORTONE 키
 IMP_KEY = os.getenv("IMP_KEY")
 IMP_SECRET = os.getenv("IMP_SECRET")
+IMP_API_BASE_URL = os.getenv("IMP_API_BASE_URL", "https://api.iamport.kr")
+# 액세스 토큰은 Redis 에 만료 시각과 함께 공유 (apps.subscribes.services.payment.ImpClient)
+# 만료 IMP_TOKEN_REFRESH_MARGIN 초 전부터 한 요청만 미리 재발급, 나머지는 기존 토큰을 계속 사용
+IMP_TOKEN_REFRESH_MARGIN = 120
+IMP_TOKEN_LOCK_TIMEOUT = 10  # 재발급 중 잠금 유지 시간(초)
+# 결제 웹훅 처리 (apps.subscribes.services.webhook.PaymentWebhookService)
+PAYMENT_WEBHOOK_MAX_ATTEMPTS = 5
+# 처리 중(processing) 상태로 이 시간(초)이 지나면 워커가 중단된 것으로 보고 다시 처리
+PAYMENT_WEBHOOK_PROCESSING_TIMEOUT = 300
+# 실패한 이벤트의 재시도 간격(초): BASE * 2^(연속 실패 횟수), 최대 MAX
+# 아임포트 장애(PaymentGatewayError)는 시도 횟수(MAX_ATTEMPTS)로 세지 않고 이 간격으로만 미룸
+PAYMENT_WEBHOOK_RETRY_BACKOFF = 60
+PAYMENT_WEBHOOK_RETRY_BACKOFF_MAX = 3600
 
 # Clova Studio 환경변수
 CLOVA_API_KEY = os.getenv("CLOVA_API_KEY", "")  # 반드시 값 있어야 함
@@ -414,3 +442,94 @@ SWAGGER_SETTINGS = {
     # Swagger UI가 기본으로 호출할 API 경로 접두사
     "DEFAULT_API_URL": "/api",
 }
+
+# ─── 마커 트렌딩 점수 설정 ─────────────────────────────────────
+# 이벤트 가중치는 반감기(시간)마다 절반으로 줄어듭니다 (sort=trending)
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "48"))
+TRENDING_EVENT_WEIGHTS = {
+    "marker_like": 3.0,
+    "story_like": 2.0,
+    "story_view": 0.5,
+}
+
+# ─── 마커 상세 캐시 설정 ───────────────────────────────────────
+# soft TTL(초). 저장/삭제/좋아요 수 변경 시에는 시그널로 즉시 무효화됩니다
+MARKER_DETAIL_CACHE_TTL = int(os.getenv("MARKER_DETAIL_CACHE_TTL", "300"))
+
+# ─── 백그라운드 작업 설정 ──────────────────────────────────────
+# 프로세스 내 스레드 풀 크기 (이미지 변형 생성 등 요청과 분리할 작업용)
+BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "4"))
+# True 면 백그라운드 작업을 즉시 동기 실행 (테스트용)
+BACKGROUND_TASKS_EAGER = os.getenv("BACKGROUND_TASKS_EAGER", "False").lower() == "true"
+
+# ─── AI 요약 캐시 설정 (apps.ai_service.cache) ─────────────────────
+AI_SUMMARY_CACHE_TTL = 60 * 60 * 24 * 7  # Redis 보관 기간(초), DB 에는 계속 보관
+# 같은 텍스트를 요약 중인 요청을 기다리는 최대 시간(초) — Clova 읽기 타임아웃보다 길게
+AI_SUMMARY_LOCK_TIMEOUT = 40
+# summarize_markers 일괄 요약: 동시 호출 수, 분당 호출 한도(Clova 할당량), 1,000 토큰당 단가(원)
+CLOVA_BATCH_CONCURRENCY = int(os.getenv("CLOVA_BATCH_CONCURRENCY", "4"))
+CLOVA_BATCH_RATE_PER_MINUTE = float(os.getenv("CLOVA_BATCH_RATE_PER_MINUTE", "60"))
+CLOVA_PRICE_PER_1K_TOKENS = {"input": 5.0, "output": 5.0}
+# 챗봇 세션: 이전 대화 요약 + 최근 대화에 쓰는 토큰 예산, 누적 요약문의 최대 토큰
+AI_CHAT_CONTEXT_TOKENS = 1500
+AI_CHAT_SUMMARY_MAX_TOKENS = 300
+
+# ─── 외부 연동 HTTP 클라이언트 설정 (config.http) ─────────────────
+# timeout: (연결, 읽기) 초 / retries: 멱등 호출 재시도 횟수 / backoff: 지터 백오프 기본·최대 초
+OUTBOUND_HTTP: dict[str, dict] = {
+    "default": {
+        "timeout": (3.05, 10),
+        "retries": 2,
+        "backoff": 0.2,
+        "backoff_max": 2.0,
+        "pool_connections": 4,
+        "pool_size": 20,
+        # 비동기 클라이언트(AsyncHttpClient)의 호스트 전체 동시 연결 상한
+        "async_max_connections": 100,
+        # 서킷 브레이커 (config.resilience): breaker_window 초 안에 breaker_failures 번 실패하면
+        # breaker_reset 초 동안 호출하지 않고 바로 실패 (상태는 Redis 에 저장해 워커 전체가 공유)
+        "breaker_failures": 5,
+        "breaker_window": 30,
+        "breaker_reset": 30,
+        # 벌크헤드: 프로세스당 동기 동시 호출 상한, 상한일 때 자리를 기다리는 시간(초)
+        "max_concurrent": 20,
+        "bulkhead_wait": 0.1,
+    },
+    "kakao": {"timeout": (3.05, 5)},
+    "google": {"timeout": (3.05, 5)},
+    "iamport": {"timeout": (3.05, 5), "max_concurrent": 10},
+    # 생성형 응답은 오래 걸리고, 재시도하면 토큰 비용이 두 번 들므로 POST 는 재시도하지 않음
+    # 느려지면 워커 스레드를 오래 잡으므로 동기 동시 호출은 적게 허용
+    "clova": {
+        "timeout": (3.05, 30),
+        "async_max_connections": 500,
+        "max_concurrent": 8,
+    },
+}
+
+# ─── 소셜 로그인 프로필 이미지 수집 설정 ─────────────────────────
+PROFILE_IMAGE_SIZE = 256  # 정사각형 아바타 한 변(px)
+PROFILE_IMAGE_MAX_BYTES = 5 * 1024 * 1024
+PROFILE_IMAGE_FETCH_TIMEOUT = (3, 10)  # (연결, 읽기) 초
+# 같은 사용자의 중복 수집을 막는 잠금 유지 시간(초)
+PROFILE_IMAGE_FETCH_LOCK_SECONDS = 60
+# 수집이 끝나기 전 로그인 응답에 쓸 이미지 URL (비우면 소셜 서비스 원본 URL 사용)
+PROFILE_IMAGE_PLACEHOLDER_URL = os.getenv("PROFILE_IMAGE_PLACEHOLDER_URL", "")
+
+# ─── 이미지 변형(썸네일) 설정 ───────────────────────────────────
+IMAGE_VARIANT_SIZES = {"thumb": 200, "card": 640, "full": 1600}  # 긴 변 기준(px)
+IMAGE_VARIANT_FORMATS = ["webp", "jpeg"]  # 첫 번째 포맷이 display_image 에 사용됨
+IMAGE_VARIANT_QUALITY = 80
+# 내용 해시 기반 이미지 저장 (apps.images.fields.ContentAddressedImageField)
+IMAGE_BLOB_PREFIX = "blobs"
+# 참조가 사라진 blob 을 gc_image_blobs 가 삭제하기까지의 유예 시간
+IMAGE_BLOB_GC_GRACE_HOURS = int(os.getenv("IMAGE_BLOB_GC_GRACE_HOURS", "24"))
+# 업로드 직후(행 저장/직접 업로드 확인 전) 객체를 고아로 보지 않도록 gc_orphaned_media 가 두는 유예 시간
+MEDIA_GC_GRACE_HOURS = int(os.getenv("MEDIA_GC_GRACE_HOURS", "24"))
+# 스토리 이미지 직접 업로드(presigned) 유효 시간(초)과 최대 크기
+STORY_IMAGE_UPLOAD_EXPIRES = int(os.getenv("STORY_IMAGE_UPLOAD_EXPIRES", "300"))
+STORY_IMAGE_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+# True 면 S3 대신 로컬 파일시스템 사용 (테스트용)
+MEDIA_USE_LOCAL_STORAGE = (
+    os.getenv("MEDIA_USE_LOCAL_STORAGE", "False").lower() == "true"
+)
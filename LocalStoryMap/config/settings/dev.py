@@ -19,3 +19,10 @@ REST_FRAMEWORK.update(
 )
 
 CORS_ALLOW_ALL_ORIGINS = True
+
+# 로컬 개발 시 운영 Redis(VPC 내부)에 접속할 수 없으므로 로컬 메모리 캐시 사용
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
@@ -0,0 +1,32 @@
+from asgiref.sync import sync_to_async
+
+_SENTINEL = object()
+
+
+def _next_or_sentinel(iterator):
+    # next(iterator, default) 를 sync_to_async 로 감싸면 인자 타입을 추론하지 못하므로 한 번 감쌈
+    return next(iterator, _SENTINEL)
+
+
+class EchoBuffer:
+    # csv.writer 가 쓴 한 줄을 그대로 돌려주는 의사 버퍼 (스트리밍 CSV 용)
+    def write(self, value):
+        return value
+
+
+async def iterate_in_thread(iterable, thread_sensitive: bool = True):
+    """
+    동기 제너레이터를 ASGI 에서 한 청크씩 소비할 수 있는 비동기 이터레이터로 감쌉니다.
+
+    StreamingHttpResponse 에 동기 이터레이터를 그대로 넘기면 ASGI 핸들러가
+    전체를 list() 로 모은 뒤 전송하므로, 서버사이드 커서를 쓰더라도 메모리가 일정하게 유지되지 않습니다.
+    DB 커서는 스레드에 묶여 있으므로 기본값(thread_sensitive=True)은 항상 같은 스레드에서 next() 를 호출합니다.
+    DB 를 쓰지 않는 오래 걸리는 스트림(외부 API 등)은 thread_sensitive=False 로 공용 스레드를 점유하지 않게 합니다.
+    """
+    iterator = iter(iterable)
+    get_next = sync_to_async(_next_or_sentinel, thread_sensitive=thread_sensitive)
+    while True:
+        chunk = await get_next(iterator)
+        if chunk is _SENTINEL:
+            break
+        yield chunk
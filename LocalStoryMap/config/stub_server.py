@@ -0,0 +1,81 @@
+import json
+import socket
+import sys
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Optional
+
+
+class JsonStubHandler(BaseHTTPRequestHandler):
+    """
+    로컬 테스트용 가짜 외부 API 의 공통 핸들러 (JSON 요청/응답, keep-alive)
+    외부 연동을 흉내 내는 관리 명령(check_outbound_http, load_test_clova ...)이 상속해서 사용합니다.
+    """
+
+    # 커넥션 풀/keep-alive 재사용을 확인할 수 있도록 HTTP/1.1 로 응답
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body) if body else {}
+
+    def send_json(self, code: int, body: dict, headers: Optional[dict] = None):
+        data = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StubServer(ThreadingHTTPServer):
+    # 요청마다 스레드 하나, 받은 연결 수를 세어 keep-alive 재사용 여부를 확인
+    daemon_threads = True
+    # 부하 테스트에서 연결이 한꺼번에 몰려도 접속 대기열이 넘치지 않도록 (기본값 5)
+    request_queue_size = 1024
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def handle_error(self, request, client_address):
+        # 타임아웃 시나리오에서 클라이언트가 먼저 끊은 연결은 정상 동작이므로 조용히 넘김
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+
+def unused_port() -> int:
+    # 연결 오류 시나리오용: 잠깐 바인딩했다가 닫은(아무도 듣지 않는) 포트
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_stub_server(handler_class, port: int = 0) -> Iterator[StubServer]:
+    """
+    127.0.0.1 에서 스텁 서버를 백그라운드 스레드로 띄우고 블록이 끝나면 내립니다.
+    port=0 이면 빈 포트를 사용하며, 주소는 server.url 로 확인합니다.
+    """
+    server = StubServer(("127.0.0.1", port), handler_class)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
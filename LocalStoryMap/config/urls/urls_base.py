@@ -7,13 +7,31 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 from rest_framework.authtoken.views import obtain_auth_token
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
 from rest_framework.routers import DefaultRouter
 
+from apps.ai_service.utils.clova_client import ClovaClient
+from config.http import metrics
+
 # 헬스체크용 뷰
 
 
 def health(request):
-    return JsonResponse({"status": "ok"})
+    # Clova 설정 상태는 참고용 (AI 기능만 실패하므로 헬스체크 자체는 항상 ok)
+    return JsonResponse(
+        {
+            "status": "ok",
+            "clova": "unconfigured" if ClovaClient.config_error() else "ok",
+        }
+    )
+
+
+# 외부 연동 지표 (관리자용): 연동별 호출/오류/거부 수, 지연 시간, 서킷 상태 (이 워커 프로세스 기준)
+@api_view(["GET"])
+@permission_classes([permissions.IsAdminUser])
+def outbound_metrics(request):
+    return Response(metrics.snapshot())
 
 
 # API 라우터 설정
@@ -43,6 +61,7 @@ schema_view = get_schema_view(
 urlpatterns = [
     # 건강 상태 확인───────────────────────────────────────────────────
     path("health/", health),
+    path("health/outbound/", outbound_metrics),
     # ── Admin ─────────────────────────────────────────────────────
     path("admin/", admin.site.urls),
     # ── Versioned API Endpoints ───────────────────────────────────